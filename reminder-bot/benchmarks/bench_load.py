@@ -0,0 +1,405 @@
+"""Synthetic-load benchmark for ReminderService.
+
+Generates N reminders (one-shot plus every recurrence pattern the parser
+supports) in a temporary data directory and drives ``ReminderService``
+against a fake bot that records what it sends. Reports, per size:
+
+- startup: time to load the schedule from storage, plus memory held by
+  the store and scheduler (tracemalloc)
+- scheduler tick cost: an idle wake-up, and time spent per due reminder
+- storage mutation latency: add / update time / remove percentiles
+- delivery lag: time from a reminder's due time to its (fake) send
+
+Runs offline. Usage:
+
+    python benchmarks/bench_load.py [--sizes 1000 10000 100000]
+                                    [--storage json journal sqlite]
+
+``tests/test_bench_load.py`` runs a small configuration under pytest.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import discord  # noqa: E402
+import pytz  # noqa: E402
+
+from services.delivery import DeliveryPool  # noqa: E402
+from services.reminder_service import ReminderService  # noqa: E402
+
+UTC = pytz.UTC
+
+# Stored ``recurring`` strings, as produced by the remind command
+RECURRENCE_PATTERNS = [
+    None,  # one-shot
+    "daily at 09:00am",
+    "weekly at 09:00am",
+    "monthly at 09:00am",
+    "weekly on monday,wednesday,friday at 09:00am",
+    "monthly on 15th at 09:00am",
+    "monthly on second tuesday at 09:00am",
+    "monthly on last friday at 09:00am",
+]
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+STORAGE_BACKENDS = ["json", "journal", "sqlite"]
+
+
+class FakeMessenger:
+    """Records sends as (wall time, [reminder ids])."""
+
+    def __init__(self, sink: List):
+        self._sink = sink
+
+    async def send(self, content: Optional[str] = None, embeds=None, **kwargs):
+        ids = [
+            embed.footer.text.rsplit(" ", 1)[-1]
+            for embed in embeds or ()
+            if embed.footer and embed.footer.text
+        ]
+        self._sink.append((time.time(), ids))
+        return object()
+
+
+class FakeUser(FakeMessenger):
+    def __init__(self, user_id: int, sink: List):
+        super().__init__(sink)
+        self.id = user_id
+        self.mention = f"<@{user_id}>"
+        self.dm_channel = None
+
+    async def create_dm(self):
+        self.dm_channel = self
+        return self
+
+
+class FakeChannel(discord.TextChannel):
+    """A ``discord.TextChannel`` (for isinstance checks) that records sends."""
+
+    def __init__(self, channel_id: int, sink: List):
+        self.id = channel_id
+        self._messenger = FakeMessenger(sink)
+
+    async def send(self, content: Optional[str] = None, embeds=None, **kwargs):
+        return await self._messenger.send(content, embeds=embeds, **kwargs)
+
+
+class FakeBot:
+    """Just enough of ``commands.Bot`` for ReminderService."""
+
+    def __init__(self, channel_ids: List[int]):
+        self.sent: List = []
+        self._users: Dict[int, FakeUser] = {}
+        self._channels = {cid: FakeChannel(cid, self.sent) for cid in channel_ids}
+
+    def get_user(self, user_id: int) -> FakeUser:
+        user = self._users.get(user_id)
+        if user is None:
+            user = self._users[user_id] = FakeUser(user_id, self.sent)
+        return user
+
+    async def fetch_user(self, user_id: int) -> FakeUser:
+        return self.get_user(user_id)
+
+    def get_channel(self, channel_id: int):
+        return self._channels.get(channel_id)
+
+    async def fetch_channel(self, channel_id: int):
+        return self._channels.get(channel_id)
+
+
+def generate_reminders(
+    count: int, channel_ids: List[int], seed: int = 0
+) -> Dict[str, Dict]:
+    """Build ``count`` reminders due between 1 and 60 days from now."""
+    rng = random.Random(seed)
+    now = datetime.now(UTC)
+    users = max(1, count // 5)
+    created_at = datetime.utcnow().isoformat()
+    reminders = {}
+    for i in range(count):
+        reminder_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        remind_at = now + timedelta(seconds=rng.randint(86400, 60 * 86400))
+        reminders[reminder_id] = {
+            "id": reminder_id,
+            "user_id": 100000 + rng.randrange(users),
+            "message": f"Synthetic reminder {i}",
+            "remind_at": remind_at.isoformat(),
+            "channel_id": rng.choice(channel_ids) if i % 2 else None,
+            "recurring": RECURRENCE_PATTERNS[i % len(RECURRENCE_PATTERNS)],
+            "notes": None,
+            "created_at": created_at,
+        }
+    return reminders
+
+
+def _open_store(storage: str, data_dir: str):
+    previous = os.environ.get("REMINDER_STORAGE")
+    os.environ["REMINDER_STORAGE"] = storage
+    try:
+        from utils.data_manager import create_data_manager
+
+        return create_data_manager(data_dir)
+    finally:
+        if previous is None:
+            del os.environ["REMINDER_STORAGE"]
+        else:
+            os.environ["REMINDER_STORAGE"] = previous
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {"p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "max": ordered[-1]}
+
+
+def _time_call(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def _measure_mutations(data, reminders: List[Dict], samples: int) -> Dict[str, Dict]:
+    """Latency of add / update_reminder_time / remove against the loaded store."""
+    future = (datetime.now(UTC) + timedelta(days=90)).isoformat()
+    added: List[str] = []
+    add, update, remove = [], [], []
+
+    for i in range(samples):
+        start = time.perf_counter()
+        added.append(data.add_reminder(1, f"bench {i}", future))
+        add.append(time.perf_counter() - start)
+    for reminder in reminders[:samples]:
+        update.append(_time_call(data.update_reminder_time, reminder["id"], future))
+    for reminder_id in added:
+        remove.append(_time_call(data.remove_reminder, reminder_id, 1))
+
+    return {
+        "add": _percentiles(add),
+        "update_time": _percentiles(update),
+        "remove": _percentiles(remove),
+    }
+
+
+async def _measure_delivery(
+    service: ReminderService,
+    data,
+    bot: FakeBot,
+    due: List[Dict],
+    window: float,
+    timeout: float,
+) -> Dict[str, Any]:
+    """Make ``due`` fire over ``window`` seconds and measure send lag."""
+    tick_durations: List[float] = []
+    tick_sizes: List[int] = []
+    process_due = service._process_due
+
+    async def timed_process_due(reminder_ids):
+        start = time.perf_counter()
+        await process_due(reminder_ids)
+        tick_durations.append(time.perf_counter() - start)
+        tick_sizes.append(len(reminder_ids))
+
+    service._process_due = timed_process_due
+
+    # Leave time for start() to reload the schedule before the first is due
+    started = time.perf_counter()
+    await service._load_schedule()
+    lead = 0.2 + 2 * (time.perf_counter() - started)
+    base = time.time() + lead
+    due_at: Dict[str, float] = {}
+    for i, reminder in enumerate(due):
+        ts = base + window * i / max(1, len(due))
+        reminder["remind_at"] = datetime.fromtimestamp(ts, UTC).isoformat()
+        due_at[reminder["id"]] = ts
+    data.update_reminders(due)
+
+    bot.sent.clear()
+    service.start()
+    deadline = base + window + timeout
+    delivered: Dict[str, float] = {}
+    while time.time() < deadline and len(delivered) < len(due_at):
+        await asyncio.sleep(0.05)
+        for sent_at, ids in bot.sent:
+            for reminder_id in ids:
+                if reminder_id in due_at:
+                    delivered.setdefault(reminder_id, sent_at)
+    await service.stop()
+
+    lags = [delivered[rid] - due_at[rid] for rid in delivered]
+    processed = sum(tick_sizes)
+    return {
+        "due": len(due_at),
+        "delivered": len(delivered),
+        "messages": len(bot.sent),
+        "lag": _percentiles(lags),
+        "ticks": len(tick_durations),
+        "tick_per_reminder": sum(tick_durations) / processed if processed else 0.0,
+    }
+
+
+def _measure_idle_tick(service: ReminderService, iterations: int = 10000) -> float:
+    """Cost of the check the loop makes on every wake-up when nothing is due."""
+    queue = service._queue
+    start = time.perf_counter()
+    for _ in range(iterations):
+        delay = queue.seconds_until_next(time.time())
+        if delay is not None and delay <= 0:
+            queue.pop_due(time.time())
+    return (time.perf_counter() - start) / iterations
+
+
+def run_benchmark(
+    size: int,
+    storage: str = "json",
+    due: int = 500,
+    window: float = 2.0,
+    mutation_samples: int = 50,
+    timeout: float = 30.0,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Run every measurement for one store size and backend.
+
+    Args:
+        size: Number of synthetic reminders.
+        storage: ``json``, ``journal`` or ``sqlite`` (see ``create_data_manager``).
+        due: How many of them are made due during the delivery phase.
+        window: Seconds over which the due reminders are spread.
+        mutation_samples: Operations timed per mutation kind.
+        timeout: Extra seconds to wait for deliveries after the window.
+        seed: Seed for the synthetic data.
+
+    Returns:
+        Nested dict of results (seconds and bytes).
+    """
+    channel_ids = list(range(900000, 900050))
+    reminders = generate_reminders(size, channel_ids, seed=seed)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        with open(Path(data_dir) / "reminders.json", "w") as f:
+            json.dump(reminders, f)
+
+        async def run() -> Dict[str, Any]:
+            bot = FakeBot(channel_ids)
+
+            gc.collect()
+            tracemalloc.start()
+            started = time.perf_counter()
+            data = _open_store(storage, data_dir)
+            # Synthetic sends are never throttled; measure the bot, not Discord
+            delivery = DeliveryPool(
+                route_capacity=100000,
+                route_period=1.0,
+                global_capacity=100000,
+                global_period=1.0,
+            )
+            service = ReminderService(bot, data, delivery=delivery)
+            await service._load_schedule()
+            startup = time.perf_counter() - started
+            memory, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            try:
+                idle_tick = _measure_idle_tick(service)
+                sample = list(reminders.values())
+                mutations = _measure_mutations(
+                    data, sample[due:], min(mutation_samples, max(0, size - due))
+                )
+                delivery = await _measure_delivery(
+                    service, data, bot, sample[:due], window, timeout
+                )
+            finally:
+                await service.data.close()
+
+            return {
+                "size": size,
+                "storage": storage,
+                "startup": startup,
+                "memory": memory,
+                "memory_peak": peak,
+                "idle_tick": idle_tick,
+                "mutations": mutations,
+                "delivery": delivery,
+            }
+
+        return asyncio.run(run())
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    """Human-readable report for one ``run_benchmark`` result."""
+    ms = 1000.0
+    delivery = result["delivery"]
+    lines = [
+        f"== {result['size']:,} reminders, {result['storage']} storage ==",
+        f"  startup (load schedule): {result['startup'] * ms:10.1f} ms",
+        f"  memory (store + queue):  {result['memory'] / 2**20:10.1f} MiB "
+        f"(peak {result['memory_peak'] / 2**20:.1f} MiB)",
+        f"  idle tick:               {result['idle_tick'] * 1e6:10.2f} us",
+        f"  due tick per reminder:   {delivery['tick_per_reminder'] * ms:10.3f} ms "
+        f"({delivery['ticks']} ticks)",
+    ]
+    for op, stats in result["mutations"].items():
+        lines.append(
+            f"  {op + ' latency:':<25}{stats['p50'] * ms:10.3f} ms p50, "
+            f"{stats['p95'] * ms:.3f} p95, {stats['p99'] * ms:.3f} p99"
+        )
+    lag = delivery["lag"]
+    lines.append(
+        f"  delivery lag:            {lag['p50'] * ms:10.1f} ms p50, "
+        f"{lag['p95'] * ms:.1f} p95, {lag['p99'] * ms:.1f} p99, {lag['max'] * ms:.1f} max"
+    )
+    lines.append(
+        f"  delivered:               {delivery['delivered']:>10,} / {delivery['due']:,} "
+        f"in {delivery['messages']:,} message(s)"
+    )
+    return "\n".join(lines)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    arg_parser.add_argument(
+        "--storage",
+        nargs="+",
+        choices=STORAGE_BACKENDS,
+        default=[os.getenv("REMINDER_STORAGE", "json").lower()],
+    )
+    arg_parser.add_argument("--due", type=int, default=500)
+    arg_parser.add_argument("--window", type=float, default=2.0)
+    arg_parser.add_argument("--mutations", type=int, default=50)
+    args = arg_parser.parse_args()
+
+    for storage in args.storage:
+        for size in args.sizes:
+            result = run_benchmark(
+                size,
+                storage=storage,
+                due=min(args.due, size),
+                window=args.window,
+                mutation_samples=args.mutations,
+            )
+            print(format_result(result))
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Micro-benchmark: time_parser.parse_time vs. plain dateutil parsing.
+
+Usage:
+    python benchmarks/bench_time_parser.py [iterations]
+"""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dateutil import parser  # noqa: E402
+
+from utils.time_parser import LOCAL_TZ, parse_time  # noqa: E402
+
+INPUTS = ["30m", "2h", "1d", "1h30m", "9am", "9:30pm", "21:00", "noon", "tomorrow 9am"]
+DATEUTIL_INPUTS = ["9am", "9:30pm", "21:00", "noon", "2024-06-01 14:30"]
+
+
+def _ops_per_sec(func, inputs, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for text in inputs:
+            func(text)
+    elapsed = time.perf_counter() - start
+    return iterations * len(inputs) / elapsed
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    now = datetime.now(LOCAL_TZ)
+    default = now.replace(tzinfo=None)
+
+    def dateutil_only(text):
+        try:
+            return parser.parse(text, default=default)
+        except (ValueError, OverflowError):
+            return None
+
+    fast = _ops_per_sec(lambda t: parse_time(t, now), INPUTS, iterations)
+    slow = _ops_per_sec(dateutil_only, DATEUTIL_INPUTS, max(1, iterations // 10))
+    print(f"parse_time (fast path):  {fast:12,.0f} ops/sec")
+    print(f"dateutil parser.parse:   {slow:12,.0f} ops/sec")
+    print(f"speedup:                 {fast / slow:12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,8 +9,13 @@ from typing import cast
 
 from discord.ext import commands
 from dotenv import load_dotenv
+from services.delivery import DeliveryPool
+from services.metrics import Metrics, MetricsServer
 from services.reminder_service import ReminderService
-from utils.data_manager import DataManager
+from services.sharding import ShardLeaseManager
+from utils.async_store import AsyncDataManager
+from utils.data_manager import create_data_manager
+from utils.delivery_journal import DeliveryJournal
 
 import discord
 
@@ -42,6 +47,12 @@ if not DISCORD_TOKEN:
 # Use cast to help Pyright understand the type after None check
 DISCORD_TOKEN = cast(str, DISCORD_TOKEN)
 
+# Prometheus metrics endpoint (localhost only); disabled when unset
+METRICS_PORT_STR = os.getenv("METRICS_PORT")
+
+# Shard count for multi-process scheduling (see worker.py); unset = single process
+REMINDER_SHARDS_STR = os.getenv("REMINDER_SHARDS")
+
 # Convert CLIENT_ID to int if provided, otherwise None
 CLIENT_ID: int | None = None
 if CLIENT_ID_STR:
@@ -75,6 +86,29 @@ class ReminderBot(commands.Bot):
         data_dir = Path("data")
         data_dir.mkdir(exist_ok=True)
 
+        # One shared store for the service and every cog; all calls go
+        # through a storage thread so disk I/O never blocks the gateway
+        store = await asyncio.to_thread(create_data_manager, str(data_dir))
+        self.data = AsyncDataManager(store)
+        # Deliveries in flight, so a crash neither drops nor repeats one
+        self.delivery_journal = await asyncio.to_thread(
+            DeliveryJournal, data_dir / "deliveries.journal"
+        )
+
+        self.metrics = Metrics()
+        if METRICS_PORT_STR:
+            try:
+                self.metrics_server = MetricsServer(
+                    self.metrics, port=int(METRICS_PORT_STR)
+                )
+                await self.metrics_server.start()
+            except (ValueError, OSError) as e:
+                logger.error(f"Metrics endpoint disabled: {e}")
+
+        # One outbound queue for reminder deliveries and command replies, so
+        # reminder bursts are rate limited together with (and behind) replies
+        self.delivery = DeliveryPool(metrics=self.metrics)
+
         # Load all command cogs
         cogs_dir = Path("commands")
         for file in cogs_dir.glob("*.py"):
@@ -94,9 +128,24 @@ class ReminderBot(commands.Bot):
         """Called when the bot is ready."""
         logger.info(f"Bot connected: {self.user} ({len(self.guilds)} guild(s))")
 
+        # on_ready fires again after reconnects; keep a single scheduler
+        if hasattr(self, "reminder_service"):
+            return
+
         # Initialize services
-        data = DataManager()
-        self.reminder_service = ReminderService(self, data)
+        shards = None
+        if REMINDER_SHARDS_STR:
+            shards = ShardLeaseManager(
+                self.data.store, shard_count=int(REMINDER_SHARDS_STR)
+            )
+        self.reminder_service = ReminderService(
+            self,
+            self.data,
+            delivery=self.delivery,
+            metrics=self.metrics,
+            shards=shards,
+            journal=self.delivery_journal,
+        )
 
         # Start reminder checker
         self.reminder_service.start()
@@ -106,9 +155,19 @@ class ReminderBot(commands.Bot):
         """Clean up resources when bot is closing."""
         try:
             if hasattr(self, "reminder_service"):
-                self.reminder_service.stop()
+                await self.reminder_service.stop()
         except Exception as e:
             logger.error(f"Error stopping reminder service: {e}")
+        try:
+            if hasattr(self, "metrics_server"):
+                await self.metrics_server.stop()
+        except Exception as e:
+            logger.error(f"Error stopping metrics endpoint: {e}")
+        try:
+            if hasattr(self, "data"):
+                await self.data.close()
+        except Exception as e:
+            logger.error(f"Error closing data store: {e}")
         finally:
             await super().close()
 
@@ -1,6 +1,8 @@
 """Cancel reminder command."""
 
 from discord.ext import commands
+from services.delivery import DeliveryPool
+from utils.async_store import AsyncDataManager
 from utils.data_manager import DataManager
 from utils.embeds import create_error_embed, create_success_embed
 import discord
@@ -13,13 +15,14 @@ class CancelCommand(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.data = DataManager()
+        self.data = getattr(bot, "data", None) or AsyncDataManager(DataManager())
+        self.delivery = getattr(bot, "delivery", None) or DeliveryPool()
 
     async def reminder_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> List[app_commands.Choice[str]]:
         """Autocomplete handler for reminder selection."""
-        reminders = self.data.get_user_reminders(interaction.user.id)
+        reminders = await self.data.get_user_reminders(interaction.user.id)
 
         if not reminders:
             return []
@@ -45,18 +48,21 @@ class CancelCommand(commands.Cog):
     @app_commands.autocomplete(reminder=reminder_autocomplete)
     async def cancel(self, interaction: discord.Interaction, reminder: str):
         """Cancel a reminder."""
-        await interaction.response.defer()
+        await self.delivery.defer(interaction)
 
-        success = self.data.remove_reminder(reminder, interaction.user.id)
+        success = await self.data.remove_reminder(reminder, interaction.user.id)
 
         if success:
+            reminder_service = getattr(self.bot, "reminder_service", None)
+            if reminder_service:
+                reminder_service.unschedule(reminder)
             embed = create_success_embed(f"Reminder cancelled successfully")
-            await interaction.followup.send(embed=embed)
+            await self.delivery.respond(interaction, embed=embed)
         else:
             embed = create_error_embed(
                 f"Reminder not found or you don't have permission to cancel it"
             )
-            await interaction.followup.send(embed=embed)
+            await self.delivery.respond(interaction, embed=embed)
 
 
 async def setup(bot: commands.Bot):
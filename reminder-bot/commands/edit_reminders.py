@@ -2,10 +2,13 @@
 
 import discord
 from discord.ext import commands
-from datetime import datetime, timedelta
-from dateutil import parser
+import pytz
+from datetime import datetime
+from services.delivery import DeliveryPool
+from utils.async_store import AsyncDataManager
 from utils.data_manager import DataManager
 from utils.embeds import create_error_embed
+from utils.time_parser import parse_time
 
 
 class EditReminderCommand(commands.Cog):
@@ -13,7 +16,8 @@ class EditReminderCommand(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.data = DataManager()
+        self.data = getattr(bot, "data", None) or AsyncDataManager(DataManager())
+        self.delivery = getattr(bot, "delivery", None) or DeliveryPool()
 
     def _get_reminder_service(self):
         """Get the reminder service from bot."""
@@ -25,28 +29,11 @@ class EditReminderCommand(commands.Cog):
         return reminder_service
 
     def parse_time_input(self, time_str: str) -> datetime:
-        """Parse time input with basic formats."""
-        try:
-            time_str = time_str.lower().strip()
-            now = datetime.utcnow()
-
-            # Handle relative times
-            if time_str.endswith("m"):
-                minutes = int(time_str[:-1])
-                if minutes > 0:
-                    return now + timedelta(minutes=minutes)
-            elif time_str.endswith("h"):
-                hours = int(time_str[:-1])
-                if hours > 0 and hours <= 23:
-                    return now + timedelta(hours=hours)
-            elif time_str.endswith("d"):
-                days = int(time_str[:-1])
-                if days > 0 and days <= 365:
-                    return now + timedelta(days=days)
-
-            return parser.parse(time_str, default=now)
-        except Exception:
+        """Parse time input (same grammar and timezone as /remind)."""
+        parsed = parse_time(time_str)
+        if parsed is None:
             raise ValueError("Invalid time format")
+        return parsed
 
     @commands.command(name="edit_remind", help="Edit an existing reminder")
     async def edit_remind(
@@ -59,25 +46,33 @@ class EditReminderCommand(commands.Cog):
         try:
             parsed_time = self.parse_time_input(new_time)
         except ValueError:
-            await ctx.send(
+            await self.delivery.reply(
+                ctx,
                 "❌ **Invalid time format**. Try formats like: `30m`, `2h`, `1d`, `tomorrow 9am`"
             )
             return
 
         # Find the reminder
-        reminder = self.data.get_reminder(reminder_id, int(user_id))
+        reminder = await self.data.get_reminder(reminder_id, int(user_id))
 
         if not reminder:
-            await ctx.send(f"❌ **Reminder not found**. Check your ID with `!list`")
+            await self.delivery.reply(ctx, f"❌ **Reminder not found**. Check your ID with `!list`")
             return
 
         # Update reminder
-        success = self.data.update_reminder_time(reminder_id, parsed_time.isoformat())
+        # Stored in UTC, like reminders created with /remind
+        success = await self.data.update_reminder_time(
+            reminder_id, parsed_time.astimezone(pytz.UTC).isoformat()
+        )
 
         if not success:
-            await ctx.send("❌ **Failed to update reminder**. Please try again.")
+            await self.delivery.reply(ctx, "❌ **Failed to update reminder**. Please try again.")
             return
 
+        reminder_service = getattr(self.bot, "reminder_service", None)
+        if reminder_service:
+            await reminder_service.reschedule(reminder_id)
+
         # Create response
         embed = discord.Embed(
             title="✅ Reminder Updated",
@@ -99,7 +94,7 @@ class EditReminderCommand(commands.Cog):
         embed.set_footer(
             text=f"Reminder ID: {reminder_id} • Edited by {ctx.author.name}"
         )
-        await ctx.send(embed=embed)
+        await self.delivery.reply(ctx, embed=embed)
 
     @commands.command(name="cancel_remind", help="Cancel a reminder")
     async def cancel_remind(self, ctx: commands.Context, reminder_id: str) -> None:
@@ -107,19 +102,23 @@ class EditReminderCommand(commands.Cog):
         user_id = str(ctx.author.id)
 
         # Find the reminder
-        reminder = self.data.get_reminder(reminder_id, int(user_id))
+        reminder = await self.data.get_reminder(reminder_id, int(user_id))
 
         if not reminder:
-            await ctx.send(f"❌ **Reminder not found**. Check your ID with `!list`")
+            await self.delivery.reply(ctx, f"❌ **Reminder not found**. Check your ID with `!list`")
             return
 
         # Delete reminder
-        success = self.data.remove_reminder(reminder_id, int(user_id))
+        success = await self.data.remove_reminder(reminder_id, int(user_id))
 
         if not success:
-            await ctx.send("❌ **Failed to cancel reminder**. Please try again.")
+            await self.delivery.reply(ctx, "❌ **Failed to cancel reminder**. Please try again.")
             return
 
+        reminder_service = getattr(self.bot, "reminder_service", None)
+        if reminder_service:
+            reminder_service.unschedule(reminder_id)
+
         # Create response
         embed = discord.Embed(
             title="✅ Reminder Cancelled",
@@ -143,7 +142,7 @@ class EditReminderCommand(commands.Cog):
             text=f"Reminder ID: {reminder_id} • Cancelled by {ctx.author.name}"
         )
 
-        await ctx.send(embed=embed)
+        await self.delivery.reply(ctx, embed=embed)
 
 
 async def setup(bot: commands.Bot):
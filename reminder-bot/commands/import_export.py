@@ -0,0 +1,168 @@
+"""Bulk reminder import/export commands (bot owner only)."""
+
+import asyncio
+import io
+import itertools
+import tempfile
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from discord.ext import commands
+from services.delivery import DeliveryPool
+from utils.async_store import AsyncDataManager
+from utils.data_manager import DataManager
+from utils.embeds import create_error_embed, create_success_embed
+from utils.reminder_io import detect_format, export_reminders, import_reminders
+
+import discord
+from discord import app_commands
+
+# Largest attachment /import_reminders accepts
+MAX_IMPORT_BYTES = 10 * 1024 * 1024
+# Invalid rows listed in the import summary
+MAX_LISTED_ERRORS = 5
+# Reminders parsed and stored per batched write while importing
+IMPORT_BATCH_SIZE = 500
+
+FORMAT_CHOICES = [
+    app_commands.Choice(name="iCalendar (.ics)", value="ics"),
+    app_commands.Choice(name="CSV", value="csv"),
+]
+
+
+def _write_export(reminders: List[Dict], fmt: str) -> Tuple[BinaryIO, int]:
+    """Stream reminders into a temporary file (blocking; run in a thread)."""
+    fp = tempfile.TemporaryFile()
+    text = io.TextIOWrapper(fp, encoding="utf-8", newline="")
+    count = export_reminders(reminders, text, fmt)
+    text.flush()
+    text.detach()
+    fp.seek(0)
+    return fp, count
+
+
+def _next_batch(items: Iterator[Dict]) -> List[Dict]:
+    """Parse up to IMPORT_BATCH_SIZE more records (blocking; run in a thread)."""
+    return list(itertools.islice(items, IMPORT_BATCH_SIZE))
+
+
+class ImportExportCommand(commands.Cog):
+    """Bulk reminder import/export commands."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.data = getattr(bot, "data", None) or AsyncDataManager(DataManager())
+        self.delivery = getattr(bot, "delivery", None) or DeliveryPool()
+
+    async def _check_owner(self, interaction: discord.Interaction) -> bool:
+        """Every user's reminders are involved, so only the bot owner may run these."""
+        if await self.bot.is_owner(interaction.user):
+            return True
+        embed = create_error_embed("Only the bot owner can import or export reminders.")
+        await self.delivery.respond(interaction, embed=embed, ephemeral=True)
+        return False
+
+    @app_commands.command(
+        name="export_reminders",
+        description="Export every reminder as iCalendar or CSV (bot owner only)",
+    )
+    @app_commands.describe(format="File format")
+    @app_commands.choices(format=FORMAT_CHOICES)
+    @app_commands.default_permissions(administrator=True)
+    async def export_reminders(
+        self,
+        interaction: discord.Interaction,
+        format: Optional[app_commands.Choice[str]] = None,
+    ):
+        """Export all reminders."""
+        if not await self._check_owner(interaction):
+            return
+        await self.delivery.defer(interaction, ephemeral=True)
+
+        fmt = format.value if format else "ics"
+        reminders = await self.data.get_all_reminders()
+        fp, count = await asyncio.to_thread(_write_export, reminders, fmt)
+        try:
+            embed = create_success_embed(f"Exported {count} reminder(s).")
+            await self.delivery.respond(
+                interaction,
+                embed=embed,
+                file=discord.File(fp, filename=f"reminders.{fmt}"),
+                ephemeral=True,
+            )
+        finally:
+            fp.close()
+
+    @app_commands.command(
+        name="import_reminders",
+        description="Import reminders from an iCalendar or CSV file (bot owner only)",
+    )
+    @app_commands.describe(
+        file="A .ics or .csv file; rows without a user ID are assigned to you"
+    )
+    @app_commands.default_permissions(administrator=True)
+    async def import_reminders(
+        self, interaction: discord.Interaction, file: discord.Attachment
+    ):
+        """Import reminders written in batches of IMPORT_BATCH_SIZE."""
+        if not await self._check_owner(interaction):
+            return
+
+        fmt = detect_format(file.filename)
+        if not fmt:
+            embed = create_error_embed("Attach a `.ics` or `.csv` file.")
+            await self.delivery.respond(interaction, embed=embed, ephemeral=True)
+            return
+        if file.size > MAX_IMPORT_BYTES:
+            embed = create_error_embed(
+                f"File is too large (limit {MAX_IMPORT_BYTES // (1024 * 1024)} MB)."
+            )
+            await self.delivery.respond(interaction, embed=embed, ephemeral=True)
+            return
+        reminder_service = getattr(self.bot, "reminder_service", None)
+        if not reminder_service:
+            embed = create_error_embed("Reminder service is not running yet.")
+            await self.delivery.respond(interaction, embed=embed, ephemeral=True)
+            return
+
+        await self.delivery.defer(interaction, ephemeral=True)
+
+        # The upload itself is capped at MAX_IMPORT_BYTES; records are
+        # parsed and stored a batch at a time, never all at once
+        errors: List[str] = []
+        skipped: List[str] = []
+        advanced: List[str] = []
+        text = io.TextIOWrapper(
+            io.BytesIO(await file.read()), encoding="utf-8-sig", newline=""
+        )
+        items = import_reminders(
+            text, fmt, interaction.user.id, errors, skipped=skipped, advanced=advanced
+        )
+        reminder_ids: List[str] = []
+        try:
+            while True:
+                batch = await asyncio.to_thread(_next_batch, items)
+                if not batch:
+                    break
+                reminder_ids += await reminder_service.create_reminders(batch)
+        finally:
+            text.close()
+
+        summary = f"Imported {len(reminder_ids)} reminder(s) from `{file.filename}`."
+        if advanced:
+            summary += (
+                f"\nMoved {len(advanced)} recurring reminder(s) that were in the past "
+                "to their next occurrence."
+            )
+        if skipped:
+            summary += f"\nSkipped {len(skipped)} one-time reminder(s) already in the past."
+        if errors:
+            summary += f"\nSkipped {len(errors)} invalid record(s):\n" + "\n".join(
+                f"• {error[:150]}" for error in errors[:MAX_LISTED_ERRORS]
+            )
+        embed = create_success_embed(summary)
+        await self.delivery.respond(interaction, embed=embed, ephemeral=True)
+
+
+async def setup(bot: commands.Bot):
+    """Add cog to bot."""
+    await bot.add_cog(ImportExportCommand(bot))
@@ -1,8 +1,16 @@
 """List reminders command."""
 
+from typing import Optional
+
 from discord.ext import commands
+from services.delivery import DeliveryPool
+from utils.async_store import AsyncDataManager
 from utils.data_manager import DataManager
-from utils.embeds import create_reminder_list_embed
+from utils.embeds import (
+    create_error_embed,
+    create_reminder_list_embed,
+    create_upcoming_embed,
+)
 import discord
 from discord import app_commands
 
@@ -12,16 +20,49 @@ class ListCommand(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.data = DataManager()
+        self.data = getattr(bot, "data", None) or AsyncDataManager(DataManager())
+        self.delivery = getattr(bot, "delivery", None) or DeliveryPool()
 
     @app_commands.command(name="reminders", description="List all your reminders")
-    async def reminders(self, interaction: discord.Interaction):
-        """List all reminders."""
-        await interaction.response.defer()
+    @app_commands.describe(
+        search="Only show reminders whose message or notes contain these words"
+    )
+    async def reminders(
+        self, interaction: discord.Interaction, search: Optional[str] = None
+    ):
+        """List all reminders, or those matching a search."""
+        await self.delivery.defer(interaction)
+
+        if search:
+            reminders = await self.data.search_reminders(interaction.user.id, search)
+            embed = create_reminder_list_embed(reminders, query=search)
+        else:
+            reminders = await self.data.get_user_reminders(interaction.user.id)
+            embed = create_reminder_list_embed(reminders)
+        await self.delivery.respond(interaction, embed=embed)
+
+    @app_commands.command(
+        name="upcoming",
+        description="Show your next reminder occurrences, recurring ones expanded",
+    )
+    @app_commands.describe(count="How many occurrences to show (default 10)")
+    async def upcoming(
+        self,
+        interaction: discord.Interaction,
+        count: app_commands.Range[int, 1, 25] = 10,
+    ):
+        """List upcoming occurrences."""
+        reminder_service = getattr(self.bot, "reminder_service", None)
+        if not reminder_service:
+            embed = create_error_embed("Reminder service is not running yet.")
+            await self.delivery.respond(interaction, embed=embed, ephemeral=True)
+            return
+
+        await self.delivery.defer(interaction)
 
-        reminders = self.data.get_user_reminders(interaction.user.id)
-        embed = create_reminder_list_embed(reminders)
-        await interaction.followup.send(embed=embed)
+        occurrences = await reminder_service.upcoming(interaction.user.id, count)
+        embed = create_upcoming_embed(occurrences)
+        await self.delivery.respond(interaction, embed=embed)
 
 
 async def setup(bot: commands.Bot):
@@ -0,0 +1,164 @@
+"""Scheduler metrics command (admin only)."""
+
+from typing import Dict, List, Optional
+
+from discord.ext import commands
+from services.delivery import DeliveryPool
+from services.metrics import (
+    DELIVERIES,
+    DELIVERY_LAG,
+    QUEUE_DEPTH,
+    SEND_ERRORS,
+    SEND_LATENCY,
+    SEND_QUEUE_DEPTH,
+    SEND_QUEUE_WAIT,
+    STORAGE_LATENCY,
+    Histogram,
+    Metrics,
+)
+from utils.embeds import create_error_embed
+
+import discord
+from discord import app_commands
+
+
+def _format_seconds(value: Optional[float]) -> str:
+    if value is None:
+        return "n/a"
+    if value < 1:
+        return f"{value * 1000:.1f} ms"
+    return f"{value:.1f} s"
+
+
+def _summarize(histograms: List[Histogram]) -> str:
+    """p50 / p95 / p99 over the recent samples of several series."""
+    merged = Histogram(())
+    for histogram in histograms:
+        for value in histogram.recent:
+            merged.observe(value)
+    if not merged.count:
+        return "No data yet"
+    return (
+        f"p50 {_format_seconds(merged.percentile(0.50))} · "
+        f"p95 {_format_seconds(merged.percentile(0.95))} · "
+        f"p99 {_format_seconds(merged.percentile(0.99))}"
+    )
+
+
+def _by_label(metrics: Metrics, name: str, label: str) -> Dict[str, List[Histogram]]:
+    grouped: Dict[str, List[Histogram]] = {}
+    for labels, histogram in metrics.histograms(name).items():
+        grouped.setdefault(dict(labels).get(label, ""), []).append(histogram)
+    return grouped
+
+
+def create_metrics_embed(metrics: Metrics) -> discord.Embed:
+    """Summarize scheduler metrics (percentiles cover recent samples)."""
+    embed = discord.Embed(title="📈 Reminder Metrics", color=discord.Color.blue())
+
+    depth = metrics.gauge_value(QUEUE_DEPTH)
+    embed.add_field(
+        name="📬 Queue depth",
+        value=str(int(depth)) if depth is not None else "n/a",
+        inline=True,
+    )
+
+    results: Dict[str, float] = {}
+    for labels, value in metrics.counter_values(DELIVERIES).items():
+        result = dict(labels).get("result", "")
+        results[result] = results.get(result, 0) + value
+    embed.add_field(
+        name="📤 Deliveries",
+        value="\n".join(f"{k}: {int(v)}" for k, v in sorted(results.items()))
+        or "None yet",
+        inline=True,
+    )
+
+    queued = metrics.gauge_value(SEND_QUEUE_DEPTH)
+    embed.add_field(
+        name="📮 Send queue",
+        value="\n".join(
+            [f"waiting: {int(queued)}" if queued is not None else "waiting: n/a"]
+            + [
+                f"{priority} wait: {_summarize(series)}"
+                for priority, series in sorted(
+                    _by_label(metrics, SEND_QUEUE_WAIT, "priority").items()
+                )
+            ]
+        ),
+        inline=False,
+    )
+
+    embed.add_field(
+        name="⏱️ Delivery lag",
+        value=_summarize(list(metrics.histograms(DELIVERY_LAG).values())),
+        inline=False,
+    )
+    embed.add_field(
+        name="🌐 Send latency",
+        value="\n".join(
+            f"{route}: {_summarize(series)}"
+            for route, series in sorted(_by_label(metrics, SEND_LATENCY, "route").items())
+        )
+        or "No data yet",
+        inline=False,
+    )
+
+    errors = sorted(
+        metrics.counter_values(SEND_ERRORS).items(), key=lambda item: -item[1]
+    )
+    embed.add_field(
+        name="⚠️ Send errors",
+        value="\n".join(
+            f"{dict(labels).get('route')} {dict(labels).get('error')}: {int(count)}"
+            for labels, count in errors[:10]
+        )
+        or "None",
+        inline=False,
+    )
+
+    embed.add_field(
+        name="💾 Storage",
+        value="\n".join(
+            f"`{op}`: {_summarize(series)}"
+            for op, series in sorted(_by_label(metrics, STORAGE_LATENCY, "op").items())
+        )
+        or "No data yet",
+        inline=False,
+    )
+    return embed
+
+
+class MetricsCommand(commands.Cog):
+    """Scheduler metrics command."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.delivery = getattr(bot, "delivery", None) or DeliveryPool()
+
+    @app_commands.command(
+        name="metrics",
+        description="Show reminder delivery and scheduler metrics (bot owner only)",
+    )
+    @app_commands.default_permissions(administrator=True)
+    async def metrics(self, interaction: discord.Interaction):
+        """Show scheduler metrics."""
+        # Metrics cover every guild, so server admins alone may not see them
+        if not await self.bot.is_owner(interaction.user):
+            embed = create_error_embed("Only the bot owner can view metrics.")
+            await self.delivery.respond(interaction, embed=embed, ephemeral=True)
+            return
+
+        reminder_service = getattr(self.bot, "reminder_service", None)
+        if not reminder_service:
+            embed = create_error_embed("Reminder service is not running yet.")
+            await self.delivery.respond(interaction, embed=embed, ephemeral=True)
+            return
+
+        embed = create_metrics_embed(reminder_service.metrics)
+        await self.delivery.respond(interaction, embed=embed, ephemeral=True)
+
+
+async def setup(bot: commands.Bot):
+    """Add cog to bot."""
+    await bot.add_cog(MetricsCommand(bot))
@@ -1,6 +1,8 @@
 """Add/edit notes for reminder command."""
 
 from discord.ext import commands
+from services.delivery import DeliveryPool
+from utils.async_store import AsyncDataManager
 from utils.data_manager import DataManager
 from utils.embeds import create_error_embed, create_reminder_embed
 
@@ -14,13 +16,14 @@ class NoteCommand(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.data = DataManager()
+        self.data = getattr(bot, "data", None) or AsyncDataManager(DataManager())
+        self.delivery = getattr(bot, "delivery", None) or DeliveryPool()
 
     async def reminder_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> List[app_commands.Choice[str]]:
         """Autocomplete handler for reminder selection."""
-        reminders = self.data.get_user_reminders(interaction.user.id)
+        reminders = await self.data.get_user_reminders(interaction.user.id)
 
         if not reminders:
             return []
@@ -51,19 +54,19 @@ class NoteCommand(commands.Cog):
         self, interaction: discord.Interaction, reminder_id: str, notes: str
     ):
         """Add or edit notes for a reminder."""
-        await interaction.response.defer()
+        await self.delivery.defer(interaction)
 
         # Get reminder to verify it exists and user owns it
-        reminder = self.data.get_reminder(reminder_id, interaction.user.id)
+        reminder = await self.data.get_reminder(reminder_id, interaction.user.id)
         if not reminder:
             embed = create_error_embed(
                 f"Reminder `{reminder_id[:8]}` not found or you don't have permission to edit it"
             )
-            await interaction.followup.send(embed=embed)
+            await self.delivery.respond(interaction, embed=embed)
             return
 
         # Update notes
-        success = self.data.update_reminder_notes(
+        success = await self.data.update_reminder_notes(
             reminder_id, interaction.user.id, notes
         )
 
@@ -77,10 +80,10 @@ class NoteCommand(commands.Cog):
                 notes=notes,
             )
             embed.title = "✅ Notes Updated"
-            await interaction.followup.send(embed=embed)
+            await self.delivery.respond(interaction, embed=embed)
         else:
             embed = create_error_embed("Failed to update notes")
-            await interaction.followup.send(embed=embed)
+            await self.delivery.respond(interaction, embed=embed)
 
 
 async def setup(bot: commands.Bot):
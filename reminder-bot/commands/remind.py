@@ -3,12 +3,14 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-from datetime import datetime, timedelta
-from dateutil import parser
+from datetime import datetime
 import pytz
 from typing import Optional
+from services.delivery import DeliveryPool
+from utils.async_store import AsyncDataManager
 from utils.data_manager import DataManager
 from utils.embeds import create_error_embed, create_reminder_embed
+from utils.time_parser import LOCAL_TZ, parse_time
 
 
 class RemindCommand(commands.Cog):
@@ -16,7 +18,8 @@ class RemindCommand(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.data = DataManager()
+        self.data = getattr(bot, "data", None) or AsyncDataManager(DataManager())
+        self.delivery = getattr(bot, "delivery", None) or DeliveryPool()
 
     def _get_reminder_service(self):
         """Get the reminder service from bot."""
@@ -29,126 +32,7 @@ class RemindCommand(commands.Cog):
 
     def parse_time_input(self, time_str: str) -> Optional[datetime]:
         """Parse various time input formats."""
-        if not time_str:
-            return None
-
-        try:
-            time_str = time_str.lower().strip()
-
-            # Get user's local timezone (PST/PDT = UTC-7)
-            local_tz = pytz.timezone("America/Denver")
-            now = datetime.now(local_tz)
-
-            # Handle relative times
-            if time_str.endswith("m"):
-                minutes_str = time_str[:-1]
-                if minutes_str.isdigit():
-                    minutes = int(minutes_str)
-                    if minutes > 0:
-                        return now + timedelta(minutes=minutes)
-            elif time_str.endswith("h"):
-                hours_str = time_str[:-1]
-                if hours_str.isdigit():
-                    hours = int(hours_str)
-                    if hours > 0 and hours <= 23:
-                        return now + timedelta(hours=hours)
-            elif time_str.endswith("d"):
-                days_str = time_str[:-1]
-                if days_str.isdigit():
-                    days = int(days_str)
-                    if days > 0 and days <= 365:
-                        return now + timedelta(days=days)
-            elif time_str.endswith("w"):
-                weeks_str = time_str[:-1]
-                if weeks_str.isdigit():
-                    weeks = int(weeks_str)
-                    if weeks > 0 and weeks <= 52:
-                        return now + timedelta(weeks=weeks)
-
-            # Simple time like "9am", "9pm", "9:30am", "9:30pm"
-            if "am" in time_str or "pm" in time_str:
-                # Extract hour and minutes
-                parts = time_str.replace("am", "").replace("pm", "").strip()
-                if ":" in parts:
-                    hour_str, minute_str = parts.split(":")
-                    hour = int(hour_str)
-                    minute = int(minute_str)
-                else:
-                    hour = int(parts)
-                    minute = 0
-
-                # Convert to 24-hour format
-                if "pm" in time_str:
-                    if hour == 12:  # 12 PM
-                        hour_24 = 12
-                    elif hour == 0:  # 0 PM (invalid)
-                        hour_24 = 12
-                    else:  # 1-11 PM
-                        hour_24 = hour + 12
-                else:  # AM
-                    if hour == 12:  # 12 AM
-                        hour_24 = 0
-                    elif hour == 0:  # 0 AM (invalid)
-                        hour_24 = 0
-                    else:  # 1-11 AM
-                        hour_24 = hour
-
-                return now.replace(hour=hour_24, minute=minute, second=0, microsecond=0)
-
-            # Handle time keywords
-            time_keywords = {
-                "morning": 8,
-                "noon": 12,
-                "afternoon": 15,
-                "evening": 18,
-                "night": 20,
-                "midnight": 0,
-            }
-
-            if time_str in time_keywords:
-                hour = time_keywords[time_str]
-                return now.replace(hour=hour, minute=0, second=0, microsecond=0)
-
-            # Handle tomorrow
-            if time_str.startswith("tomorrow"):
-                if len(time_str) > 8:  # tomorrow + time
-                    time_part = time_str[8:].strip()
-                    if "am" in time_part or "pm" in time_part:
-                        # Use the same logic as above for tomorrow times
-                        parts = time_part.replace("am", "").replace("pm", "").strip()
-                        if ":" in parts:
-                            hour_str, minute_str = parts.split(":")
-                            hour = int(hour_str)
-                            minute = int(minute_str)
-                        else:
-                            hour = int(parts)
-                            minute = 0
-
-                        if "pm" in time_part:
-                            if hour == 12:
-                                hour_24 = 12
-                            elif hour == 0:
-                                hour_24 = 12
-                            else:
-                                hour_24 = hour + 12
-                        else:
-                            if hour == 12:
-                                hour_24 = 0
-                            elif hour == 0:
-                                hour_24 = 0
-                            else:
-                                hour_24 = hour
-
-                        tomorrow = now + timedelta(days=1)
-                        return tomorrow.replace(
-                            hour=hour_24, minute=minute, second=0, microsecond=0
-                        )
-
-            # Try dateutil as final fallback
-            result = parser.parse(time_str, default=now)
-            return result
-        except Exception as e:
-            return None
+        return parse_time(time_str)
 
     def parse_recurring_input(self, recurring_str: str) -> Optional[str]:
         """Parse recurring reminder format with flexible day selection."""
@@ -201,17 +85,17 @@ class RemindCommand(commands.Cog):
         # Parse time
         remind_at_dt = self.parse_time_input(time)
         if not remind_at_dt:
-            await ctx.send(
+            await self.delivery.reply(
+                ctx,
                 f"❌ Invalid time format: `{time}`\n"
                 "Use formats like: `30m`, `2h`, `1d`, `tomorrow 9am`, or `9am`, `2pm`, `9pm`"
             )
             return
 
         # Make sure it's in the future
-        local_tz = pytz.timezone("America/Denver")
-        now = datetime.now(local_tz)
+        now = datetime.now(LOCAL_TZ)
         if remind_at_dt <= now:
-            await ctx.send("❌ Reminder time must be in the future")
+            await self.delivery.reply(ctx, "❌ Reminder time must be in the future")
             return
 
         # Parse recurring
@@ -219,7 +103,8 @@ class RemindCommand(commands.Cog):
         if recurring:
             recurring_pattern = self.parse_recurring_input(recurring)
             if not recurring_pattern:
-                await ctx.send(
+                await self.delivery.reply(
+                    ctx,
                     f"❌ Invalid recurring format: `{recurring}`\n"
                     "Use formats like: `daily`, `weekly`, `monthly`, `daily at 9am`, "
                     "`weekly on monday,wednesday at 2pm`, `monthly on 15th at 10am`"
@@ -254,7 +139,7 @@ class RemindCommand(commands.Cog):
 
         response += f"\n📍 **Location**: {ctx.channel.mention}"
 
-        await ctx.send(response)
+        await self.delivery.reply(ctx, response)
 
     @commands.command(name="time_help", description="Get help with time formats")
     async def time_help(self, ctx):
@@ -307,7 +192,7 @@ class RemindCommand(commands.Cog):
         `!remind "Call doctor" tomorrow 3pm`
         """
 
-        await ctx.send(help_text)
+        await self.delivery.reply(ctx, help_text)
 
     @app_commands.command(name="remind", description="Set a reminder")
     async def remind_slash(
@@ -318,7 +203,7 @@ class RemindCommand(commands.Cog):
         recurring: Optional[str] = None,
     ):
         """Set a reminder via slash command."""
-        await interaction.response.defer()
+        await self.delivery.defer(interaction)
         reminder_service = self._get_reminder_service()
         remind_at_dt = self.parse_time_input(time)
 
@@ -327,14 +212,13 @@ class RemindCommand(commands.Cog):
                 f"Invalid time format: `{time}`\n"
                 "Use formats like: `30m`, `2h`, `1d`, `tomorrow 9am`, or `9am`, `2pm`, `9pm`"
             )
-            await interaction.followup.send(embed=embed)
+            await self.delivery.respond(interaction, embed=embed)
             return
 
-        local_tz = pytz.timezone("America/Denver")
-        now = datetime.now(local_tz)
+        now = datetime.now(LOCAL_TZ)
         if remind_at_dt <= now:
             embed = create_error_embed("Reminder time must be in the future")
-            await interaction.followup.send(embed=embed)
+            await self.delivery.respond(interaction, embed=embed)
             return
 
         # Parse recurring
@@ -347,7 +231,7 @@ class RemindCommand(commands.Cog):
                     "Use formats like: `daily`, `weekly`, `monthly`, `daily at 9am`, "
                     "`weekly on monday,wednesday at 2pm`, `monthly on 15th at 10am`"
                 )
-                await interaction.followup.send(embed=embed)
+                await self.delivery.respond(interaction, embed=embed)
                 return
 
             # Insert time into recurring pattern
@@ -381,7 +265,7 @@ class RemindCommand(commands.Cog):
         )
         embed.add_field(name="📍 Location", value=location, inline=False)
 
-        await interaction.followup.send(embed=embed)
+        await self.delivery.respond(interaction, embed=embed)
 
 
 async def setup(bot: commands.Bot):
@@ -3,6 +3,8 @@
 from typing import Optional
 
 from discord.ext import commands
+from services.delivery import DeliveryPool
+from utils.async_store import AsyncDataManager
 from utils.data_manager import DataManager
 from utils.embeds import create_error_embed, create_success_embed
 
@@ -15,14 +17,15 @@ class SetChannelCommand(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.data = DataManager()
+        self.data = getattr(bot, "data", None) or AsyncDataManager(DataManager())
+        self.delivery = getattr(bot, "delivery", None) or DeliveryPool()
 
     @app_commands.command(
         name="setchannel",
         description="Set the default channel for reminders in this server",
     )
     @app_commands.describe(
-        channel="Channel to send reminders to by default (leave empty to clear and use DM)"
+        channel="Channel to deliver this server's reminders in (leave empty to clear)"
     )
     @app_commands.default_permissions(manage_channels=True)
     async def setchannel(
@@ -35,28 +38,29 @@ class SetChannelCommand(commands.Cog):
             embed = create_error_embed(
                 "This command can only be used in a server, not in DMs."
             )
-            await interaction.response.send_message(embed=embed)
+            await self.delivery.respond(interaction, embed=embed)
             return
 
-        await interaction.response.defer()
+        await self.delivery.defer(interaction)
 
         guild_id = interaction.guild.id
 
         if channel:
             # Set default channel
-            self.data.set_guild_default_channel(guild_id, channel.id)
+            await self.data.set_guild_default_channel(guild_id, channel.id)
             embed = create_success_embed(
                 f"Default reminder channel set to {channel.mention}\n"
-                "All reminders without a specified channel will be sent here."
+                "Reminders set anywhere in this server will be delivered here."
             )
         else:
             # Clear default channel (revert to DM)
-            self.data.clear_guild_default_channel(guild_id)
+            await self.data.clear_guild_default_channel(guild_id)
             embed = create_success_embed(
-                "Default channel cleared. Reminders will now be sent via DM by default."
+                "Default channel cleared. Reminders will be delivered in the "
+                "channel they were set in."
             )
 
-        await interaction.followup.send(embed=embed)
+        await self.delivery.respond(interaction, embed=embed)
 
     @app_commands.command(
         name="getchannel", description="View the current default channel for reminders"
@@ -67,13 +71,13 @@ class SetChannelCommand(commands.Cog):
             embed = create_error_embed(
                 "This command can only be used in a server, not in DMs."
             )
-            await interaction.response.send_message(embed=embed)
+            await self.delivery.respond(interaction, embed=embed)
             return
 
-        await interaction.response.defer()
+        await self.delivery.defer(interaction)
 
         guild_id = interaction.guild.id
-        channel_id = self.data.get_guild_default_channel(guild_id)
+        channel_id = await self.data.get_guild_default_channel(guild_id)
 
         if channel_id:
             channel = interaction.guild.get_channel(channel_id)
@@ -88,11 +92,12 @@ class SetChannelCommand(commands.Cog):
                 )
         else:
             embed = create_success_embed(
-                "No default channel set. Reminders will be sent via DM by default.\n"
+                "No default channel set. Reminders are delivered in the channel "
+                "they were set in.\n"
                 "Use `/setchannel <channel>` to set a default channel."
             )
 
-        await interaction.followup.send(embed=embed)
+        await self.delivery.respond(interaction, embed=embed)
 
 
 async def setup(bot: commands.Bot):
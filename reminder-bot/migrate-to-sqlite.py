@@ -0,0 +1,32 @@
+"""Import reminders.json and config.json into data/reminders.db."""
+
+import argparse
+import logging
+import sys
+
+from utils.sqlite_store import SQLiteDataManager
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-dir", default="data", help="Bot data directory")
+    args = parser.parse_args()
+
+    store = SQLiteDataManager(args.data_dir)
+    try:
+        count = len(store.get_all_reminders())
+        logger.info(f"{store.db_file} holds {count} reminder(s)")
+        logger.info("Set REMINDER_STORAGE=sqlite in .env to use it")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as exc:
+        logger.exception(f"Migration failed: {exc}")
+        sys.exit(1)
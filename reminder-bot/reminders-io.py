@@ -0,0 +1,113 @@
+"""Export or bulk-import reminders as iCalendar (.ics) or CSV.
+
+    python reminders-io.py export reminders.ics
+    python reminders-io.py import reminders.csv --user-id 1234
+
+Uses the store selected by REMINDER_STORAGE. With the json or journal
+store, stop the bot before importing. The import is written in batches
+of IMPORT_BATCH_SIZE reminders, so a failed import can leave earlier
+batches committed.
+"""
+
+import argparse
+import itertools
+import logging
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+from utils.data_manager import create_data_manager
+from utils.reminder_io import FORMATS, detect_format, export_reminders, import_reminders
+
+load_dotenv()
+
+# Reminders stored per batched write
+IMPORT_BATCH_SIZE = 500
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _format(args) -> str:
+    fmt = args.format or detect_format(args.file)
+    if not fmt:
+        raise SystemExit(f"Cannot tell the format of {args.file}; pass --format")
+    return fmt
+
+
+def export_command(store, args) -> int:
+    fmt = _format(args)
+    reminders = store.get_all_reminders()
+    with open(args.file, "w", encoding="utf-8", newline="") as out:
+        count = export_reminders(reminders, out, fmt)
+    logger.info(f"Exported {count} reminder(s) to {args.file}")
+    return 0
+
+
+def import_command(store, args) -> int:
+    fmt = _format(args)
+    errors, skipped, advanced = [], [], []
+    imported = 0
+    with open(args.file, "r", encoding="utf-8-sig", newline="") as source:
+        items = import_reminders(
+            source, fmt, args.user_id, errors, skipped=skipped, advanced=advanced
+        )
+        while True:
+            batch = list(itertools.islice(items, IMPORT_BATCH_SIZE))
+            if not batch:
+                break
+            if not args.dry_run:
+                store.add_reminders(batch)
+            imported += len(batch)
+    for error in errors:
+        logger.warning(f"Skipped {error}")
+    for past in skipped:
+        logger.info(f"Skipped {past}")
+    if advanced:
+        logger.info(
+            f"Moved {len(advanced)} past recurring reminder(s) to their next occurrence"
+        )
+    if args.dry_run:
+        logger.info(f"{imported} reminder(s) would be imported")
+        return 0
+    logger.info(f"Imported {imported} reminder(s) from {args.file}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--data-dir", default="data", help="Bot data directory")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Write every reminder to a file")
+    export_parser.add_argument("file")
+    export_parser.add_argument("--format", choices=FORMATS)
+    export_parser.set_defaults(run=export_command)
+
+    import_parser = subparsers.add_parser("import", help="Add reminders from a file")
+    import_parser.add_argument("file")
+    import_parser.add_argument("--format", choices=FORMATS)
+    import_parser.add_argument(
+        "--user-id", type=int, help="Owner for records without a user ID"
+    )
+    import_parser.add_argument(
+        "--dry-run", action="store_true", help="Validate only; write nothing"
+    )
+    import_parser.set_defaults(run=import_command)
+
+    args = parser.parse_args()
+    store = create_data_manager(str(Path(args.data_dir)))
+    try:
+        return args.run(store, args)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except Exception as exc:
+        logger.exception(f"Failed: {exc}")
+        sys.exit(1)
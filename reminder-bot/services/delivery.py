@@ -0,0 +1,336 @@
+"""Central outbound queue for Discord sends.
+
+Reminder deliveries, command responses and error notices all go through
+one ``DeliveryPool``, which applies a global and a per-route rate limit,
+bounds concurrency and always serves interactive sends before batch
+reminder deliveries.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import discord
+
+from services.metrics import (
+    SEND_ERRORS,
+    SEND_LATENCY,
+    SEND_QUEUE_DEPTH,
+    SEND_QUEUE_WAIT,
+    Metrics,
+)
+from utils.retry import retry_discord_api
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Send priorities; lower values are served first
+INTERACTIVE = 0
+BATCH = 1
+PRIORITY_NAMES = {INTERACTIVE: "interactive", BATCH: "batch"}
+
+# Concurrent in-flight sends across all destinations
+DEFAULT_CONCURRENCY = int(os.getenv("REMINDER_DELIVERY_CONCURRENCY", "8"))
+# Slots batch deliveries may never take, so a command reply never waits
+# for a reminder send to finish
+INTERACTIVE_RESERVED = 1
+# Discord allows roughly 50 requests per second per bot
+GLOBAL_CAPACITY = 50
+GLOBAL_PERIOD = 1.0
+# Discord allows roughly 5 messages per 5 seconds per channel (and per DM)
+ROUTE_CAPACITY = 5
+ROUTE_PERIOD = 5.0
+# Prune idle route buckets once this many are tracked
+MAX_IDLE_BUCKETS = 1000
+
+# Tie-breaker so equal priorities are served first come, first served
+_sequence = itertools.count()
+
+_Waiter = Tuple[int, int, "asyncio.Future[None]"]
+
+
+class TokenBucket:
+    """Async token bucket: ``capacity`` tokens refilled evenly over ``period`` seconds.
+
+    Waiters are served by priority (lower first), then in arrival order.
+    """
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._waiters: List[_Waiter] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def __len__(self) -> int:
+        """Number of waiting acquirers."""
+        return len(self._waiters)
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _take(self) -> float:
+        """Take a token if one is available.
+
+        Returns:
+            0.0 if a token was taken, else seconds until the next one.
+        """
+        self._refill(time.monotonic())
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def is_idle(self) -> bool:
+        """True if the bucket is full again (safe to discard)."""
+        self._refill(time.monotonic())
+        return self._tokens >= self.capacity and not self._waiters
+
+    async def acquire(self, priority: int = BATCH):
+        """Wait until a token is available and take it."""
+        if not self._waiters and self._take() == 0.0:
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(_sequence), future))
+        self._grant()
+        await future
+
+    def _grant(self):
+        """Hand tokens to waiters in order; re-arm a timer for the next token."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():  # Waiter was cancelled
+                heapq.heappop(self._waiters)
+                continue
+            delay = self._take()
+            if delay:
+                loop = asyncio.get_running_loop()
+                self._timer = loop.call_later(delay, self._grant)
+                return
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+
+
+class PrioritySemaphore:
+    """Semaphore whose waiters are woken by priority, then arrival order.
+
+    ``reserved`` slots are only handed to ``INTERACTIVE`` acquirers.
+    """
+
+    def __init__(self, value: int, reserved: int = 0):
+        self._value = value
+        self.reserved = min(reserved, value - 1)
+        self._waiters: List[_Waiter] = []
+
+    def __len__(self) -> int:
+        """Number of waiting acquirers."""
+        return len(self._waiters)
+
+    def _floor(self, priority: int) -> int:
+        return 0 if priority <= INTERACTIVE else self.reserved
+
+    async def acquire(self, priority: int = BATCH):
+        if not self._waiters and self._value > self._floor(priority):
+            self._value -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(_sequence), future))
+        # A reserved slot may be free even though batch waiters are queued
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()  # Granted just as we were cancelled
+            raise
+
+    def release(self):
+        self._value += 1
+        self._wake()
+
+    def _wake(self):
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._value <= self._floor(priority):
+                return
+            heapq.heappop(self._waiters)
+            self._value -= 1
+            future.set_result(None)
+
+
+class DeliveryPool:
+    """Outbound Discord send queue.
+
+    A route is a destination such as ``("channel", channel_id)``,
+    ``("dm", user_id)`` or ``("interaction", interaction_id)``. A send first
+    waits for its route's bucket, then the global bucket, then a
+    concurrency slot, so a burst aimed at one busy channel does not hold
+    slots that other destinations could use. At every stage ``INTERACTIVE``
+    sends go ahead of queued ``BATCH`` ones, and ``INTERACTIVE_RESERVED``
+    slots are kept free for them. Each send goes through
+    ``retry_discord_api``.
+
+    With ``metrics``, each attempt's duration and any error are recorded
+    under the route kind, time spent queued is recorded per priority, and
+    the number of queued sends is exported as a gauge.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        route_capacity: int = ROUTE_CAPACITY,
+        route_period: float = ROUTE_PERIOD,
+        metrics: Optional[Metrics] = None,
+        global_capacity: int = GLOBAL_CAPACITY,
+        global_period: float = GLOBAL_PERIOD,
+        reserved: int = INTERACTIVE_RESERVED,
+    ):
+        self.concurrency = concurrency
+        self.route_capacity = route_capacity
+        self.route_period = route_period
+        self.metrics = metrics
+        self._slots = PrioritySemaphore(concurrency, reserved)
+        self._global = TokenBucket(global_capacity, global_period)
+        self._buckets: Dict[Hashable, TokenBucket] = {}
+        self._queued = 0
+        if metrics is not None:
+            metrics.gauge(
+                SEND_QUEUE_DEPTH,
+                lambda: self._queued,
+                "Sends waiting for rate limits or a concurrency slot.",
+            )
+
+    @property
+    def queued(self) -> int:
+        """Sends currently waiting for rate limits or a slot."""
+        return self._queued
+
+    def _bucket(self, route: Hashable) -> TokenBucket:
+        bucket = self._buckets.get(route)
+        if bucket is None:
+            if len(self._buckets) >= MAX_IDLE_BUCKETS:
+                self._buckets = {
+                    key: b for key, b in self._buckets.items() if not b.is_idle()
+                }
+            bucket = TokenBucket(self.route_capacity, self.route_period)
+            self._buckets[route] = bucket
+        return bucket
+
+    async def send(
+        self,
+        route: Hashable,
+        func: Callable[[], Awaitable[T]],
+        operation_name: str = "Reminder delivery",
+        priority: int = BATCH,
+    ) -> Optional[T]:
+        """Rate-limit, then run ``func`` with retries.
+
+        Returns:
+            The result of ``func``, or None if every attempt failed.
+        """
+        queued_at = time.perf_counter()
+        self._queued += 1
+        try:
+            await self._bucket(route).acquire(priority)
+            await self._global.acquire(priority)
+            await self._slots.acquire(priority)
+        finally:
+            self._queued -= 1
+
+        try:
+            if self.metrics is not None:
+                self.metrics.observe(
+                    SEND_QUEUE_WAIT,
+                    time.perf_counter() - queued_at,
+                    priority=PRIORITY_NAMES.get(priority, str(priority)),
+                )
+                func = self._instrument(route, func)
+            return await retry_discord_api(func, operation_name=operation_name)
+        finally:
+            self._slots.release()
+
+    async def respond(
+        self, interaction: discord.Interaction, *args, **kwargs
+    ) -> Optional[Any]:
+        """Answer an interaction at interactive priority.
+
+        Sends the initial response, or a follow-up once the interaction has
+        been responded to or deferred. Arguments are those of
+        ``InteractionResponse.send_message`` / ``Webhook.send``.
+        """
+
+        def call():
+            if interaction.response.is_done():
+                return interaction.followup.send(*args, **kwargs)
+            return interaction.response.send_message(*args, **kwargs)
+
+        return await self.send(
+            ("interaction", interaction.id),
+            call,
+            operation_name=f"Response to interaction {interaction.id}",
+            priority=INTERACTIVE,
+        )
+
+    async def defer(self, interaction: discord.Interaction, **kwargs):
+        """Defer an interaction at interactive priority."""
+        await self.send(
+            ("interaction", interaction.id),
+            lambda: interaction.response.defer(**kwargs),
+            operation_name=f"Defer interaction {interaction.id}",
+            priority=INTERACTIVE,
+        )
+
+    async def reply(self, ctx, *args, **kwargs) -> Optional[discord.Message]:
+        """Send a prefix-command reply (``ctx.send``) at interactive priority."""
+        return await self.send(
+            ("channel", ctx.channel.id),
+            lambda: ctx.send(*args, **kwargs),
+            operation_name=f"Reply in channel {ctx.channel.id}",
+            priority=INTERACTIVE,
+        )
+
+    def _instrument(
+        self, route: Hashable, func: Callable[[], Awaitable[T]]
+    ) -> Callable[[], Awaitable[T]]:
+        """Wrap ``func`` so every attempt records latency and errors."""
+        metrics = self.metrics
+        kind = route[0] if isinstance(route, tuple) else str(route)
+
+        async def attempt() -> T:
+            start = time.perf_counter()
+            try:
+                return await func()
+            except Exception as e:
+                if isinstance(e, discord.HTTPException):
+                    error = f"http_{e.status}"
+                else:
+                    error = type(e).__name__
+                metrics.inc(SEND_ERRORS, route=kind, error=error)
+                raise
+            finally:
+                metrics.observe(SEND_LATENCY, time.perf_counter() - start, route=kind)
+
+        return attempt
@@ -0,0 +1,235 @@
+"""In-process metrics for the reminder scheduler, exported as Prometheus text."""
+
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, Optional, Tuple
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds; tuned for sub-second REST calls up to late deliveries
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LAG_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 3600.0)
+# Recent observations kept per histogram for percentile summaries
+RECENT_SAMPLES = 1024
+
+# Metric names recorded by ReminderService and DeliveryPool
+DELIVERY_LAG = "reminder_delivery_lag_seconds"
+SEND_LATENCY = "reminder_send_seconds"
+SEND_ERRORS = "reminder_send_errors_total"
+DELIVERIES = "reminder_deliveries_total"
+STORAGE_LATENCY = "reminder_storage_seconds"
+QUEUE_DEPTH = "reminder_queue_depth"
+SEND_QUEUE_WAIT = "reminder_send_queue_wait_seconds"
+SEND_QUEUE_DEPTH = "reminder_send_queue_depth"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    body = ",".join(f'{key}="{_escape(value)}"' for key, value in pairs)
+    return "{" + body + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Cumulative-bucket histogram plus a window of recent samples."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+        self.recent: Deque[float] = deque(maxlen=RECENT_SAMPLES)
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += value
+        self.count += 1
+        self.recent.append(value)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Percentile (0-1) over the recent window, or None if empty."""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class Metrics:
+    """Registry of counters, gauges and histograms.
+
+    Series are keyed by metric name plus labels::
+
+        metrics.inc("reminder_deliveries_total", route="dm", result="sent")
+        metrics.observe("reminder_delivery_lag_seconds", 0.8)
+        with metrics.timer("reminder_storage_seconds", op="update_reminders"):
+            ...
+    """
+
+    def __init__(self):
+        self._help: Dict[str, Tuple[str, str]] = {}  # name -> (type, help)
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._gauges: Dict[str, Callable[[], float]] = {}
+        self._buckets: Dict[str, Tuple[float, ...]] = {}
+
+        self.describe(
+            DELIVERY_LAG,
+            "histogram",
+            "Seconds between a reminder's remind_at and its successful send.",
+            buckets=LAG_BUCKETS,
+        )
+        self.describe(
+            SEND_LATENCY, "histogram", "Duration of each Discord send attempt, by route."
+        )
+        self.describe(
+            SEND_ERRORS, "counter", "Failed Discord send attempts, by route and error."
+        )
+        self.describe(
+            DELIVERIES, "counter", "Reminders delivered or dropped, by route and result."
+        )
+        self.describe(
+            STORAGE_LATENCY, "histogram", "Duration of storage calls made by the scheduler."
+        )
+        self.describe(
+            SEND_QUEUE_WAIT,
+            "histogram",
+            "Seconds a send waited for rate limits and a slot, by priority.",
+        )
+
+    def describe(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        """Register a metric's type (counter/histogram) and help text."""
+        self._help[name] = (kind, help_text)
+        if kind == "histogram":
+            self._buckets[name] = buckets
+
+    def gauge(self, name: str, func: Callable[[], float], help_text: str = ""):
+        """Register a gauge whose value is read from ``func`` at export time."""
+        self._help[name] = ("gauge", help_text)
+        self._gauges[name] = func
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        series = self._counters.setdefault(name, {})
+        key = _labels(labels)
+        series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels):
+        series = self._histograms.setdefault(name, {})
+        key = _labels(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram(
+                self._buckets.get(name, LATENCY_BUCKETS)
+            )
+        histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """Observe the wall time of the ``with`` block into histogram ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def counter_values(self, name: str) -> Dict[Labels, float]:
+        return dict(self._counters.get(name, {}))
+
+    def histograms(self, name: str) -> Dict[Labels, Histogram]:
+        return dict(self._histograms.get(name, {}))
+
+    def gauge_value(self, name: str) -> Optional[float]:
+        func = self._gauges.get(name)
+        return func() if func else None
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        names = sorted(
+            set(self._help) | set(self._counters) | set(self._histograms)
+        )
+        for name in names:
+            kind, help_text = self._help.get(
+                name, ("histogram" if name in self._histograms else "counter", "")
+            )
+            if help_text:
+                lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+            if kind == "gauge" and name in self._gauges:
+                try:
+                    lines.append(f"{name} {_format_value(self._gauges[name]())}")
+                except Exception as e:
+                    logger.error(f"Gauge {name} failed: {e}")
+            for labels, value in sorted(self._counters.get(name, {}).items()):
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+            for labels, histogram in sorted(self._histograms.get(name, {}).items()):
+                cumulative = 0
+                bounds = histogram.buckets + (float("inf"),)
+                for bound, count in zip(bounds, histogram.counts):
+                    cumulative += count
+                    le = _format_labels(labels, ("le", _format_value(bound)))
+                    lines.append(f"{name}_bucket{le} {cumulative}")
+                lines.append(
+                    f"{name}_sum{_format_labels(labels)} {_format_value(histogram.total)}"
+                )
+                lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """Serves ``GET /metrics`` from a ``Metrics`` registry on a local port."""
+
+    def __init__(self, metrics: Metrics, host: str = "127.0.0.1", port: int = 9108):
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        return web.Response(text=self.metrics.render(), content_type="text/plain")
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        logger.info(f"Metrics endpoint listening on http://{self.host}:{self.port}/metrics")
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
@@ -1,42 +1,200 @@
 """Reminder service for managing reminders."""
 
 import asyncio
+import heapq
+import itertools
 import logging
+import time
 import discord
 import pytz
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
 from discord.ext import commands
+from services.delivery import DeliveryPool
+from services.metrics import (
+    DELIVERIES,
+    DELIVERY_LAG,
+    QUEUE_DEPTH,
+    STORAGE_LATENCY,
+    Metrics,
+)
+from services.resolver import UserResolver
+from services.scheduler import DueQueue
+from services.sharding import RENEW_INTERVAL, ShardLeaseManager, shard_of
+from utils.async_store import AsyncDataManager
+from utils.delivery_journal import SENT, DeliveryJournal, DeliveryKey, PendingDelivery
+from utils.embeds import create_reminder_embed
+from utils.reminder_record import Reminder, format_epoch
 
 UTC = pytz.UTC
 
+# Upper bound on a single scheduler sleep, in seconds
+MAX_SLEEP = 300
+# Delay before retrying a reminder whose processing raised, in seconds
+RETRY_DELAY = 60
+# Discord limits per message
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+# Recent messages searched for a reminder whose send outcome was lost in a crash
+RECOVERY_HISTORY_LIMIT = 100
+# Slack for the claim time when searching history, in seconds
+RECOVERY_CLOCK_SKEW = 5
+
 logger = logging.getLogger(__name__)
 
 
 class ReminderService:
-    """Service for managing and sending reminders."""
-
-    def __init__(self, bot: commands.Bot, data_manager):
+    """Service for managing and sending reminders.
+
+    With ``shards``, several processes share one SQLite store and each only
+    delivers reminders in the shards it holds leases on. Reminders created
+    or edited by another process reach the owner through a periodic poll of
+    the store for anything due within the next few renewal periods.
+
+    ``data_manager`` may be an ``AsyncDataManager`` or a plain store, which
+    is then wrapped; storage calls never run on the event loop. Storage
+    speaks the JSON dict format; the scheduler converts to compact
+    ``Reminder`` records (integer due times) as soon as it reads them.
+
+    With a ``journal``, every delivery is recorded as claimed before it is
+    sent, sent once Discord accepts it, and advanced once the store has
+    moved past it. On startup ``_recover`` settles whatever the previous
+    run left open, so a crash (even ``kill -9``) neither drops nor repeats
+    a reminder. Journals are per process, so when sharded, overdue
+    reminders in shards taken over from another worker are checked against
+    their destination's history instead (``_check_inherited``).
+    """
+
+    def __init__(
+        self,
+        bot: commands.Bot,
+        data_manager,
+        delivery: Optional[DeliveryPool] = None,
+        metrics: Optional[Metrics] = None,
+        shards: Optional[ShardLeaseManager] = None,
+        journal: Optional[DeliveryJournal] = None,
+    ):
         self.bot = bot
+        if not isinstance(data_manager, AsyncDataManager):
+            data_manager = AsyncDataManager(data_manager)
         self.data = data_manager
+        self.metrics = metrics or Metrics()
+        self.delivery = delivery or DeliveryPool(metrics=self.metrics)
+        self.resolver = UserResolver(bot)
+        self.shards = shards
+        self.journal = journal
+        # Acquired shards whose overdue reminders haven't been checked
+        # against Discord yet (see _check_inherited); nothing in them is sent
+        self._unchecked_shards: Set[int] = set()
         self._running = False
         self._task = None
+        self._lease_task = None
+        self._queue = DueQueue()
+        self._wakeup = asyncio.Event()
+        self.metrics.gauge(
+            QUEUE_DEPTH, lambda: len(self._queue), "Reminders in the due-time queue."
+        )
 
     def start(self):
         """Start the reminder checker."""
         if not self._running:
             self._running = True
+            if self.shards:
+                self._lease_task = asyncio.create_task(self._maintain_leases())
             self._task = asyncio.create_task(self._check_reminders())
             logger.info("Reminder service started")
 
-    def stop(self):
-        """Stop the reminder checker."""
+    async def stop(self):
+        """Stop the reminder checker and wait for its tasks to unwind.
+
+        Await this before closing storage: the lease task still releases
+        its shards on the way out.
+        """
         if self._running:
             self._running = False
-            if self._task:
-                self._task.cancel()
+            # Leases are released as the lease task unwinds
+            tasks = [task for task in (self._task, self._lease_task) if task]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
             logger.info("Reminder service stopped")
 
+    async def _storage(self, op: str, *args, **kwargs):
+        """Await ``self.data.<op>``, recording how long it took."""
+        with self.metrics.timer(STORAGE_LATENCY, op=op):
+            return await getattr(self.data, op)(*args, **kwargs)
+
+    async def _journal_write(self, op: str, *args):
+        """Call ``self.journal.<op>`` on the storage thread (fsyncs; never on the loop)."""
+        if self.journal is not None:
+            await self.data.run(getattr(self.journal, op), *args)
+
+    async def _load_schedule(self):
+        """Build the due-time queue from storage (one full read at startup)."""
+        reminders = await self._storage("get_all_reminders")
+        self._queue.clear()
+        for data in reminders:
+            reminder = self._record(data)
+            if reminder:
+                self._schedule(reminder)
+        logger.info(f"Scheduled {len(self._queue)} reminder(s)")
+
+    def _owns(self, reminder_id: str) -> bool:
+        """True if this process delivers ``reminder_id`` (always, unsharded)."""
+        return self.shards is None or self.shards.owns(reminder_id)
+
+    def _begin(self, reminder_id: str) -> bool:
+        """Start delivering ``reminder_id`` if this process owns it.
+
+        While sharded, its shard is not handed to another worker until
+        ``_finish``.
+        """
+        if self.shards is None:
+            return True
+        if shard_of(reminder_id, self.shards.shard_count) in self._unchecked_shards:
+            return False  # Sent once its shard has been checked
+        return self.shards.begin(reminder_id)
+
+    def _finish(self, reminder_ids: List[str]):
+        """End deliveries started with ``_begin`` (sent, failed or skipped)."""
+        if self.shards is not None:
+            for reminder_id in reminder_ids:
+                self.shards.finish(reminder_id)
+
+    @staticmethod
+    def _record(data: Optional[Dict[str, Any]]) -> Optional[Reminder]:
+        """Convert a stored reminder dict, logging (and skipping) bad ones."""
+        if not data:
+            return None
+        try:
+            return Reminder.from_dict(data)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error(f"Invalid reminder {data.get('id')}: {e}")
+            return None
+
+    def _schedule(self, reminder: Reminder):
+        """Add or move a reminder in the due-time queue."""
+        if not self._owns(reminder.id):
+            self._queue.remove(reminder.id)
+            return
+        if self._queue.push(reminder.id, reminder.due):
+            self._wakeup.set()
+
+    async def reschedule(self, reminder_id: str):
+        """Re-read a reminder after it was edited and move it in the queue."""
+        reminder = self._record(
+            await self._storage("get_reminder_by_id", reminder_id)
+        )
+        if reminder:
+            self._schedule(reminder)
+        else:
+            self.unschedule(reminder_id)
+
+    def unschedule(self, reminder_id: str):
+        """Drop a cancelled reminder from the queue."""
+        if self._queue.remove(reminder_id):
+            self._wakeup.set()
+
     async def create_reminder(self, reminder_data: Dict[str, Any]) -> str:
         """Create a new reminder."""
         # Convert datetime to string if needed
@@ -44,7 +202,8 @@ class ReminderService:
         if isinstance(time_value, datetime):
             time_value = time_value.isoformat()
 
-        reminder_id = self.data.add_reminder(
+        reminder_id = await self._storage(
+            "add_reminder",
             user_id=int(reminder_data["user_id"]),
             message=reminder_data["message"],
             remind_at=time_value,
@@ -54,50 +213,310 @@ class ReminderService:
             recurring=reminder_data.get("recurring"),
             notes=reminder_data.get("notes"),
         )
+        await self.reschedule(reminder_id)
         return str(reminder_id)
 
+    async def create_reminders(self, items: List[Dict[str, Any]]) -> List[str]:
+        """Store many reminders in one batched write and schedule them.
+
+        Args:
+            items: Dicts keyed like the ``add_reminder`` arguments
+                (``remind_at`` as a UTC ISO string).
+        """
+        if not items:
+            return []
+        reminder_ids = await self._storage("add_reminders", items)
+        # Schedule from the input; re-reading each one would cost a read apiece
+        for reminder_id, item in zip(reminder_ids, items):
+            reminder = self._record({**item, "id": reminder_id})
+            if reminder:
+                self._schedule(reminder)
+        return reminder_ids
+
+    async def upcoming(
+        self, user_id: int, count: int = 10
+    ) -> List[Tuple[datetime, Reminder]]:
+        """A user's next ``count`` occurrences across all their reminders.
+
+        Recurring reminders are expanded lazily: each reminder contributes a
+        generator and ``heapq.merge`` pulls only as many occurrences as are
+        needed, so the cost is about O(R + count * log R) for R reminders.
+
+        Returns:
+            ``(when, reminder)`` pairs in chronological order (UTC).
+        """
+        reminders = await self._storage("get_user_reminders", user_id)
+        records = [r for r in map(self._record, reminders) if r]
+        streams = [self._occurrences(reminder) for reminder in records]
+        merged = heapq.merge(*streams, key=lambda item: item[0])
+        return list(itertools.islice(merged, count))
+
+    @staticmethod
+    def _occurrences(reminder: Reminder) -> Iterator[Tuple[datetime, Reminder]]:
+        """Yield ``(when, reminder)`` for the stored time, then each recurrence."""
+        current = reminder.remind_at
+        yield current, reminder
+        if reminder.rule:
+            for current in reminder.rule.iter_after(current):
+                yield current, reminder
+
+    async def _catch_up(self):
+        """Fast-forward recurring reminders that were missed while offline.
+
+        Each overdue recurring reminder jumps straight to its next future
+        occurrence and gets one digest message, instead of firing once per
+        missed period. All advanced reminders are saved in a single write.
+        """
+        started = time.perf_counter()
+        now = datetime.now(UTC)
+        now_ts = int(now.timestamp())
+        advanced: List[Reminder] = []
+        digests = []
+        started_ids: List[str] = []
+        try:
+            for data in await self._storage("get_all_reminders"):
+                if not data.get("recurring"):
+                    continue
+                reminder = self._record(data)
+                if not reminder or reminder.due > now_ts or not self._begin(reminder.id):
+                    continue
+                started_ids.append(reminder.id)
+
+                next_time, missed = reminder.rule.fast_forward(reminder.remind_at, now)
+                digests.append((reminder.copy(), missed))
+                reminder.due = int(next_time.timestamp())
+                advanced.append(reminder)
+
+            if not advanced:
+                return
+
+            if self.journal is None:
+                # Persist before sending: a crash mid-catch-up must not replay
+                # digests. With a journal, _recover covers that window instead.
+                await self._commit(advanced, [], [])
+            logger.info(
+                f"Caught up {len(advanced)} recurring reminder(s) "
+                f"({sum(m for _, m in digests)} missed occurrence(s)) "
+                f"in {time.perf_counter() - started:.3f}s"
+            )
+
+            await self._send_reminders(digests)
+            if self.journal is not None:
+                await self._commit(advanced, [], digests)
+        finally:
+            self._finish(started_ids)
+
+    async def _recover(self):
+        """Settle deliveries the previous run left open in the journal.
+
+        Only the journal's open entries are read, not every reminder. An
+        occurrence the store has already moved past is just closed. One
+        that was sent (journaled, or found in the destination's recent
+        history) is advanced or deleted without sending it again. Anything
+        else never reached Discord and is left for the scheduler to deliver.
+        """
+        if self.journal is None:
+            return
+        pending = await self.data.run(self.journal.pending)
+        if not pending:
+            return
+
+        settled: List[DeliveryKey] = []
+        sent: List[Reminder] = []
+        for delivery in pending:
+            reminder = self._record(
+                await self._storage("get_reminder_by_id", delivery.id)
+            )
+            if not reminder or reminder.due != delivery.due:
+                settled.append(delivery.key)  # Store already moved on (or cancelled)
+                continue
+            if delivery.state != SENT and not await self._was_sent(delivery):
+                continue
+            sent.append(reminder)
+            settled.append(delivery.key)
+
+        await self._skip_sent(sent)
+        await self._journal_write("mark_advanced", settled)
+        logger.info(
+            f"Recovered {len(pending)} open delivery(ies): "
+            f"{len(sent)} already sent, "
+            f"{len(pending) - len(settled)} to resend"
+        )
+
+    async def _skip_sent(self, reminders: List[Reminder]):
+        """Advance or delete reminders found already sent, without sending them."""
+        now = datetime.now(UTC)
+        advanced: List[Reminder] = []
+        finished = []
+        for reminder in reminders:
+            if reminder.rule:
+                next_time, _ = reminder.rule.fast_forward(reminder.remind_at, now)
+                reminder.due = int(next_time.timestamp())
+                advanced.append(reminder)
+            else:
+                finished.append(reminder.id)
+        if advanced:
+            await self._storage("update_reminders", [r.to_dict() for r in advanced])
+        if finished:
+            await self._storage("delete_reminders", finished)
+
+    async def _check_inherited(self):
+        """Skip overdue reminders in newly acquired shards that their previous owner sent.
+
+        A worker killed between sending and advancing a reminder records
+        that in its own journal, which the shard's next owner never reads.
+        So each overdue reminder in ``_unchecked_shards`` is looked up in
+        its destination's recent history (one or two history reads each)
+        and advanced or deleted if it is found there. The shards stay
+        unchecked (and undelivered) if this raises, and are retried at
+        the next lease renewal.
+        """
+        shards = self._unchecked_shards
+        if not shards:
+            return
+        now = datetime.now(UTC).isoformat()
+        inherited = [
+            reminder
+            for reminder in map(self._record, await self._storage("get_due_reminders", now))
+            if reminder and shard_of(reminder.id, self.shards.shard_count) in shards
+        ]
+        sent = [r for r in inherited if await self._sent_by_previous_owner(r)]
+        await self._skip_sent(sent)
+        if inherited:
+            logger.info(
+                f"Checked {len(inherited)} overdue reminder(s) in {len(shards)} "
+                f"acquired shard(s): {len(sent)} already sent"
+            )
+        self._unchecked_shards = set()
+
+    async def _sent_by_previous_owner(self, reminder: Reminder) -> bool:
+        """Look for ``reminder``'s current occurrence where it would have gone."""
+        routes: List[Tuple[str, int]] = [("dm", reminder.user_id)]
+        if reminder.channel_id:
+            channel = await self.resolver.get_channel(reminder.channel_id)
+            if channel is not None:
+                channel = (
+                    await self._apply_guild_defaults({reminder.channel_id: channel})
+                )[reminder.channel_id]
+            if isinstance(channel, discord.TextChannel):
+                routes.insert(0, ("channel", channel.id))
+        # Claims are made at or after the due time
+        for route in routes:
+            delivery = PendingDelivery(reminder.id, reminder.due, route, reminder.due)
+            if await self._was_sent(delivery):
+                return True
+        return False
+
+    async def _was_sent(self, delivery: PendingDelivery) -> bool:
+        """Look for a claimed reminder in its destination's recent messages.
+
+        A send can reach Discord even though the process died before
+        journaling it. False if it is not found or history can't be read.
+        """
+        me = getattr(self.bot, "user", None)
+        if me is None or not delivery.route:
+            return False
+        kind, destination_id = delivery.route
+        footer = f"Reminder ID: {delivery.id}"
+        after = datetime.fromtimestamp(delivery.claimed_at - RECOVERY_CLOCK_SKEW, UTC)
+        try:
+            if kind == "channel":
+                target = await self.resolver.get_channel(destination_id)
+            else:
+                user = await self.resolver.get_user(destination_id)
+                target = await self.resolver.get_dm_channel(user) if user else None
+            if target is None:
+                return False
+            async for message in target.history(
+                limit=RECOVERY_HISTORY_LIMIT, after=after
+            ):
+                if message.author.id == me.id and any(
+                    embed.footer.text == footer for embed in message.embeds
+                ):
+                    return True
+        except discord.HTTPException as e:
+            logger.warning(
+                f"Could not check whether reminder {delivery.id} was sent: {e}"
+            )
+        return False
+
+    async def _maintain_leases(self):
+        """Renew shard leases and pick up reminders written by other processes.
+
+        Runs apart from the delivery loop so a slow batch never lets our
+        leases lapse mid-send.
+        """
+        try:
+            while self._running:
+                try:
+                    await asyncio.sleep(RENEW_INTERVAL)
+                    changed = await self.data.run(self.shards.renew)
+                    if changed or self._unchecked_shards:
+                        # Shards moved (or an earlier check failed): check the
+                        # ones we took over, then rebuild from storage (also
+                        # drops lost ones)
+                        self._unchecked_shards |= self.shards.take_gained()
+                        await self._check_inherited()
+                        await self._load_schedule()
+                        self._wakeup.set()
+                    else:
+                        horizon = datetime.fromtimestamp(
+                            time.time() + 2 * RENEW_INTERVAL, UTC
+                        ).isoformat()
+                        for data in await self._storage(
+                            "get_due_reminders", horizon
+                        ):
+                            reminder = self._record(data)
+                            if reminder:
+                                self._schedule(reminder)
+                    # Other processes may run /setchannel; pick that up here
+                    # rather than on the delivery path
+                    await self.data.refresh_guild_config()
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logger.error(f"Error maintaining shard leases: {e}")
+        finally:
+            # Hand our shards over now instead of after the lease expires
+            try:
+                await self.data.run(self.shards.release)
+            except Exception as e:
+                logger.warning(f"Could not release shard leases: {e}")
+
     async def _check_reminders(self):
-        """Check for due reminders and send them."""
+        """Sleep until the next reminder is due, then send everything that is due."""
+        try:
+            if self.shards:
+                await self.data.run(self.shards.renew)
+                self._unchecked_shards |= self.shards.take_gained()
+            await self._recover()
+            await self._check_inherited()
+            await self._load_schedule()
+        except Exception as e:
+            logger.error(f"Error loading reminder schedule: {e}")
+
+        try:
+            await self._catch_up()
+        except Exception as e:
+            logger.error(f"Error catching up missed reminders: {e}")
+
         while self._running:
             try:
-                # Get all reminders
-                reminders = self.data.get_all_reminders()
-                # Use timezone-aware UTC so we can compare with stored remind_at (also UTC-aware)
-                now = datetime.now(UTC)
-
-                for reminder in reminders:
+                delay = self._queue.seconds_until_next(time.time())
+                if delay is None or delay > 0:
+                    # Wake early when a mutation changes the head of the queue.
+                    # The cap keeps us honest if the wall clock jumps.
+                    timeout = MAX_SLEEP if delay is None else min(delay, MAX_SLEEP)
+                    self._wakeup.clear()
                     try:
-                        # Parse reminder time (stored as UTC ISO from remind command)
-                        raw = reminder["remind_at"]
-                        remind_at = datetime.fromisoformat(
-                            raw.replace("Z", "+00:00")
-                        )
-                        if remind_at.tzinfo is None:
-                            remind_at = UTC.localize(remind_at)
-
-                        if remind_at <= now:
-                            await self._send_reminder(reminder)
-
-                            # Handle recurring reminders
-                            if reminder.get("recurring"):
-                                next_time = self._get_next_recurring_time(
-                                    remind_at, reminder["recurring"]
-                                )
-                                if next_time.tzinfo is None:
-                                    next_time = UTC.localize(next_time)
-                                reminder["remind_at"] = next_time.isoformat()
-                                self.data.update_reminder(reminder)
-                            else:
-                                # Delete one-time reminder
-                                self.data.delete_reminder(reminder["id"])
-
-                    except Exception as e:
-                        logger.error(
-                            f"Error processing reminder {reminder.get('id')}: {e}"
-                        )
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
 
-                # Sleep for 30 seconds before next check
-                await asyncio.sleep(30)
+                # Grouped by destination; DeliveryPool bounds concurrency and
+                # per-route rate
+                await self._process_due(self._queue.pop_due(time.time()))
 
             except asyncio.CancelledError:
                 break
@@ -105,291 +524,249 @@ class ReminderService:
                 logger.error(f"Error in reminder checker: {e}")
                 await asyncio.sleep(60)  # Wait longer if there's an error
 
-    async def _send_reminder(self, reminder: Dict[str, Any]):
-        """Send a reminder to the appropriate channel/user."""
+    async def _process_due(self, reminder_ids: List[str]):
+        """Send a batch of due reminders, then advance or delete them."""
+        now = datetime.now(UTC)
+        now_ts = int(now.timestamp())
+        batch: List[Tuple[Reminder, int]] = []
+        advanced: List[Reminder] = []
+        finished = []
+        started_ids: List[str] = []
         try:
-            user_id = int(reminder["user_id"])
-            user = self.bot.get_user(user_id)
-            if not user:
+            for reminder_id in reminder_ids:
                 try:
-                    user = await self.bot.fetch_user(user_id)
-                except Exception as fetch_e:
-                    logger.warning(
-                        f"User {user_id} not found for reminder {reminder['id']}: {fetch_e}"
+                    if not self._begin(reminder_id):
+                        continue  # Shard lease lost or handed over; the new owner sends it
+                    started_ids.append(reminder_id)
+                    reminder = self._record(
+                        await self._storage("get_reminder_by_id", reminder_id)
                     )
-                    return
-            if not user:
-                return
+                    if not reminder:
+                        continue  # Cancelled since it was scheduled
+
+                    if reminder.due > now_ts:
+                        # Edited to a later time by another writer; requeue
+                        self._schedule(reminder)
+                        continue
+
+                    # Handle recurring reminders
+                    if reminder.rule:
+                        # Skip straight past now even if we are running late
+                        next_time, missed = reminder.rule.fast_forward(
+                            reminder.remind_at, now
+                        )
+                        batch.append((reminder.copy(), missed))
+                        reminder.due = int(next_time.timestamp())
+                        advanced.append(reminder)
+                    else:
+                        batch.append((reminder, 1))
+                        finished.append(reminder_id)
+
+                except Exception as e:
+                    logger.error(f"Error processing reminder {reminder_id}: {e}")
+                    # Keep it in the queue so it is retried instead of silently dropped
+                    self._queue.push(reminder_id, int(time.time()) + RETRY_DELAY)
 
-            # Create embed for reminder
-            from utils.embeds import create_reminder_embed
+            try:
+                await self._send_reminders(batch)
+            except Exception as e:
+                logger.error(f"Failed to send reminder batch: {e}")
+
+            await self._commit(advanced, finished, batch)
+        finally:
+            # Only now may a drained shard go to another worker
+            self._finish(started_ids)
+
+    async def _commit(
+        self,
+        advanced: List[Reminder],
+        finished: List[str],
+        batch: List[Tuple[Reminder, int]],
+    ):
+        """Persist a delivered batch, then close it in the journal.
+
+        Advanced reminders are saved and requeued and finished one-time
+        reminders deleted before the ``advanced`` records are written.
+        """
+        if advanced:
+            await self._storage("update_reminders", [r.to_dict() for r in advanced])
+            for reminder in advanced:
+                self._schedule(reminder)
+        if finished:
+            # Delete one-time reminders
+            await self._storage("delete_reminders", finished)
+        await self._journal_write(
+            "mark_advanced", [(reminder.id, reminder.due) for reminder, _ in batch]
+        )
 
-            embed = create_reminder_embed(
-                reminder_id=reminder["id"],
-                message=reminder["message"],
-                remind_at=reminder["remind_at"],
-                recurring=reminder.get("recurring"),
-                notes=reminder.get("notes"),
+    def _build_embed(self, reminder: Reminder, missed: int = 1) -> discord.Embed:
+        """Build the delivery embed for a reminder.
+
+        ``missed`` > 1 turns it into a digest for occurrences that were
+        skipped while the bot was offline.
+        """
+        embed = create_reminder_embed(
+            reminder_id=reminder.id,
+            message=reminder.message,
+            remind_at=format_epoch(reminder.due),
+            recurring=reminder.recurring,
+            notes=reminder.notes,
+        )
+        embed.title = "⏰ Reminder!"
+        embed.color = discord.Color.blue()
+        if missed > 1:
+            embed.title = f"⏰ Reminder! (missed {missed} times)"
+            embed.add_field(
+                name="📭 Missed",
+                value=f"{missed} occurrences were due while the bot was offline",
+                inline=False,
             )
-            embed.title = "⏰ Reminder!"
-            embed.color = discord.Color.blue()
+        return embed
 
-            # Try to send to channel first, then DM
-            channel_id = reminder.get("channel_id")
-            if channel_id:
-                channel = self.bot.get_channel(int(channel_id))
-                if channel and isinstance(channel, discord.TextChannel):
-                    try:
-                        await channel.send(f"{user.mention}", embed=embed)
-                        logger.info(
-                            f"Sent reminder {reminder['id']} to channel {channel_id}"
-                        )
-                        return
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to send reminder {reminder['id']} to channel: {e}"
-                        )
-                        return
+    async def _send_reminders(self, batch: List[Tuple[Reminder, int]]):
+        """Send ``(reminder, missed)`` pairs, one message per destination.
 
-            # Fallback to DM
-            try:
-                await user.send(embed=embed)
-                logger.info(f"Sent reminder {reminder['id']} via DM to user {user_id}")
-            except Exception as dm_e:
-                logger.error(f"Failed to send reminder {reminder['id']} via DM: {dm_e}")
+        Reminders bound for the same channel (or the same user's DMs) are
+        grouped and sent as messages carrying up to 10 embeds each.
+        """
+        if not batch:
+            return
 
-        except Exception as e:
-            logger.error(f"Failed to send reminder {reminder.get('id')}: {e}")
-
-    def _get_next_recurring_time(
-        self, current_time: datetime, recurring: str
-    ) -> datetime:
-        """Calculate the next time for a recurring reminder."""
-        if recurring.startswith("daily"):
-            return current_time + timedelta(days=1)
-        elif recurring.startswith("weekly"):
-            # Parse specific days: "weekly on monday,wednesday,friday at 2pm"
-            if " on " in recurring:
-                days_part = recurring.split(" on ")[1].split(" at ")[0]
-                days = [d.strip().lower() for d in days_part.split(",")]
-                return self._get_next_weekday_time(current_time, days)
-            else:
-                return current_time + timedelta(weeks=1)
-        elif recurring.startswith("monthly"):
-            # Parse different monthly patterns
-            return self._parse_monthly_recurring(current_time, recurring)
-        else:
-            # Default to daily if unknown
-            return current_time + timedelta(days=1)
-
-    def _parse_monthly_recurring(
-        self, current_time: datetime, recurring: str
-    ) -> datetime:
-        """Parse monthly recurring patterns."""
-        # Pattern: "monthly on 15th at 10am"
-        if " on " in recurring and "th" in recurring:
-            day_part = recurring.split(" on ")[1].split(" at ")[0]
-            try:
-                day = int(
-                    day_part.replace("st", "")
-                    .replace("nd", "")
-                    .replace("rd", "")
-                    .replace("th", "")
-                )
-                return self._get_next_monthly_time(current_time, day)
-            except ValueError:
-                pass
-
-        # Pattern: "monthly on first monday at 10am"
-        if " on " in recurring and any(
-            week in recurring.lower()
-            for week in [
-                "monday",
-                "tuesday",
-                "wednesday",
-                "thursday",
-                "friday",
-                "saturday",
-                "sunday",
-            ]
-        ):
-            return self._parse_monthly_weekday_pattern(current_time, recurring)
-
-        # Pattern: "monthly on last friday at 2pm"
-        if " on " in recurring and "last" in recurring.lower():
-            return self._parse_monthly_last_pattern(current_time, recurring)
-
-        # Default to same day next month
-        return current_time + timedelta(days=30)
-
-    def _parse_monthly_weekday_pattern(
-        self, current_time: datetime, recurring: str
-    ) -> datetime:
-        """Parse patterns like 'first monday', 'second tuesday', etc."""
-        import re
-
-        # Extract the pattern: "monthly on first monday at 10am"
-        pattern_match = re.search(
-            r"on (first|second|third|fourth|fifth) (\w+) at", recurring.lower()
+        user_ids = {reminder.user_id for reminder, _ in batch}
+        resolved = await asyncio.gather(
+            *(self.resolver.get_user(uid) for uid in user_ids)
+        )
+        users = dict(zip(user_ids, resolved))
+        channel_ids = {reminder.channel_id for reminder, _ in batch if reminder.channel_id}
+        resolved_channels = await asyncio.gather(
+            *(self.resolver.get_channel(cid) for cid in channel_ids)
+        )
+        channels = await self._apply_guild_defaults(
+            dict(zip(channel_ids, resolved_channels))
         )
-        if pattern_match:
-            ordinal, weekday = pattern_match.groups()
-            week_num = {"first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5}[
-                ordinal
-            ]
-
-            day_mapping = {
-                "monday": 0,
-                "tuesday": 1,
-                "wednesday": 2,
-                "thursday": 3,
-                "friday": 4,
-                "saturday": 5,
-                "sunday": 6,
-            }
-
-            target_weekday = day_mapping.get(weekday)
-            if target_weekday is not None:
-                return self._get_next_monthly_weekday_time(
-                    current_time, target_weekday, week_num
-                )
-
-        return current_time + timedelta(days=30)
-
-    def _parse_monthly_last_pattern(
-        self, current_time: datetime, recurring: str
-    ) -> datetime:
-        """Parse patterns like 'last friday', 'last tuesday', etc."""
-        import re
-
-        # Extract the pattern: "monthly on last friday at 2pm"
-        pattern_match = re.search(r"on last (\w+) at", recurring.lower())
-        if pattern_match:
-            weekday = pattern_match.group(1)
-
-            day_mapping = {
-                "monday": 0,
-                "tuesday": 1,
-                "wednesday": 2,
-                "thursday": 3,
-                "friday": 4,
-                "saturday": 5,
-                "sunday": 6,
-            }
-
-            target_weekday = day_mapping.get(weekday)
-            if target_weekday is not None:
-                return self._get_next_monthly_last_weekday_time(
-                    current_time, target_weekday
-                )
-
-        return current_time + timedelta(days=30)
-
-    def _get_next_monthly_weekday_time(
-        self, current_time: datetime, target_weekday: int, week_num: int
-    ) -> datetime:
-        """Get next occurrence of Nth weekday of month (e.g., 3rd Monday)."""
-        # Move to next month
-        next_month = current_time.replace(day=1)
-        if next_month.month == 12:
-            next_month = next_month.replace(year=next_month.year + 1, month=1)
-        else:
-            next_month = next_month.replace(month=next_month.month + 1)
 
-        # Find the Nth occurrence of the target weekday
-        weekday_count = 0
-        for day in range(1, 32):
-            try:
-                test_date = next_month.replace(day=day)
-                if test_date.weekday() == target_weekday:
-                    weekday_count += 1
-                    if weekday_count == week_num:
-                        return test_date.replace(
-                            hour=current_time.hour,
-                            minute=current_time.minute,
-                            second=0,
-                            microsecond=0,
-                        )
-            except ValueError:
-                break  # Invalid day (e.g., February 30)
-
-        # If not found, go to next month
-        return self._get_next_monthly_weekday_time(next_month, target_weekday, week_num)
-
-    def _get_next_monthly_last_weekday_time(
-        self, current_time: datetime, target_weekday: int
-    ) -> datetime:
-        """Get next occurrence of last weekday of month (e.g., last Friday)."""
-        # Move to next month
-        next_month = current_time.replace(day=1)
-        if next_month.month == 12:
-            next_month = next_month.replace(year=next_month.year + 1, month=1)
-        else:
-            next_month = next_month.replace(month=next_month.month + 1)
+        # route -> (target, [(reminder, embed, user)])
+        groups: Dict[Tuple[str, int], Tuple[Any, List]] = {}
+        for reminder, missed in batch:
+            user = users.get(reminder.user_id)
+            if not user:
+                logger.warning(f"Skipping reminder {reminder.id}: user not found")
+                self.metrics.inc(DELIVERIES, route="unknown", result="user_not_found")
+                continue
+
+            # Try to send to the channel (or its guild's default) first, then DM
+            route: Tuple[str, int] = ("dm", user.id)
+            target: Any = user
+            if reminder.channel_id:
+                channel = channels.get(reminder.channel_id)
+                if channel and isinstance(channel, discord.TextChannel):
+                    route, target = ("channel", channel.id), channel
 
-        # Find the last occurrence of the target weekday
-        last_occurrence = None
-        for day in range(1, 32):
-            try:
-                test_date = next_month.replace(day=day)
-                if test_date.weekday() == target_weekday:
-                    last_occurrence = test_date
-            except ValueError:
-                break  # Invalid day (e.g., February 30)
-
-        if last_occurrence:
-            return last_occurrence.replace(
-                hour=current_time.hour,
-                minute=current_time.minute,
-                second=0,
-                microsecond=0,
+            embed = self._build_embed(reminder, missed)
+            groups.setdefault(route, (target, []))[1].append((reminder, embed, user))
+
+        await asyncio.gather(
+            *(
+                self._send_chunk(route, target, chunk)
+                for route, (target, items) in groups.items()
+                for chunk in self._chunk_embeds(items)
             )
+        )
 
-        # Fallback
-        return next_month + timedelta(days=30)
-
-    def _get_next_weekday_time(
-        self, current_time: datetime, days: List[str]
-    ) -> datetime:
-        """Get next occurrence for specific weekdays."""
-        day_mapping = {
-            "monday": 0,
-            "tuesday": 1,
-            "wednesday": 2,
-            "thursday": 3,
-            "friday": 4,
-            "saturday": 5,
-            "sunday": 6,
-        }
-
-        target_days = [day_mapping[d] for d in days if d in day_mapping]
-        if not target_days:
-            return current_time + timedelta(weeks=1)  # Fallback
-
-        current_day = current_time.weekday()
-        days_ahead = min((day - current_day) % 7 for day in target_days)
-        if days_ahead == 0:
-            days_ahead = 7  # Next week if today
-
-        return current_time + timedelta(days=days_ahead)
-
-    def _get_next_monthly_time(self, current_time: datetime, day: int) -> datetime:
-        """Get next occurrence for specific day of month."""
-        next_month = current_time.replace(day=1)
-        if next_month.month == 12:
-            next_month = next_month.replace(year=next_month.year + 1, month=1)
+    async def _apply_guild_defaults(
+        self, channels: Dict[int, Any]
+    ) -> Dict[int, Any]:
+        """Swap each resolved channel for its guild's default channel, if set.
+
+        A guild's default channel receives every reminder set in that guild,
+        whichever channel it was set in (see /setchannel). The defaults come
+        from the in-memory guild config cache, so this never reads storage
+        per reminder. A default that no longer resolves to a text channel
+        is ignored.
+        """
+        defaults: Dict[int, Optional[int]] = {}
+        for channel in channels.values():
+            guild = getattr(channel, "guild", None)
+            if guild is not None and guild.id not in defaults:
+                defaults[guild.id] = await self.data.get_guild_default_channel(guild.id)
+
+        default_ids = {cid for cid in defaults.values() if cid}
+        if not default_ids:
+            return channels
+        resolved = await asyncio.gather(
+            *(self.resolver.get_channel(cid) for cid in default_ids)
+        )
+        targets = dict(zip(default_ids, resolved))
+
+        redirected = dict(channels)
+        for channel_id, channel in channels.items():
+            guild = getattr(channel, "guild", None)
+            target = targets.get(defaults.get(guild.id)) if guild is not None else None
+            if isinstance(target, discord.TextChannel):
+                redirected[channel_id] = target
+        return redirected
+
+    @staticmethod
+    def _chunk_embeds(items: List[Tuple[Reminder, discord.Embed, Any]]):
+        """Split items into messages of at most 10 embeds / 6000 embed characters."""
+        chunk: List[Tuple[Reminder, discord.Embed, Any]] = []
+        size = 0
+        for item in items:
+            embed_size = len(item[1])
+            if chunk and (
+                len(chunk) >= MAX_EMBEDS_PER_MESSAGE
+                or size + embed_size > MAX_EMBED_CHARS_PER_MESSAGE
+            ):
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(item)
+            size += embed_size
+        if chunk:
+            yield chunk
+
+    async def _send_chunk(
+        self,
+        route: Tuple[str, int],
+        target: Any,
+        chunk: List[Tuple[Reminder, discord.Embed, Any]],
+    ):
+        """Send one multi-embed message through the delivery pool."""
+        embeds = [embed for _, embed, _ in chunk]
+        ids = ", ".join(reminder.id for reminder, _, _ in chunk)
+        kind, destination_id = route
+        keys = [(reminder.id, reminder.due) for reminder, _, _ in chunk]
+        await self._journal_write("claim", keys, route)
+
+        if kind == "channel":
+            mentions = " ".join(dict.fromkeys(user.mention for _, _, user in chunk))
+            sent = await self.delivery.send(
+                route,
+                lambda: target.send(mentions, embeds=embeds),
+                operation_name=f"Reminder(s) {ids} to channel",
+            )
         else:
-            next_month = next_month.replace(month=next_month.month + 1)
-
-        # Handle cases where day doesn't exist (e.g., February 30)
-        max_day = (
-            next_month.replace(
-                month=next_month.month + 1 if next_month.month < 12 else 1,
-                year=next_month.year + 1 if next_month.month == 12 else next_month.year,
-                day=1,
+            dm_channel = await self.resolver.get_dm_channel(target)
+            sent = await self.delivery.send(
+                route,
+                lambda: dm_channel.send(embeds=embeds),
+                operation_name=f"Reminder(s) {ids} via DM",
             )
-            - timedelta(days=1)
-        ).day
 
-        target_day = min(day, max_day)
-        return next_month.replace(day=target_day)
+        if kind == "channel":
+            where = f"channel {destination_id}"
+        else:
+            where = f"DM to user {destination_id}"
+        if sent:
+            await self._journal_write("mark_sent", keys, getattr(sent, "id", None))
+            logger.info(f"Sent reminder(s) {ids} to {where}")
+            now = time.time()
+            for reminder, _, _ in chunk:
+                lag = now - reminder.due
+                self.metrics.observe(DELIVERY_LAG, max(lag, 0.0), route=kind)
+            self.metrics.inc(DELIVERIES, len(chunk), route=kind, result="sent")
+        else:
+            logger.error(f"Failed to send reminder(s) {ids} to {where}")
+            self.metrics.inc(DELIVERIES, len(chunk), route=kind, result="failed")
+            if kind == "dm":
+                # Re-resolve next time in case the cached DM channel went stale
+                self.resolver.forget(destination_id)
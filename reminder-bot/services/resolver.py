@@ -0,0 +1,109 @@
+"""Cached user, DM channel and channel resolution for reminder delivery."""
+
+import logging
+from typing import Optional
+
+import discord
+from discord.ext import commands
+
+from utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+USER_TTL = 3600
+# Users that 404 are remembered for a shorter time
+MISSING_USER_TTL = 600
+MAX_CACHED_USERS = 10000
+MAX_CACHED_CHANNELS = 5000
+
+
+class UserResolver:
+    """Resolves user IDs and DM channels, caching REST results.
+
+    ``bot.get_user`` only hits the member cache, which is sparse with
+    minimal intents, so most lookups would otherwise fall through to
+    ``fetch_user`` (REST) and an implicit DM channel creation per send.
+    Fetched users and opened DM channels are kept in TTL/LRU caches, and
+    users that 404 are negatively cached. Channels get the same treatment,
+    which matters for headless workers (``worker.py``) that have no
+    gateway cache at all.
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self._users: TTLCache[discord.abc.User] = TTLCache(MAX_CACHED_USERS, USER_TTL)
+        self._missing: TTLCache[bool] = TTLCache(MAX_CACHED_USERS, MISSING_USER_TTL)
+        self._dm_channels: TTLCache[discord.DMChannel] = TTLCache(
+            MAX_CACHED_USERS, USER_TTL
+        )
+        self._channels: TTLCache[discord.abc.GuildChannel] = TTLCache(
+            MAX_CACHED_CHANNELS, USER_TTL
+        )
+        self._missing_channels: TTLCache[bool] = TTLCache(
+            MAX_CACHED_CHANNELS, MISSING_USER_TTL
+        )
+
+    async def get_user(self, user_id: int) -> Optional[discord.abc.User]:
+        """Get a user from the gateway cache, our cache, or REST (in that order)."""
+        user = self.bot.get_user(user_id) or self._users.get(user_id)
+        if user:
+            return user
+        if self._missing.get(user_id):
+            return None
+
+        try:
+            user = await self.bot.fetch_user(user_id)
+        except discord.NotFound:
+            logger.warning(f"User {user_id} not found; caching miss")
+            self._missing.set(user_id, True)
+            return None
+        except Exception as fetch_e:
+            # Transient failure: don't cache, try again next time
+            logger.warning(f"Failed to fetch user {user_id}: {fetch_e}")
+            return None
+
+        self._users.set(user_id, user)
+        return user
+
+    async def get_dm_channel(self, user: discord.abc.User) -> discord.abc.Messageable:
+        """Get (or open once) the DM channel for a user.
+
+        Falls back to the user itself, which opens the channel on send.
+        """
+        channel = getattr(user, "dm_channel", None) or self._dm_channels.get(user.id)
+        if channel:
+            return channel
+        try:
+            channel = await user.create_dm()
+        except Exception as e:
+            logger.warning(f"Failed to open DM channel for user {user.id}: {e}")
+            return user
+        self._dm_channels.set(user.id, channel)
+        return channel
+
+    async def get_channel(self, channel_id: int):
+        """Get a channel from the gateway cache, our cache, or REST (in that order)."""
+        channel = self.bot.get_channel(channel_id) or self._channels.get(channel_id)
+        if channel:
+            return channel
+        if self._missing_channels.get(channel_id):
+            return None
+
+        try:
+            channel = await self.bot.fetch_channel(channel_id)
+        except (discord.NotFound, discord.Forbidden) as e:
+            logger.warning(f"Channel {channel_id} unavailable ({e}); caching miss")
+            self._missing_channels.set(channel_id, True)
+            return None
+        except Exception as fetch_e:
+            logger.warning(f"Failed to fetch channel {channel_id}: {fetch_e}")
+            return None
+
+        self._channels.set(channel_id, channel)
+        return channel
+
+    def forget(self, user_id: int):
+        """Drop cached state for a user (e.g. after a send failure)."""
+        self._users.pop(user_id)
+        self._missing.pop(user_id)
+        self._dm_channels.pop(user_id)
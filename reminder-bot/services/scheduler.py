@@ -0,0 +1,95 @@
+"""Due-time priority queue for the reminder scheduler."""
+
+import heapq
+import itertools
+from typing import Dict, List, Optional, Tuple
+
+
+class DueQueue:
+    """Min-heap of reminder IDs keyed on due time.
+
+    Rescheduling or removing a reminder does not search the heap; the old
+    heap entry is left in place and skipped when it reaches the top (lazy
+    invalidation). Every mutation is O(log N).
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, str]] = []
+        # reminder_id -> (due, seq) of the live heap entry
+        self._entries: Dict[str, Tuple[float, int]] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, reminder_id: str) -> bool:
+        return reminder_id in self._entries
+
+    def clear(self):
+        """Remove every entry."""
+        self._heap.clear()
+        self._entries.clear()
+
+    def push(self, reminder_id: str, due: float) -> bool:
+        """Schedule (or reschedule) a reminder.
+
+        Returns:
+            True if the earliest due time changed and a sleeping
+            scheduler should wake up.
+        """
+        head_before = self.peek()
+        seq = next(self._counter)
+        self._entries[reminder_id] = (due, seq)
+        heapq.heappush(self._heap, (due, seq, reminder_id))
+        self._maybe_compact()
+        return head_before is None or due < head_before[0]
+
+    def remove(self, reminder_id: str) -> bool:
+        """Unschedule a reminder.
+
+        Returns:
+            True if the removed reminder was at the head of the queue.
+        """
+        head_before = self.peek()
+        if self._entries.pop(reminder_id, None) is None:
+            return False
+        self._maybe_compact()
+        return head_before is not None and head_before[1] == reminder_id
+
+    def peek(self) -> Optional[Tuple[float, str]]:
+        """Return ``(due, reminder_id)`` of the earliest live entry."""
+        heap = self._heap
+        while heap:
+            due, seq, reminder_id = heap[0]
+            if self._entries.get(reminder_id) == (due, seq):
+                return due, reminder_id
+            heapq.heappop(heap)  # stale entry
+        return None
+
+    def seconds_until_next(self, now: float) -> Optional[float]:
+        """Seconds until the next reminder is due (0 if overdue), or None if empty."""
+        head = self.peek()
+        if head is None:
+            return None
+        return max(0.0, head[0] - now)
+
+    def pop_due(self, now: float) -> List[str]:
+        """Remove and return all reminder IDs due at or before ``now``, earliest first."""
+        due_ids = []
+        while True:
+            head = self.peek()
+            if head is None or head[0] > now:
+                break
+            heapq.heappop(self._heap)
+            del self._entries[head[1]]
+            due_ids.append(head[1])
+        return due_ids
+
+    def _maybe_compact(self):
+        """Rebuild the heap when stale entries outnumber live ones."""
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+            self._heap = [
+                (due, seq, reminder_id)
+                for reminder_id, (due, seq) in self._entries.items()
+            ]
+            heapq.heapify(self._heap)
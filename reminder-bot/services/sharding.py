@@ -0,0 +1,189 @@
+"""Lease-based shard ownership for running several scheduler processes.
+
+Reminder IDs are hashed onto ``shard_count`` contiguous ranges of a 32-bit
+hash. Each worker process holds renewable leases on a fair share of the
+shards in the shared SQLite store and only delivers reminders in the
+shards it holds. A worker that stops renewing (crashed, partitioned) loses
+its shards once the lease expires, and the remaining workers pick them up
+on their next renewal.
+
+When a new worker joins, shards beyond an old owner's fair share are
+drained before they are handed over: the old owner stops starting new
+deliveries for them at once but keeps renewing their leases until every
+delivery it already started there has finished, and only then releases
+them. So two workers never deliver the same shard at the same time.
+
+A worker that dies instead leaves nothing behind for the new owner: its
+delivery journal is its own. Newly acquired shards are therefore reported
+by ``take_gained`` so the scheduler can check their overdue reminders
+against Discord before delivering them.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+import zlib
+from typing import Callable, Dict, FrozenSet, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Number of hash ranges; fixed for the lifetime of a deployment
+DEFAULT_SHARD_COUNT = 16
+# Lease lifetime and renewal period, in seconds
+LEASE_TTL = 30.0
+RENEW_INTERVAL = 10.0
+# Stop delivering this long before our lease actually expires, so a
+# takeover never overlaps with an in-flight batch
+LEASE_SAFETY_MARGIN = 5.0
+
+
+def shard_of(reminder_id: str, shard_count: int) -> int:
+    """Map a reminder ID to its shard (contiguous ranges of crc32)."""
+    return (zlib.crc32(reminder_id.encode("utf-8")) * shard_count) >> 32
+
+
+class ShardLeaseManager:
+    """Tracks which shards this process owns.
+
+    Args:
+        store: A ``SQLiteDataManager`` (leases live in its database).
+        shard_count: Number of shards; must match across workers.
+        worker_id: Unique name for this process (defaults to host:pid:random).
+        lease_ttl: Seconds a lease stays valid without renewal.
+        clock: Wall-clock source; leases are compared across processes, so
+            hosts sharing a database need synchronized clocks.
+    """
+
+    def __init__(
+        self,
+        store,
+        shard_count: int = DEFAULT_SHARD_COUNT,
+        worker_id: Optional[str] = None,
+        lease_ttl: float = LEASE_TTL,
+        clock: Callable[[], float] = time.time,
+    ):
+        if not hasattr(store, "renew_shard_leases"):
+            raise ValueError("Sharded scheduling requires REMINDER_STORAGE=sqlite")
+        self.store = store
+        self.shard_count = shard_count
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self.lease_ttl = lease_ttl
+        self._clock = clock
+        self._owned: FrozenSet[int] = frozenset()
+        # Leased shards beyond our fair share, waiting for in-flight
+        # deliveries to finish before they are released
+        self._draining: FrozenSet[int] = frozenset()
+        # shard -> deliveries started (``begin``) and not yet ``finish``ed
+        self._in_flight: Dict[int, int] = {}
+        # Shards acquired since the last ``take_gained``
+        self._gained: Set[int] = set()
+        # ``begin`` runs on the event loop, ``renew`` on the storage thread
+        self._lock = threading.Lock()
+        self._valid_until = 0.0
+
+    @property
+    def owned(self) -> FrozenSet[int]:
+        """Shards we deliver as of the last renewal (empty once the lease lapses).
+
+        Excludes shards being drained for handoff.
+        """
+        if self._clock() >= self._valid_until:
+            return frozenset()
+        return self._owned
+
+    def renew(self) -> bool:
+        """Renew leases and rebalance.
+
+        Drained shards with no deliveries in flight are released; shards
+        beyond our fair share start draining.
+
+        Returns:
+            True if the set of owned shards changed.
+        """
+        now = self._clock()
+        with self._lock:
+            release = [s for s in self._draining if not self._in_flight.get(s)]
+        try:
+            held, share = self.store.renew_shard_leases(
+                self.worker_id, self.shard_count, now, self.lease_ttl, release
+            )
+        except Exception as e:
+            # Keep the current leases until they lapse; retry next period
+            logger.error(f"Failed to renew shard leases: {e}")
+            return False
+
+        with self._lock:
+            # Hand over the highest shards; keep draining ones draining
+            draining = set(self._draining.intersection(held))
+            for shard in sorted(held, reverse=True):
+                if len(held) - len(draining) <= share:
+                    break
+                draining.add(shard)
+            shards = frozenset(held) - draining
+            changed = shards != self._owned
+            self._gained.update(shards - self._owned)
+            self._owned = shards
+            self._draining = frozenset(draining)
+            self._valid_until = now + self.lease_ttl - LEASE_SAFETY_MARGIN
+        if changed:
+            logger.info(
+                f"Worker {self.worker_id} now owns {len(shards)}/{self.shard_count} "
+                f"shard(s): {sorted(shards)}"
+                + (f", draining {sorted(draining)}" if draining else "")
+            )
+        return changed
+
+    def take_gained(self) -> FrozenSet[int]:
+        """Shards acquired since the last call (all owned ones at first).
+
+        Their previous owner may have sent reminders it never advanced.
+        """
+        with self._lock:
+            gained = frozenset(self._gained & self._owned)
+            self._gained.clear()
+        return gained
+
+    def owns(self, reminder_id: str) -> bool:
+        """True if this worker should deliver ``reminder_id`` right now."""
+        return shard_of(reminder_id, self.shard_count) in self.owned
+
+    def begin(self, reminder_id: str) -> bool:
+        """Start delivering ``reminder_id`` if we own its shard.
+
+        Its shard won't be handed over until the matching ``finish``.
+
+        Returns:
+            False if another worker delivers it (nothing to ``finish``).
+        """
+        shard = shard_of(reminder_id, self.shard_count)
+        with self._lock:
+            if shard not in self.owned:
+                return False
+            self._in_flight[shard] = self._in_flight.get(shard, 0) + 1
+        return True
+
+    def finish(self, reminder_id: str):
+        """Mark a delivery started with ``begin`` as done (sent or not)."""
+        shard = shard_of(reminder_id, self.shard_count)
+        with self._lock:
+            count = self._in_flight.get(shard, 0) - 1
+            if count > 0:
+                self._in_flight[shard] = count
+            else:
+                self._in_flight.pop(shard, None)
+
+    def release(self):
+        """Give up all leases (clean shutdown) so others take over immediately."""
+        try:
+            self.store.release_shard_leases(self.worker_id)
+        except Exception as e:
+            logger.error(f"Failed to release shard leases: {e}")
+        with self._lock:
+            self._owned = frozenset()
+            self._draining = frozenset()
+            self._valid_until = 0.0
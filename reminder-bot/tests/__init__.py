@@ -0,0 +1 @@
+"""Reminder Bot tests."""
@@ -0,0 +1,79 @@
+"""Tests for the async storage facade."""
+
+import asyncio
+import tempfile
+import threading
+import pytest
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.async_store import AsyncDataManager
+from utils.data_manager import DataManager
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary data directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+class TestAsyncDataManager:
+    """Tests for AsyncDataManager."""
+
+    def test_round_trip(self, temp_data_dir):
+        async def run():
+            data = AsyncDataManager(DataManager(temp_data_dir))
+            reminder_id = await data.add_reminder(
+                1, "Stretch", "2030-01-01T00:00:00+00:00", recurring="daily"
+            )
+            assert await data.update_reminder_notes(reminder_id, 1, "5 minutes")
+            reminder = await data.get_reminder(reminder_id, 1)
+            await data.set_guild_default_channel(42, 7)
+            channel = await data.get_guild_default_channel(42)
+            await data.close()
+            return reminder, channel
+
+        reminder, channel = asyncio.run(run())
+        assert reminder["notes"] == "5 minutes"
+        assert reminder["recurring"] == "daily"
+        assert channel == 7
+
+    def test_runs_off_the_event_loop_thread(self, temp_data_dir):
+        store = DataManager(temp_data_dir)
+        seen = []
+        original = store.get_all_reminders
+
+        def recording():
+            seen.append(threading.current_thread())
+            return original()
+
+        store.get_all_reminders = recording
+
+        async def run():
+            data = AsyncDataManager(store)
+            await data.get_all_reminders()
+            await data.close()
+
+        asyncio.run(run())
+        assert seen and seen[0] is not threading.main_thread()
+
+    def test_concurrent_writes_are_serialized(self, temp_data_dir):
+        """The JSON store's read-modify-write cycles must not interleave."""
+
+        async def run():
+            data = AsyncDataManager(DataManager(temp_data_dir))
+            await asyncio.gather(
+                *(
+                    data.add_reminder(1, f"r{i}", "2030-01-01T00:00:00+00:00")
+                    for i in range(50)
+                )
+            )
+            reminders = await data.get_user_reminders(1)
+            await data.close()
+            return reminders
+
+        assert len(asyncio.run(run())) == 50
@@ -0,0 +1,49 @@
+"""Smoke test for the synthetic-load benchmark (small sizes only)."""
+
+import pytest
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("discord")
+
+from benchmarks.bench_load import (
+    RECURRENCE_PATTERNS,
+    STORAGE_BACKENDS,
+    format_result,
+    generate_reminders,
+    run_benchmark,
+)
+
+
+class TestGenerateReminders:
+    """Tests for synthetic data generation."""
+
+    def test_covers_every_pattern(self):
+        reminders = generate_reminders(80, [1, 2, 3])
+        assert len(reminders) == 80
+        assert {r["recurring"] for r in reminders.values()} == set(RECURRENCE_PATTERNS)
+
+    def test_deterministic(self):
+        assert generate_reminders(10, [1], seed=3).keys() == generate_reminders(
+            10, [1], seed=3
+        ).keys()
+
+
+class TestRunBenchmark:
+    """End-to-end run against each storage backend."""
+
+    @pytest.mark.parametrize("storage", STORAGE_BACKENDS)
+    def test_small_run(self, storage):
+        result = run_benchmark(
+            200, storage=storage, due=40, window=0.3, mutation_samples=5, timeout=10
+        )
+
+        delivery = result["delivery"]
+        assert delivery["delivered"] == delivery["due"] == 40
+        assert delivery["lag"]["p50"] >= 0
+        assert result["memory"] > 0
+        assert set(result["mutations"]) == {"add", "update_time", "remove"}
+        assert "200 reminders" in format_result(result)
@@ -0,0 +1,57 @@
+"""Tests for the JSON DataManager."""
+
+import tempfile
+import pytest
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.data_manager import DataManager
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary data directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture
+def data_manager(temp_data_dir):
+    """Create a DataManager with temp directory."""
+    return DataManager(data_dir=temp_data_dir)
+
+
+class TestBatchMutations:
+    """Tests for batched reminder writes."""
+
+    def test_update_reminders(self, data_manager):
+        """update_reminders applies every known reminder and ignores unknown IDs."""
+        ids = [
+            data_manager.add_reminder(1, f"m{i}", "2026-01-01T00:00:00+00:00")
+            for i in range(3)
+        ]
+        batch = [data_manager.get_reminder_by_id(rid) for rid in ids]
+        for reminder in batch:
+            reminder["remind_at"] = "2026-02-01T00:00:00+00:00"
+        data_manager.update_reminders(batch + [{"id": "missing"}])
+
+        reminders = data_manager.get_reminders()
+        assert sorted(reminders) == sorted(ids)
+        assert {r["remind_at"] for r in reminders.values()} == {
+            "2026-02-01T00:00:00+00:00"
+        }
+
+    def test_delete_reminders(self, data_manager):
+        """delete_reminders removes only the listed reminders."""
+        keep = data_manager.add_reminder(1, "keep", "2026-01-01T00:00:00+00:00")
+        drop = data_manager.add_reminder(1, "drop", "2026-01-01T00:00:00+00:00")
+        data_manager.delete_reminders([drop, "missing"])
+
+        assert list(data_manager.get_reminders()) == [keep]
+
+    def test_update_reminder_time_reports_missing(self, data_manager):
+        """update_reminder_time returns False for unknown IDs."""
+        assert data_manager.update_reminder_time("missing", "2026-01-01") is False
@@ -0,0 +1,240 @@
+"""Tests for bounded-concurrency reminder delivery."""
+
+import asyncio
+import time
+import pytest
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("discord")
+
+from services.delivery import BATCH, INTERACTIVE, DeliveryPool, TokenBucket
+from services.metrics import SEND_QUEUE_DEPTH, SEND_QUEUE_WAIT, Metrics
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_throttle(self):
+        """A full bucket allows a burst, then paces further acquires."""
+
+        async def run():
+            bucket = TokenBucket(capacity=3, period=0.3)
+            start = time.monotonic()
+            for _ in range(4):
+                await bucket.acquire()
+            return time.monotonic() - start
+
+        elapsed = asyncio.run(run())
+        assert 0.08 <= elapsed < 0.5
+
+    def test_interactive_waiters_go_first(self):
+        """Queued interactive acquirers are served before earlier batch ones."""
+        order = []
+
+        async def run():
+            bucket = TokenBucket(capacity=1, period=0.05)
+            await bucket.acquire()
+
+            async def take(name, priority):
+                await bucket.acquire(priority)
+                order.append(name)
+
+            batch = [asyncio.create_task(take(f"b{i}", BATCH)) for i in range(3)]
+            await asyncio.sleep(0)
+            interactive = asyncio.create_task(take("i", INTERACTIVE))
+            await asyncio.gather(*batch, interactive)
+
+        asyncio.run(run())
+        assert order == ["i", "b0", "b1", "b2"]
+
+
+class TestDeliveryPool:
+    """Tests for DeliveryPool."""
+
+    def test_concurrency_limit(self):
+        """No more than ``concurrency`` sends are in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_send():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "ok"
+
+        async def run():
+            pool = DeliveryPool(concurrency=3, reserved=0)
+            return await asyncio.gather(
+                *(pool.send(("channel", i), fake_send) for i in range(12))
+            )
+
+        results = asyncio.run(run())
+        assert results == ["ok"] * 12
+        assert peak == 3
+
+    def test_failure_returns_none(self):
+        """A send that keeps failing returns None instead of raising."""
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        async def run():
+            pool = DeliveryPool(concurrency=1)
+            with pytest.MonkeyPatch.context() as mp:
+                mp.setattr(asyncio, "sleep", _no_sleep)
+                return await pool.send(("dm", 1), broken)
+
+        assert asyncio.run(run()) is None
+
+    def test_reserved_slot_for_interactive(self):
+        """Batch sends leave a slot free; an interactive send never waits on them."""
+        in_flight = 0
+        peak = 0
+        release = None
+
+        async def blocked_send():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await release.wait()
+            in_flight -= 1
+
+        async def reply():
+            return "reply"
+
+        async def run():
+            nonlocal release
+            release = asyncio.Event()
+            pool = DeliveryPool(concurrency=3, reserved=1)
+            batch = [
+                asyncio.create_task(pool.send(("channel", i), blocked_send))
+                for i in range(6)
+            ]
+            await asyncio.sleep(0.01)
+            answer = await asyncio.wait_for(
+                pool.send(("interaction", 1), reply, priority=INTERACTIVE), 1.0
+            )
+            release.set()
+            await asyncio.gather(*batch)
+            return answer
+
+        assert asyncio.run(run()) == "reply"
+        assert peak == 2
+
+    def test_interactive_jumps_batch_queue(self):
+        """With every slot busy, an interactive send is next once one frees up."""
+        order = []
+
+        async def run():
+            pool = DeliveryPool(concurrency=1, reserved=0)
+            gate = asyncio.Event()
+
+            async def first():
+                await gate.wait()
+                order.append("first")
+
+            def sender(name):
+                async def send():
+                    order.append(name)
+                return send
+
+            tasks = [asyncio.create_task(pool.send(("channel", 0), first))]
+            await asyncio.sleep(0)
+            tasks += [
+                asyncio.create_task(pool.send(("channel", i), sender(f"b{i}")))
+                for i in range(1, 4)
+            ]
+            await asyncio.sleep(0)
+            tasks.append(
+                asyncio.create_task(
+                    pool.send(("interaction", 1), sender("i"), priority=INTERACTIVE)
+                )
+            )
+            await asyncio.sleep(0)
+            gate.set()
+            await asyncio.gather(*tasks)
+
+        asyncio.run(run())
+        assert order == ["first", "i", "b1", "b2", "b3"]
+
+    def test_global_bucket(self):
+        """Sends to distinct routes are still paced by the global bucket."""
+
+        async def ok():
+            return "ok"
+
+        async def run():
+            pool = DeliveryPool(global_capacity=2, global_period=0.2)
+            start = time.monotonic()
+            await asyncio.gather(*(pool.send(("dm", i), ok) for i in range(4)))
+            return time.monotonic() - start
+
+        assert 0.15 <= asyncio.run(run()) < 0.6
+
+    def test_queue_metrics(self):
+        """Queued sends are exported as a gauge and their wait as a histogram."""
+        metrics = Metrics()
+        depths = []
+
+        async def ok():
+            await asyncio.sleep(0)  # Let the other sends queue up
+            depths.append(metrics.gauge_value(SEND_QUEUE_DEPTH))
+            return "ok"
+
+        async def run():
+            pool = DeliveryPool(concurrency=1, reserved=0, metrics=metrics)
+            await asyncio.gather(*(pool.send(("dm", i), ok) for i in range(3)))
+            await pool.send(("interaction", 1), ok, priority=INTERACTIVE)
+
+        asyncio.run(run())
+        assert depths == [2, 1, 0, 0]
+        waits = metrics.histograms(SEND_QUEUE_WAIT)
+        assert {dict(labels)["priority"]: h.count for labels, h in waits.items()} == {
+            "batch": 3,
+            "interactive": 1,
+        }
+
+    def test_respond_uses_followup_once_answered(self):
+        """respond() sends the initial response, then follow-ups."""
+        sent = []
+
+        class Response:
+            def __init__(self):
+                self.done = False
+
+            def is_done(self):
+                return self.done
+
+            async def send_message(self, content):
+                self.done = True
+                sent.append(("response", content))
+
+        class Followup:
+            async def send(self, content):
+                sent.append(("followup", content))
+
+        class Interaction:
+            id = 99
+            response = Response()
+            followup = Followup()
+
+        async def run():
+            pool = DeliveryPool()
+            await pool.respond(Interaction, "hello")
+            await pool.respond(Interaction, "again")
+
+        asyncio.run(run())
+        assert sent == [("response", "hello"), ("followup", "again")]
+
+
+_real_sleep = asyncio.sleep
+
+
+async def _no_sleep(delay, *args, **kwargs):
+    await _real_sleep(0)
@@ -0,0 +1,295 @@
+"""Tests for the delivery journal, crash recovery and atomic JSON saves."""
+
+import asyncio
+import json
+import tempfile
+import time
+import pytest
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.data_manager import DataManager
+from utils.delivery_journal import CLAIMED, SENT, DeliveryJournal
+from utils.reminder_record import Reminder
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary data directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def _ops(path):
+    return [json.loads(line)["op"] for line in Path(path).read_text().splitlines()]
+
+
+class TestDeliveryJournal:
+    """Tests for DeliveryJournal."""
+
+    def test_open_deliveries_survive_reopen(self, temp_data_dir):
+        path = Path(temp_data_dir) / "deliveries.journal"
+        journal = DeliveryJournal(path)
+        journal.claim([("a", 100), ("b", 100)], ("dm", 1))
+        journal.mark_sent([("a", 100)], 555)
+        journal.claim([("c", 200)], ("channel", 9))
+        journal.mark_sent([("c", 200)])
+        journal.mark_advanced([("c", 200)])
+
+        pending = {d.key: d for d in DeliveryJournal(path).pending()}
+        assert set(pending) == {("a", 100), ("b", 100)}
+        assert pending[("a", 100)].state == SENT
+        assert pending[("a", 100)].message_id == 555
+        assert pending[("b", 100)].state == CLAIMED
+        assert pending[("b", 100)].route == ("dm", 1)
+
+    def test_advancing_unknown_delivery_writes_nothing(self, temp_data_dir):
+        path = Path(temp_data_dir) / "deliveries.journal"
+        DeliveryJournal(path).mark_advanced([("a", 100)])
+        assert not path.exists()
+
+    def test_torn_last_line(self, temp_data_dir):
+        path = Path(temp_data_dir) / "deliveries.journal"
+        DeliveryJournal(path).claim([("a", 100)], ("dm", 1))
+        with open(path, "a") as f:
+            f.write('{"op":"sent","id":"a","du')
+
+        journal = DeliveryJournal(path)
+        assert [(d.key, d.state) for d in journal.pending()] == [(("a", 100), CLAIMED)]
+        # Rewritten clean, so later appends start on a fresh line
+        journal.mark_sent([("a", 100)])
+        assert _ops(path) == ["claimed", "sent"]
+
+    def test_compaction_keeps_only_open(self, temp_data_dir):
+        path = Path(temp_data_dir) / "deliveries.journal"
+        journal = DeliveryJournal(path, compact_every=10)
+        journal.claim([("open", 1)], ("dm", 1))
+        for i in range(20):
+            journal.claim([(f"r{i}", i)], ("dm", 1))
+            journal.mark_sent([(f"r{i}", i)])
+            journal.mark_advanced([(f"r{i}", i)])
+
+        assert len(_ops(path)) < 10
+        assert [d.key for d in DeliveryJournal(path).pending()] == [("open", 1)]
+
+
+class TestAtomicSave:
+    """reminders.json is replaced atomically."""
+
+    def test_failed_save_keeps_old_file(self, temp_data_dir):
+        store = DataManager(temp_data_dir)
+        store.add_reminder(1, "keep me", "2026-01-01T00:00:00+00:00")
+        before = store.reminders_file.read_text()
+
+        with pytest.raises(TypeError):
+            store._save_json(store.reminders_file, {"bad": object()})
+
+        assert store.reminders_file.read_text() == before
+        assert [p.name for p in Path(temp_data_dir).iterdir()] == ["reminders.json"]
+
+
+def _past(seconds=60):
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(time.time() - seconds))
+
+
+class TestRecovery:
+    """ReminderService settles open deliveries on startup."""
+
+    @pytest.fixture
+    def service_parts(self, temp_data_dir):
+        pytest.importorskip("discord")
+        from benchmarks.bench_load import FakeBot
+
+        store = DataManager(temp_data_dir)
+        journal = DeliveryJournal(Path(temp_data_dir) / "deliveries.journal")
+        return FakeBot([]), store, journal
+
+    def _run(self, bot, store, journal, body):
+        from services.reminder_service import ReminderService
+
+        async def run():
+            service = ReminderService(bot, store, journal=journal)
+            try:
+                return await body(service)
+            finally:
+                await service.data.close()
+
+        return asyncio.run(run())
+
+    def _due(self, store, reminder_id):
+        from utils.reminder_record import Reminder
+
+        return Reminder.from_dict(store.get_reminder_by_id(reminder_id)).due
+
+    def test_sent_is_not_resent(self, service_parts):
+        bot, store, journal = service_parts
+        once = store.add_reminder(1, "once", _past())
+        daily = store.add_reminder(1, "daily", _past(), recurring="daily at 9am")
+        keys = [(once, self._due(store, once)), (daily, self._due(store, daily))]
+        # Crashed after the send was journaled, before the store was updated
+        journal.claim(keys, ("dm", 1))
+        journal.mark_sent(keys, 1)
+
+        self._run(bot, store, journal, lambda service: service._recover())
+
+        assert bot.sent == []
+        assert store.get_reminder_by_id(once) is None
+        assert self._due(store, daily) > time.time()
+        assert journal.pending() == []
+
+    def test_unsent_is_delivered_once(self, service_parts):
+        bot, store, journal = service_parts
+        reminder_id = store.add_reminder(1, "once", _past())
+        # Crashed after claiming, before the send; history shows nothing
+        journal.claim([(reminder_id, self._due(store, reminder_id))], ("dm", 1))
+
+        async def body(service):
+            await service._recover()
+            assert store.get_reminder_by_id(reminder_id) is not None
+            await service._process_due([reminder_id])
+
+        self._run(bot, store, journal, body)
+
+        assert [ids for _, ids in bot.sent] == [[reminder_id]]
+        assert store.get_reminder_by_id(reminder_id) is None
+        assert journal.pending() == []
+
+    def test_claimed_found_in_history(self, service_parts):
+        bot, store, journal = service_parts
+        reminder_id = store.add_reminder(1, "once", _past())
+        journal.claim([(reminder_id, self._due(store, reminder_id))], ("dm", 1))
+
+        async def body(service):
+            async def was_sent(delivery):
+                return delivery.id == reminder_id
+
+            service._was_sent = was_sent
+            await service._recover()
+
+        self._run(bot, store, journal, body)
+
+        assert bot.sent == []
+        assert store.get_reminder_by_id(reminder_id) is None
+        assert journal.pending() == []
+
+    def test_store_already_advanced(self, service_parts):
+        bot, store, journal = service_parts
+        reminder_id = store.add_reminder(1, "daily", _past(), recurring="daily at 9am")
+        journal.claim([(reminder_id, self._due(store, reminder_id) - 86400)], ("dm", 1))
+
+        self._run(bot, store, journal, lambda service: service._recover())
+
+        assert bot.sent == []
+        assert journal.pending() == []
+
+    def test_delivery_is_journaled(self, service_parts):
+        bot, store, journal = service_parts
+        reminder_id = store.add_reminder(1, "once", _past())
+
+        self._run(bot, store, journal, lambda service: service._process_due([reminder_id]))
+
+        assert _ops(journal.path) == ["claimed", "sent", "advanced"]
+        assert journal.pending() == []
+
+
+class TestShardTakeover:
+    """Overdue reminders in shards taken over from a dead worker are checked
+    against Discord, since that worker's journal is never read."""
+
+    @pytest.fixture
+    def service_parts(self, temp_data_dir):
+        pytest.importorskip("discord")
+        from benchmarks.bench_load import FakeBot
+        from services.sharding import ShardLeaseManager
+        from utils.sqlite_store import SQLiteDataManager
+
+        store = SQLiteDataManager(temp_data_dir)
+        shards = ShardLeaseManager(store, 4, "new-owner")
+        journal = DeliveryJournal(Path(temp_data_dir) / "deliveries-new-owner.journal")
+        return FakeBot([]), store, shards, journal
+
+    def _run(self, service_parts, found, body):
+        from services.reminder_service import ReminderService
+
+        bot, store, shards, journal = service_parts
+
+        async def run():
+            service = ReminderService(bot, store, shards=shards, journal=journal)
+            checked = []
+
+            async def was_sent(delivery):
+                checked.append((delivery.id, delivery.route))
+                return delivery.id in found
+
+            service._was_sent = was_sent
+            try:
+                await service.data.run(shards.renew)
+                service._unchecked_shards |= shards.take_gained()
+                await body(service)
+                return checked
+            finally:
+                await service.data.close()
+
+        return asyncio.run(run())
+
+    def test_sent_by_dead_owner_is_not_resent(self, service_parts):
+        bot, store, _, _ = service_parts
+        once = store.add_reminder(1, "once", _past())
+        daily = store.add_reminder(1, "daily", _past(), recurring="daily at 9am")
+
+        async def body(service):
+            # Nothing in an unchecked shard is delivered
+            assert not service._begin(once)
+            await service._check_inherited()
+            await service._process_due([once, daily])
+            assert store.get_reminder_by_id(once) is None
+            assert Reminder.from_dict(store.get_reminder_by_id(daily)).due > time.time()
+
+        checked = self._run(service_parts, {once, daily}, body)
+
+        assert bot.sent == []
+        assert {rid for rid, _ in checked} == {once, daily}
+        assert all(route == ("dm", 1) for _, route in checked)
+
+    def test_unsent_is_delivered_once(self, service_parts):
+        bot, store, _, _ = service_parts
+        once = store.add_reminder(1, "once", _past())
+        later = store.add_reminder(1, "later", "2099-01-01T00:00:00+00:00")
+
+        async def body(service):
+            await service._check_inherited()
+            assert service._unchecked_shards == set()
+            await service._process_due([once])
+            assert store.get_reminder_by_id(later) is not None
+
+        checked = self._run(service_parts, set(), body)
+
+        # Only overdue reminders are looked up
+        assert [rid for rid, _ in checked] == [once]
+        assert [ids for _, ids in bot.sent] == [[once]]
+
+    def test_failed_check_is_retried(self, service_parts):
+        bot, store, _, _ = service_parts
+        once = store.add_reminder(1, "once", _past())
+
+        async def body(service):
+            check = service._sent_by_previous_owner
+
+            async def fail(reminder):
+                raise RuntimeError("storage unavailable")
+
+            service._sent_by_previous_owner = fail
+            with pytest.raises(RuntimeError):
+                await service._check_inherited()
+            assert service._unchecked_shards
+            assert not service._begin(once)
+
+            service._sent_by_previous_owner = check
+            await service._check_inherited()
+            await service._process_due([once])
+
+        self._run(service_parts, set(), body)
+        assert [ids for _, ids in bot.sent] == [[once]]
@@ -0,0 +1,127 @@
+"""Tests for the guild config cache and default-channel delivery."""
+
+import asyncio
+import tempfile
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("discord")
+
+from benchmarks.bench_load import FakeBot
+from services.reminder_service import ReminderService
+from utils.async_store import AsyncDataManager
+from utils.data_manager import DataManager
+from utils.reminder_record import Reminder
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary data directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def _counting_store(temp_data_dir):
+    store = DataManager(temp_data_dir)
+    store.loads = 0
+    original = store.get_config
+
+    def get_config():
+        store.loads += 1
+        return original()
+
+    store.get_config = get_config
+    return store
+
+
+class TestGuildConfigCache:
+    """Guild default channels are cached in AsyncDataManager."""
+
+    def test_lookups_hit_the_cache(self, temp_data_dir):
+        DataManager(temp_data_dir).set_guild_default_channel(1, 10)
+        store = _counting_store(temp_data_dir)
+
+        async def run():
+            data = AsyncDataManager(store)
+            found = [await data.get_guild_default_channel(g) for g in (1, 2, 1, 2)]
+            await data.close()
+            return found
+
+        assert asyncio.run(run()) == [10, None, 10, None]
+        assert store.loads == 1
+
+    def test_writes_invalidate(self, temp_data_dir):
+        store = _counting_store(temp_data_dir)
+
+        async def run():
+            data = AsyncDataManager(store)
+            found = [await data.get_guild_default_channel(1)]
+            await data.set_guild_default_channel(1, 10)
+            found.append(await data.get_guild_default_channel(1))
+            await data.clear_guild_default_channel(1)
+            found.append(await data.get_guild_default_channel(1))
+            await data.close()
+            return found
+
+        assert asyncio.run(run()) == [None, 10, None]
+        # One reload per lookup after a write, plus each write's own read
+        assert store.loads == 5
+
+    def test_refresh_picks_up_other_writers(self, temp_data_dir):
+        store = DataManager(temp_data_dir)
+
+        async def run():
+            data = AsyncDataManager(store)
+            found = [await data.get_guild_default_channel(1)]
+            # Another process changes the setting behind this one's back
+            store.set_guild_default_channel(1, 10)
+            found.append(await data.get_guild_default_channel(1))
+            await data.refresh_guild_config()
+            found.append(await data.get_guild_default_channel(1))
+            await data.close()
+            return found
+
+        assert asyncio.run(run()) == [None, None, 10]
+
+
+class TestDefaultChannelDelivery:
+    """Reminders created in a guild go to its default channel when set."""
+
+    def test_redirects_to_guild_default(self, temp_data_dir):
+        store = DataManager(temp_data_dir)
+        store.set_guild_default_channel(7, 200)
+        bot = FakeBot([100, 200, 300])
+        bot._channels[100].guild = SimpleNamespace(id=7)
+        bot._channels[200].guild = SimpleNamespace(id=7)
+        bot._channels[300].guild = SimpleNamespace(id=8)
+        targets = []
+
+        async def run():
+            service = ReminderService(bot, store)
+            original = service._send_chunk
+
+            async def record(route, target, chunk):
+                targets.append((route, [reminder.id for reminder, _, _ in chunk]))
+                await original(route, target, chunk)
+
+            service._send_chunk = record
+            await service._send_reminders(
+                [
+                    (Reminder("a", 1, "in guild 7", 0, channel_id=100), 1),
+                    (Reminder("b", 1, "in guild 8", 0, channel_id=300), 1),
+                    (Reminder("c", 1, "by DM", 0), 1),
+                ]
+            )
+            await service.data.close()
+
+        asyncio.run(run())
+        assert sorted(targets) == [
+            (("channel", 200), ["a"]),
+            (("channel", 300), ["b"]),
+            (("dm", 1), ["c"]),
+        ]
@@ -0,0 +1,113 @@
+"""Tests for scheduler metrics."""
+
+import asyncio
+import pytest
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("discord")
+
+import discord
+
+from services.delivery import DeliveryPool
+from services.metrics import (
+    DELIVERY_LAG,
+    QUEUE_DEPTH,
+    SEND_ERRORS,
+    SEND_LATENCY,
+    Histogram,
+    Metrics,
+)
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_buckets_and_percentiles(self):
+        histogram = Histogram((1.0, 5.0))
+        for value in (0.5, 2.0, 3.0, 10.0):
+            histogram.observe(value)
+
+        assert histogram.counts == [1, 2, 1]
+        assert histogram.count == 4
+        assert histogram.total == 15.5
+        assert histogram.percentile(0.5) == 3.0
+        assert Histogram((1.0,)).percentile(0.5) is None
+
+
+class TestMetrics:
+    """Tests for the registry and Prometheus rendering."""
+
+    def test_render(self):
+        metrics = Metrics()
+        metrics.gauge(QUEUE_DEPTH, lambda: 7, "Queue depth.")
+        metrics.inc(SEND_ERRORS, route="dm", error="http_403")
+        metrics.inc(SEND_ERRORS, route="dm", error="http_403")
+        metrics.observe(DELIVERY_LAG, 0.3, route="channel")
+
+        text = metrics.render()
+        assert "# TYPE reminder_queue_depth gauge\nreminder_queue_depth 7\n" in text
+        assert 'reminder_send_errors_total{error="http_403",route="dm"} 2' in text
+        assert 'reminder_delivery_lag_seconds_bucket{route="channel",le="0.25"} 0' in text
+        assert 'reminder_delivery_lag_seconds_bucket{route="channel",le="0.5"} 1' in text
+        assert 'reminder_delivery_lag_seconds_bucket{route="channel",le="+Inf"} 1' in text
+        assert 'reminder_delivery_lag_seconds_count{route="channel"} 1' in text
+
+    def test_label_escaping(self):
+        metrics = Metrics()
+        metrics.inc("custom_total", reason='say "hi"')
+        assert 'custom_total{reason="say \\"hi\\""} 1' in metrics.render()
+
+    def test_timer(self):
+        metrics = Metrics()
+        with metrics.timer("op_seconds", op="read"):
+            pass
+        (labels, histogram), = metrics.histograms("op_seconds").items()
+        assert labels == (("op", "read"),)
+        assert histogram.count == 1
+
+
+class TestDeliveryInstrumentation:
+    """DeliveryPool records per-attempt latency and errors."""
+
+    def test_records_attempts(self, monkeypatch):
+        async def no_sleep(_delay):
+            return None
+
+        monkeypatch.setattr(asyncio, "sleep", no_sleep)
+        metrics = Metrics()
+        pool = DeliveryPool(metrics=metrics)
+        calls = 0
+
+        async def flaky():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise asyncio.TimeoutError()
+            return "ok"
+
+        assert asyncio.run(pool.send(("dm", 1), flaky)) == "ok"
+
+        errors = metrics.counter_values(SEND_ERRORS)
+        assert errors == {(("error", "TimeoutError"), ("route", "dm")): 1}
+        (histogram,) = metrics.histograms(SEND_LATENCY).values()
+        assert histogram.count == 2
+
+    def test_http_errors_use_status(self):
+        metrics = Metrics()
+        pool = DeliveryPool(metrics=metrics)
+
+        class Response:
+            status = 403
+            reason = "Forbidden"
+
+        async def forbidden():
+            raise discord.Forbidden(Response(), "Missing Access")
+
+        assert asyncio.run(pool.send(("channel", 5), forbidden)) is None
+        assert metrics.counter_values(SEND_ERRORS) == {
+            (("error", "http_403"), ("route", "channel")): 1
+        }
@@ -0,0 +1,145 @@
+"""Tests for compiled recurrence rules."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.recurrence import (
+    LAST_WEEKDAY,
+    MONTH_DAY,
+    NTH_WEEKDAY,
+    WEEKDAYS_OF_WEEK,
+    parse_recurrence,
+)
+
+UTC = timezone.utc
+
+
+def dt(*args) -> datetime:
+    return datetime(*args, tzinfo=UTC)
+
+
+class TestParseRecurrence:
+    """Tests for parse_recurrence."""
+
+    def test_cached_by_string(self):
+        """The same string compiles to the same rule object."""
+        assert parse_recurrence("daily at 09:00am") is parse_recurrence("daily at 09:00am")
+
+    def test_weekly_days(self):
+        """Weekly day lists are parsed into sorted weekday numbers."""
+        rule = parse_recurrence("weekly on friday, monday at 02:00pm")
+        assert rule.kind == WEEKDAYS_OF_WEEK
+        assert rule.weekdays == (0, 4)
+
+    def test_month_day_suffixes(self):
+        """All ordinal suffixes are accepted for day-of-month rules."""
+        for text, day in [("1st", 1), ("2nd", 2), ("3rd", 3), ("15th", 15)]:
+            rule = parse_recurrence(f"monthly on {text} at 10:00am")
+            assert (rule.kind, rule.day) == (MONTH_DAY, day)
+
+    def test_monthly_weekday_patterns(self):
+        """Nth and last weekday patterns are recognised."""
+        rule = parse_recurrence("monthly on second tuesday at 03:00pm")
+        assert (rule.kind, rule.nth, rule.weekday) == (NTH_WEEKDAY, 2, 1)
+        rule = parse_recurrence("monthly on last friday at 02:00pm")
+        assert (rule.kind, rule.weekday) == (LAST_WEEKDAY, 4)
+
+
+class TestNextAfter:
+    """Tests for RecurrenceRule.next_after."""
+
+    def test_daily(self):
+        start = dt(2026, 3, 1, 16, 0)
+        assert parse_recurrence("daily at 09:00am").next_after(start) == start + timedelta(days=1)
+
+    def test_weekly_plain(self):
+        start = dt(2026, 3, 1, 16, 0)
+        assert parse_recurrence("weekly at 09:00am").next_after(start) == start + timedelta(weeks=1)
+
+    def test_weekly_days_includes_later_day_this_week(self):
+        """From Monday, a Mon/Wed/Fri rule moves to Wednesday, not next Monday."""
+        monday = dt(2026, 3, 2, 18, 0)
+        rule = parse_recurrence("weekly on monday,wednesday,friday at 06:00pm")
+        assert list(rule.iter_after(monday, 4)) == [
+            dt(2026, 3, 4, 18, 0),
+            dt(2026, 3, 6, 18, 0),
+            dt(2026, 3, 9, 18, 0),
+            dt(2026, 3, 11, 18, 0),
+        ]
+
+    def test_month_day_clamped(self):
+        """Day 31 clamps to the end of shorter months."""
+        rule = parse_recurrence("monthly on 31st at 10:00am")
+        assert rule.next_after(dt(2026, 1, 31, 10, 0)) == dt(2026, 2, 28, 10, 0)
+
+    def test_nth_weekday(self):
+        """First Monday of the following month."""
+        rule = parse_recurrence("monthly on first monday at 10:00am")
+        assert rule.next_after(dt(2026, 3, 2, 10, 0, 30)) == dt(2026, 4, 6, 10, 0)
+
+    def test_fifth_weekday_skips_short_months(self):
+        """A fifth Friday skips months that only have four."""
+        rule = parse_recurrence("monthly on fifth friday at 10:00am")
+        # January 2026 has a fifth Friday (30th); Feb-April do not, May does (29th)
+        assert rule.next_after(dt(2026, 1, 30, 10, 0)) == dt(2026, 5, 29, 10, 0)
+
+    def test_last_weekday(self):
+        """Last Friday of the following month, across a year boundary."""
+        rule = parse_recurrence("monthly on last friday at 02:00pm")
+        assert rule.next_after(dt(2025, 11, 28, 14, 0)) == dt(2025, 12, 26, 14, 0)
+        assert rule.next_after(dt(2025, 12, 26, 14, 0)) == dt(2026, 1, 30, 14, 0)
+
+    def test_iter_after_is_lazy(self):
+        """iter_after without a count is an unbounded generator."""
+        occurrences = parse_recurrence("daily at 09:00am").iter_after(dt(2026, 1, 1))
+        assert next(occurrences) == dt(2026, 1, 2)
+        assert next(occurrences) == dt(2026, 1, 3)
+
+
+class TestFastForward:
+    """Tests for RecurrenceRule.fast_forward."""
+
+    def _slow(self, rule, current, now):
+        missed = 1
+        while True:
+            current = rule.next_after(current)
+            if current > now:
+                return current, missed
+            missed += 1
+
+    def test_future_is_untouched(self):
+        rule = parse_recurrence("daily at 09:00am")
+        start = dt(2026, 3, 10, 9, 0)
+        assert rule.fast_forward(start, dt(2026, 3, 1)) == (start, 0)
+
+    def test_daily_week_of_downtime(self):
+        """A daily reminder missed for a week counts 8 occurrences (start day included)."""
+        rule = parse_recurrence("daily at 09:00am")
+        start = dt(2026, 3, 1, 9, 0)
+        assert rule.fast_forward(start, dt(2026, 3, 8, 12, 0)) == (dt(2026, 3, 9, 9, 0), 8)
+
+    def test_exact_boundary_counts_as_missed(self):
+        rule = parse_recurrence("daily at 09:00am")
+        start = dt(2026, 3, 1, 9, 0)
+        assert rule.fast_forward(start, dt(2026, 3, 2, 9, 0)) == (dt(2026, 3, 3, 9, 0), 2)
+
+    def test_matches_step_by_step(self):
+        """Closed-form skipping agrees with stepping one occurrence at a time."""
+        start = dt(2026, 1, 6, 14, 0)  # a Tuesday
+        now = dt(2026, 9, 17, 8, 30)
+        for text in [
+            "daily at 02:00pm",
+            "weekly at 02:00pm",
+            "weekly on monday,wednesday,friday at 02:00pm",
+            "weekly on tuesday at 02:00pm",
+            "monthly at 02:00pm",
+            "monthly on 31st at 02:00pm",
+            "monthly on fifth friday at 02:00pm",
+            "monthly on last sunday at 02:00pm",
+        ]:
+            rule = parse_recurrence(text)
+            assert rule.fast_forward(start, now) == self._slow(rule, start, now), text
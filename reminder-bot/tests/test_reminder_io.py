@@ -0,0 +1,244 @@
+"""Tests for reminder import/export and batched adds."""
+
+import asyncio
+import io
+import tempfile
+import pytest
+from datetime import datetime
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytz
+
+# Reference time for imports, before every sample reminder
+NOW = pytz.UTC.localize(datetime(2026, 1, 1))
+
+from utils.data_manager import DataManager
+from utils.journal_store import JournalDataManager
+from utils.reminder_io import (
+    MAX_LINE_OCTETS,
+    detect_format,
+    export_reminders,
+    from_rrule,
+    import_reminders,
+    to_rrule,
+)
+from utils.sqlite_store import SQLiteDataManager
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary data directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def _sample_reminders():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        return _add_samples(DataManager(tmpdir))
+
+
+def _add_samples(store):
+    store.add_reminder(1, "Stand-up; bring notes, please", "2026-03-02T09:30:00+00:00",
+                       channel_id=100, recurring="weekly on monday,wednesday at 09:30am")
+    store.add_reminder(2, "Pay rent", "2026-03-01T08:00:00+00:00",
+                       recurring="monthly on last friday at 08:00am",
+                       notes="Line one\nLine two")
+    store.add_reminder(2, "Call \\ back", "2026-03-05T17:15:00+00:00")
+    return store.get_all_reminders()
+
+
+def _round_trip(reminders, fmt):
+    out = io.StringIO(newline="")
+    assert export_reminders(reminders, out, fmt) == len(reminders)
+    return list(import_reminders(io.StringIO(out.getvalue(), newline=""), fmt, now=NOW))
+
+
+def _comparable(reminder):
+    return (
+        reminder["user_id"],
+        reminder["message"],
+        datetime.fromisoformat(reminder["remind_at"]),
+        reminder.get("channel_id"),
+        reminder.get("recurring"),
+        reminder.get("notes"),
+    )
+
+
+class TestRoundTrip:
+    """Exported reminders import back unchanged."""
+
+    @pytest.mark.parametrize("fmt", ["csv", "ics"])
+    def test_round_trip(self, fmt):
+        reminders = _sample_reminders()
+        imported = _round_trip(reminders, fmt)
+        assert sorted(map(_comparable, imported)) == sorted(map(_comparable, reminders))
+
+    def test_ics_lines_are_folded(self):
+        reminders = _sample_reminders()
+        reminders[0]["message"] = "é" * 200
+        out = io.StringIO(newline="")
+        export_reminders(reminders, out, "ics")
+        lines = out.getvalue().split("\r\n")
+        assert max(len(line.encode("utf-8")) for line in lines) <= MAX_LINE_OCTETS
+        assert any(line.startswith(" ") for line in lines)
+        assert _round_trip(reminders, "ics")[0]["message"] == "é" * 200
+
+    def test_detect_format(self):
+        assert detect_format("export.ICS") == "ics"
+        assert detect_format("export.csv") == "csv"
+        assert detect_format("export.txt") is None
+
+
+class TestRRule:
+    """Recurrence patterns map to and from RRULEs."""
+
+    @pytest.mark.parametrize("pattern, rrule", [
+        ("daily at 9am", "FREQ=DAILY"),
+        ("weekly at 9am", "FREQ=WEEKLY"),
+        ("weekly on monday,friday at 9am", "FREQ=WEEKLY;BYDAY=MO,FR"),
+        ("monthly on 15th at 9am", "FREQ=MONTHLY;BYMONTHDAY=15"),
+        ("monthly on second tuesday at 9am", "FREQ=MONTHLY;BYDAY=2TU"),
+        ("monthly on last friday at 9am", "FREQ=MONTHLY;BYDAY=-1FR"),
+    ])
+    def test_to_rrule(self, pattern, rrule):
+        assert to_rrule(pattern) == rrule
+
+    def test_from_rrule(self):
+        start = datetime(2026, 3, 10, 9, 0)
+        assert from_rrule("FREQ=WEEKLY;BYDAY=MO,FR", start) == "weekly on monday,friday at 09:00am"
+        assert from_rrule("FREQ=MONTHLY;BYDAY=-1FR", start) == "monthly on last friday at 09:00am"
+        assert from_rrule("FREQ=MONTHLY", start) == "monthly on 10th at 09:00am"
+
+    @pytest.mark.parametrize("rrule", [
+        "FREQ=YEARLY",
+        "FREQ=DAILY;COUNT=5",
+        "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO",
+    ])
+    def test_from_rrule_rejects_unsupported(self, rrule):
+        with pytest.raises(ValueError):
+            from_rrule(rrule, datetime(2026, 3, 10, 9, 0))
+
+    def test_foreign_calendar_event(self):
+        ics = (
+            "BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\n"
+            "DTSTART;TZID=Europe/Paris:20260310T090000\r\n"
+            "RRULE:FREQ=WEEKLY;BYDAY=TU\r\nSUMMARY:Gym\r\n"
+            "END:VEVENT\r\nEND:VCALENDAR\r\n"
+        )
+        [item] = import_reminders(io.StringIO(ics), "ics", default_user_id=5, now=NOW)
+        assert item["user_id"] == 5
+        assert item["message"] == "Gym"
+        paris = pytz.timezone("Europe/Paris").localize(datetime(2026, 3, 10, 9, 0))
+        assert datetime.fromisoformat(item["remind_at"]) == paris
+        assert item["recurring"].startswith("weekly on tuesday at ")
+
+
+class TestInvalidRecords:
+    """Bad rows are reported and skipped."""
+
+    CSV = (
+        "user_id,message,remind_at,recurring\n"
+        "1,ok,2026-03-01T09:00:00+00:00,\n"
+        ",no owner,2026-03-01T09:00:00+00:00,\n"
+        "1,,2026-03-01T09:00:00+00:00,\n"
+        "1,bad time,tomorrow,\n"
+        "1,bad rule,2026-03-01T09:00:00+00:00,yearly\n"
+    )
+
+    def test_errors_collected(self):
+        errors = []
+        items = list(import_reminders(io.StringIO(self.CSV), "csv", errors=errors, now=NOW))
+        assert [item["message"] for item in items] == ["ok"]
+        assert len(errors) == 4
+        assert errors[0].startswith("line 3:")
+
+    def test_raises_without_error_list(self):
+        with pytest.raises(ValueError):
+            list(import_reminders(io.StringIO(self.CSV), "csv", now=NOW))
+
+
+class TestPastRecords:
+    """Nothing is imported into the past."""
+
+    CSV = (
+        "user_id,message,remind_at,recurring\n"
+        "1,future,2026-03-01T09:00:00+00:00,\n"
+        "1,expired,2025-06-01T09:00:00+00:00,\n"
+        "1,weekly,2025-12-25T09:00:00+00:00,weekly at 09:00am\n"
+    )
+
+    def test_past_one_time_skipped_and_recurring_moved(self):
+        skipped, advanced = [], []
+        items = list(import_reminders(
+            io.StringIO(self.CSV), "csv", skipped=skipped, advanced=advanced, now=NOW
+        ))
+        assert [item["message"] for item in items] == ["future", "weekly"]
+        assert items[1]["remind_at"] == "2026-01-01T09:00:00+00:00"
+        assert len(skipped) == 1 and skipped[0].startswith("line 3:")
+        assert len(advanced) == 1 and advanced[0].startswith("line 4:")
+
+    def test_past_one_time_is_invalid_without_skip_list(self):
+        errors = []
+        items = list(import_reminders(io.StringIO(self.CSV), "csv", errors=errors, now=NOW))
+        assert len(items) == 2
+        assert len(errors) == 1 and "in the past" in errors[0]
+
+
+def _items(count):
+    return [
+        {"user_id": 1, "message": f"m{i}", "remind_at": "2026-03-01T09:00:00+00:00"}
+        for i in range(count)
+    ]
+
+
+class TestAddReminders:
+    """add_reminders stores a batch in one write."""
+
+    def test_json_single_save(self, temp_data_dir):
+        store = DataManager(temp_data_dir)
+        saves = []
+        original = store._save_json
+        store._save_json = lambda *args: saves.append(args) or original(*args)
+
+        reminder_ids = store.add_reminders(_items(50))
+        assert len(saves) == 1
+        assert len(set(reminder_ids)) == 50
+        assert len(DataManager(temp_data_dir).get_all_reminders()) == 50
+
+    def test_journal_single_append(self, temp_data_dir):
+        store = JournalDataManager(temp_data_dir)
+        calls = []
+        original = store._append_many
+        store._append_many = lambda records: calls.append(len(records)) or original(records)
+
+        store.add_reminders(_items(50))
+        store.close()
+        assert calls == [50]
+        reopened = JournalDataManager(temp_data_dir)
+        assert len(reopened.get_all_reminders()) == 50
+        reopened.close()
+
+    def test_sqlite(self, temp_data_dir):
+        store = SQLiteDataManager(temp_data_dir)
+        reminder_ids = store.add_reminders(_items(50))
+        assert [store.get_reminder_by_id(rid)["message"] for rid in reminder_ids[:2]] == ["m0", "m1"]
+        assert len(store.get_all_reminders()) == 50
+        store.close()
+
+    def test_service_schedules_batch(self, temp_data_dir):
+        pytest.importorskip("discord")
+        from benchmarks.bench_load import FakeBot
+        from services.reminder_service import ReminderService
+
+        async def run():
+            service = ReminderService(FakeBot([]), DataManager(temp_data_dir))
+            reminder_ids = await service.create_reminders(_items(3))
+            scheduled = [rid in service._queue for rid in reminder_ids]
+            await service.data.close()
+            return scheduled
+
+        assert asyncio.run(run()) == [True, True, True]
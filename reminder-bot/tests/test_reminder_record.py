@@ -0,0 +1,105 @@
+"""Tests for the compact reminder record."""
+
+import pytest
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.reminder_record import Reminder, format_epoch, parse_epoch
+
+
+def _data(**overrides):
+    data = {
+        "id": "abc",
+        "user_id": 123456789012345678,
+        "message": "Stand-up",
+        "remind_at": "2026-01-01T09:00:00+00:00",
+        "channel_id": 987654321098765432,
+        "recurring": "weekdays",
+        "notes": "room 2",
+        "created_at": "2025-12-31T12:00:00+00:00",
+    }
+    data.update(overrides)
+    return data
+
+
+class TestReminder:
+    """Tests for Reminder."""
+
+    def test_round_trip(self):
+        """to_dict reproduces the stored dict."""
+        data = _data()
+        assert Reminder.from_dict(data).to_dict() == data
+
+    def test_due_is_integer_epoch(self):
+        """Due times are held as integer seconds; naive values are UTC."""
+        reminder = Reminder.from_dict(_data(remind_at="2026-01-01T00:00:00"))
+        assert reminder.due == 1767225600
+        assert isinstance(reminder.due, int)
+        assert reminder.remind_at.isoformat() == "2026-01-01T00:00:00+00:00"
+
+    def test_fractional_seconds_round_up(self):
+        """Sub-second due times never fire early."""
+        assert parse_epoch("2026-01-01T00:00:00.250000+00:00") == 1767225601
+
+    def test_no_instance_dict(self):
+        """Slotted records carry no per-instance __dict__."""
+        reminder = Reminder.from_dict(_data())
+        assert not hasattr(reminder, "__dict__")
+        with pytest.raises(AttributeError):
+            reminder.extra = 1
+
+    def test_shared_values(self):
+        """IDs, recurrence strings and rules are shared across records."""
+        first = Reminder.from_dict(_data(id="a"))
+        second = Reminder.from_dict(_data(id="b", recurring="".join(["week", "days"])))
+        assert first.user_id is second.user_id
+        assert first.channel_id is second.channel_id
+        assert first.recurring is second.recurring
+        assert first.rule is second.rule
+
+    def test_optional_fields(self):
+        """DM reminders and missing created_at survive the round trip."""
+        reminder = Reminder.from_dict(
+            _data(channel_id=None, recurring=None, notes=None, created_at=None)
+        )
+        assert reminder.channel_id is None
+        assert reminder.rule is None
+        assert reminder.to_dict()["created_at"] is None
+
+    def test_missing_remind_at_rejected(self):
+        """A record without a due time is invalid."""
+        with pytest.raises(ValueError):
+            Reminder.from_dict(_data(remind_at=None))
+
+    def test_copy_is_independent(self):
+        """Advancing a copy leaves the original untouched."""
+        reminder = Reminder.from_dict(_data())
+        clone = reminder.copy()
+        clone.due += 86400
+        assert reminder.due == parse_epoch("2026-01-01T09:00:00+00:00")
+        assert format_epoch(clone.due) == "2026-01-02T09:00:00+00:00"
+
+    def test_round_trip_keeps_original_strings(self):
+        """Non-canonical timestamps and unknown keys are saved back as loaded."""
+        data = _data(
+            remind_at="2026-01-01T09:00:00.250000Z",
+            created_at="2025-12-31 12:00:00",
+            timezone="Europe/Berlin",
+        )
+        assert Reminder.from_dict(data).to_dict() == data
+
+    def test_unparseable_created_at_kept(self):
+        """A created_at we can't parse is not replaced with None."""
+        data = _data(created_at="yesterday")
+        assert Reminder.from_dict(data).to_dict()["created_at"] == "yesterday"
+
+    def test_advanced_reminder_gets_canonical_time(self):
+        """Once the due time moves, remind_at is written in canonical form."""
+        reminder = Reminder.from_dict(_data(remind_at="2026-01-01T09:00:00Z", extra="x"))
+        reminder.due += 86400
+        data = reminder.to_dict()
+        assert data["remind_at"] == "2026-01-02T09:00:00+00:00"
+        assert data["extra"] == "x"
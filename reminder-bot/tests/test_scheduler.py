@@ -0,0 +1,93 @@
+"""Tests for the due-time queue."""
+
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.scheduler import DueQueue
+from utils.reminder_record import to_timestamp
+
+
+class TestToTimestamp:
+    """Tests for remind_at parsing."""
+
+    def test_aware_utc(self):
+        """Offset-aware ISO strings convert to epoch seconds."""
+        assert to_timestamp("2026-01-01T00:00:00+00:00") == 1767225600.0
+
+    def test_naive_treated_as_utc(self):
+        """Naive ISO strings are treated as UTC."""
+        assert to_timestamp("2026-01-01T00:00:00") == 1767225600.0
+
+    def test_z_suffix(self):
+        """A trailing Z is accepted."""
+        assert to_timestamp("2026-01-01T00:00:00Z") == 1767225600.0
+
+
+class TestDueQueue:
+    """Tests for DueQueue ordering and invalidation."""
+
+    def test_pop_due_in_order(self):
+        """Due reminders come out earliest first, future ones stay."""
+        queue = DueQueue()
+        queue.push("b", 20.0)
+        queue.push("a", 10.0)
+        queue.push("c", 30.0)
+
+        assert queue.pop_due(25.0) == ["a", "b"]
+        assert len(queue) == 1
+        assert queue.peek() == (30.0, "c")
+
+    def test_push_reports_new_head(self):
+        """push returns True only when the earliest due time moves earlier."""
+        queue = DueQueue()
+        assert queue.push("a", 10.0) is True
+        assert queue.push("b", 20.0) is False
+        assert queue.push("c", 5.0) is True
+
+    def test_reschedule_replaces_old_entry(self):
+        """Rescheduling moves a reminder instead of duplicating it."""
+        queue = DueQueue()
+        queue.push("a", 10.0)
+        queue.push("a", 50.0)
+
+        assert queue.pop_due(20.0) == []
+        assert queue.pop_due(50.0) == ["a"]
+        assert len(queue) == 0
+
+    def test_remove(self):
+        """Removed reminders are never returned."""
+        queue = DueQueue()
+        queue.push("a", 10.0)
+        queue.push("b", 20.0)
+
+        queue.push("c", 30.0)
+
+        assert queue.remove("b") is False  # not the head
+        assert queue.remove("a") is True
+        assert queue.pop_due(100.0) == ["c"]
+
+    def test_remove_unknown(self):
+        """Removing an unknown ID is a no-op."""
+        queue = DueQueue()
+        assert queue.remove("missing") is False
+
+    def test_seconds_until_next(self):
+        """Delay is clamped at zero and None when empty."""
+        queue = DueQueue()
+        assert queue.seconds_until_next(0.0) is None
+        queue.push("a", 10.0)
+        assert queue.seconds_until_next(4.0) == 6.0
+        assert queue.seconds_until_next(15.0) == 0.0
+
+    def test_compaction_keeps_live_entries(self):
+        """Heavy rescheduling compacts the heap without losing entries."""
+        queue = DueQueue()
+        for i in range(500):
+            queue.push("a", float(i))
+            queue.push("b", float(1000 - i))
+
+        assert len(queue._heap) < 200
+        assert queue.pop_due(10_000.0) == ["a", "b"]
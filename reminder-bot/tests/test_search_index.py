@@ -0,0 +1,154 @@
+"""Tests for the reminder search index."""
+
+import asyncio
+import tempfile
+import pytest
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.async_store import AsyncDataManager
+from utils.data_manager import DataManager
+from utils.journal_store import JournalDataManager
+from utils.search_index import SearchIndex, tokenize
+from utils.sqlite_store import SQLiteDataManager
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary data directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def _reminder(reminder_id, message, notes=None, user_id=1):
+    return {"id": reminder_id, "user_id": user_id, "message": message, "notes": notes}
+
+
+class TestSearchIndex:
+    """Tests for SearchIndex."""
+
+    def test_tokenize(self):
+        assert tokenize("Call Mom, re: DENTIST!") == {"call", "mom", "re", "dentist"}
+        assert tokenize(None) == frozenset()
+
+    def test_all_words_must_match(self):
+        index = SearchIndex()
+        index.add(_reminder("a", "Call the dentist"))
+        index.add(_reminder("b", "Call mom"))
+        assert sorted(index.search(1, "call")) == ["a", "b"]
+        assert index.search(1, "dentist CALL") == ["a"]
+        assert index.search(1, "dentist mom") == []
+
+    def test_prefix_and_notes(self):
+        index = SearchIndex()
+        index.add(_reminder("a", "Appointment", notes="Dentist on 5th street"))
+        assert index.search(1, "dent") == ["a"]
+        assert index.search(1, "street appoint") == ["a"]
+
+    def test_scoped_to_user(self):
+        index = SearchIndex()
+        index.add(_reminder("a", "Gym", user_id=1))
+        index.add(_reminder("b", "Gym", user_id=2))
+        assert index.search(2, "gym") == ["b"]
+        assert index.search(3, "gym") == []
+
+    def test_reindex_and_remove(self):
+        index = SearchIndex()
+        index.add(_reminder("a", "Gym"))
+        index.add(_reminder("a", "Gym", notes="leg day"))
+        assert index.search(1, "leg") == ["a"]
+        index.add(_reminder("a", "Gym"))
+        assert index.search(1, "leg") == []
+        index.remove("a")
+        index.remove("a")
+        assert index.search(1, "gym") == []
+        assert len(index) == 0
+        assert index._postings == {}
+
+
+class TestAsyncSearch:
+    """The index follows mutations made through AsyncDataManager."""
+
+    def test_follows_mutations(self, temp_data_dir):
+        async def run():
+            data = AsyncDataManager(DataManager(temp_data_dir))
+            first = await data.add_reminder(1, "Pay rent", "2030-01-01T00:00:00+00:00")
+            results = [await data.search_reminders(1, "rent")]
+
+            # Index exists now; later changes update it incrementally
+            second = await data.add_reminder(1, "Renew passport", "2030-01-02T00:00:00+00:00")
+            await data.update_reminder_notes(first, 1, "landlord account")
+            results.append(await data.search_reminders(1, "ren"))
+            results.append(await data.search_reminders(1, "landlord"))
+            await data.remove_reminder(first, 1)
+            await data.delete_reminder(second)
+            results.append(await data.search_reminders(1, "ren"))
+            await data.close()
+            return first, second, results
+
+        first, second, results = asyncio.run(run())
+        assert [r["id"] for r in results[0]] == [first]
+        assert sorted(r["id"] for r in results[1]) == sorted([first, second])
+        assert [r["id"] for r in results[2]] == [first]
+        assert results[3] == []
+
+    def test_drops_reminders_deleted_elsewhere(self, temp_data_dir):
+        store = DataManager(temp_data_dir)
+
+        async def run():
+            data = AsyncDataManager(store)
+            reminder_id = await data.add_reminder(1, "Water plants", "2030-01-01T00:00:00+00:00")
+            assert await data.search_reminders(1, "water")
+            # Another process deletes it behind the facade's back
+            store.delete_reminder(reminder_id)
+            results = await data.search_reminders(1, "water")
+            await data.close()
+            return results, data
+
+        results, data = asyncio.run(run())
+        assert results == []
+        assert len(data._index) == 0
+
+    def test_one_store_read_per_search(self, temp_data_dir):
+        store = DataManager(temp_data_dir)
+        for i in range(20):
+            store.add_reminder(1, f"Water plant {i}", "2030-01-01T00:00:00+00:00")
+        calls = []
+        get_reminders_by_ids = store.get_reminders_by_ids
+        store.get_reminder_by_id = lambda reminder_id: calls.append("by_id")
+        store.get_user_reminders = lambda user_id: calls.append("user")
+        store.get_reminders_by_ids = (
+            lambda reminder_ids: calls.append("by_ids") or get_reminders_by_ids(reminder_ids)
+        )
+
+        async def run():
+            data = AsyncDataManager(store)
+            await data.search_reminders(1, "missing")  # Builds the index
+            calls.clear()
+            results = await data.search_reminders(1, "water")
+            await data.close()
+            return results
+
+        assert len(asyncio.run(run())) == 20
+        assert calls == ["by_ids"]
+
+
+class TestGetRemindersByIds:
+    """Every store looks up search hits by ID, leaving out missing ones."""
+
+    @pytest.mark.parametrize("store_name", ["json", "journal", "sqlite"])
+    def test_lookup(self, temp_data_dir, store_name):
+        store = {
+            "json": DataManager,
+            "journal": JournalDataManager,
+            "sqlite": SQLiteDataManager,
+        }[store_name](temp_data_dir)
+        ids = [store.add_reminder(1, f"Reminder {i}", "2030-01-01T00:00:00+00:00") for i in range(3)]
+
+        found = store.get_reminders_by_ids([ids[0], "missing", ids[2]])
+        assert set(found) == {ids[0], ids[2]}
+        assert found[ids[2]]["message"] == "Reminder 2"
+        assert store.get_reminders_by_ids([]) == {}
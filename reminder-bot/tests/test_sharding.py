@@ -0,0 +1,170 @@
+"""Tests for lease-based shard ownership."""
+
+import tempfile
+import uuid
+import pytest
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.sharding import ShardLeaseManager, shard_of
+from utils.data_manager import DataManager
+from utils.sqlite_store import SQLiteDataManager
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary data directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture
+def stores(temp_data_dir):
+    """Two connections to one database, as two worker processes would have."""
+    first = SQLiteDataManager(temp_data_dir)
+    second = SQLiteDataManager(temp_data_dir)
+    yield first, second
+    first.close()
+    second.close()
+
+
+class TestShardOf:
+    """Tests for shard_of."""
+
+    def test_range_and_spread(self):
+        ids = [str(uuid.uuid4()) for _ in range(2000)]
+        counts = [0] * 8
+        for rid in ids:
+            counts[shard_of(rid, 8)] += 1
+        assert all(150 < c < 350 for c in counts)
+
+    def test_stable(self):
+        assert shard_of("abc", 16) == shard_of("abc", 16)
+
+
+class TestShardLeaseManager:
+    """Tests for ShardLeaseManager."""
+
+    def test_requires_sqlite(self, temp_data_dir):
+        with pytest.raises(ValueError):
+            ShardLeaseManager(DataManager(temp_data_dir))
+
+    def test_single_worker_owns_everything(self, stores):
+        clock = FakeClock()
+        worker = ShardLeaseManager(stores[0], 8, "a", clock=clock)
+        assert worker.renew() is True
+        assert worker.owned == frozenset(range(8))
+        assert worker.renew() is False
+
+    def test_rebalance_on_join(self, stores):
+        clock = FakeClock()
+        a = ShardLeaseManager(stores[0], 8, "a", clock=clock)
+        b = ShardLeaseManager(stores[1], 8, "b", clock=clock)
+        a.renew()
+        b.renew()  # Nothing free yet, but b's heartbeat is registered
+        assert b.owned == frozenset()
+
+        a.renew()  # a stops delivering the shards beyond its fair share
+        assert len(a.owned) == 4
+        b.renew()  # ...but still holds their leases while draining them
+        assert b.owned == frozenset()
+
+        a.renew()  # Nothing in flight: a releases them
+        b.renew()  # b claims the released shards
+        assert len(a.owned) == len(b.owned) == 4
+        assert a.owned | b.owned == frozenset(range(8))
+        assert not a.owned & b.owned
+
+    def test_takeover_after_expiry(self, stores):
+        clock = FakeClock()
+        a = ShardLeaseManager(stores[0], 8, "a", lease_ttl=30, clock=clock)
+        b = ShardLeaseManager(stores[1], 8, "b", lease_ttl=30, clock=clock)
+        a.renew(), b.renew(), a.renew(), a.renew(), b.renew()
+
+        # a dies; before its lease expires b cannot take its shards
+        clock.now += 20
+        b.renew()
+        assert len(b.owned) == 4
+
+        clock.now += 15
+        b.renew()
+        assert b.owned == frozenset(range(8))
+        # a's local view has lapsed too, so it would not deliver anything
+        assert a.owned == frozenset()
+
+    def test_take_gained(self, stores):
+        clock = FakeClock()
+        a = ShardLeaseManager(stores[0], 4, "a", lease_ttl=30, clock=clock)
+        b = ShardLeaseManager(stores[1], 4, "b", lease_ttl=30, clock=clock)
+        a.renew()
+        assert a.take_gained() == frozenset(range(4))
+        assert a.take_gained() == frozenset()
+
+        b.renew(), a.renew(), a.renew(), b.renew()
+        assert b.take_gained() == b.owned
+        # a dies; b takes over its shards and must check them
+        lost = a.owned
+        clock.now += 35
+        b.renew()
+        assert b.take_gained() == lost
+
+    def test_release_hands_over_immediately(self, stores):
+        clock = FakeClock()
+        a = ShardLeaseManager(stores[0], 4, "a", clock=clock)
+        b = ShardLeaseManager(stores[1], 4, "b", clock=clock)
+        a.renew(), b.renew(), a.renew(), a.renew(), b.renew()
+
+        a.release()
+        b.renew()
+        assert b.owned == frozenset(range(4))
+
+    def test_owns(self, stores):
+        clock = FakeClock()
+        worker = ShardLeaseManager(stores[0], 4, "a", clock=clock)
+        assert not worker.owns("abc")
+        worker.renew()
+        assert worker.owns("abc")
+
+    def test_drain_waits_for_in_flight_deliveries(self, stores):
+        clock = FakeClock()
+        a = ShardLeaseManager(stores[0], 2, "a", clock=clock)
+        b = ShardLeaseManager(stores[1], 2, "b", clock=clock)
+        a.renew()
+        reminder_id = next(
+            rid for rid in (str(uuid.uuid4()) for _ in range(100)) if shard_of(rid, 2) == 1
+        )
+        assert a.begin(reminder_id)  # Delivery in progress on shard 1
+
+        b.renew()
+        a.renew()  # Shard 1 is beyond a's share: draining
+        assert a.owned == frozenset({0})
+        assert not a.begin(reminder_id)  # No new deliveries while draining
+
+        a.renew()  # Still in flight: a keeps the lease
+        b.renew()
+        assert b.owned == frozenset()
+
+        a.finish(reminder_id)
+        a.renew()
+        b.renew()
+        assert b.owned == frozenset({1})
+        assert b.begin(reminder_id)
+
+    def test_begin_requires_ownership(self, stores):
+        clock = FakeClock()
+        worker = ShardLeaseManager(stores[0], 4, "a", clock=clock)
+        assert not worker.begin("abc")
+        worker.renew()
+        assert worker.begin("abc")
+        worker.finish("abc")
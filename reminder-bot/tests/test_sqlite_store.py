@@ -0,0 +1,134 @@
+"""Tests for the SQLite reminder store."""
+
+import json
+import tempfile
+import pytest
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.sqlite_store import SQLiteDataManager
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary data directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture
+def store(temp_data_dir):
+    """Create a SQLiteDataManager with temp directory."""
+    manager = SQLiteDataManager(temp_data_dir)
+    yield manager
+    manager.close()
+
+
+class TestSQLiteDataManager:
+    """Tests for SQLiteDataManager."""
+
+    def test_wal_mode(self, store):
+        """The database runs in WAL mode."""
+        mode = store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_indexes_exist(self, store):
+        """user_id and remind_at are indexed."""
+        names = {
+            row[0]
+            for row in store._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        assert {"idx_reminders_user_id", "idx_reminders_remind_at"} <= names
+
+    def test_due_reminders_range_query(self, store):
+        """Due lookups compare instants, not strings."""
+        early = store.add_reminder(1, "early", "2026-01-01T00:00:00+00:00")
+        # Same instant expressed with a different offset
+        local = store.add_reminder(1, "local", "2025-12-31T17:00:00-07:00")
+        store.add_reminder(1, "late", "2026-06-01T00:00:00+00:00")
+
+        due = store.get_due_reminders("2026-01-01T00:00:00+00:00")
+        assert sorted(r["id"] for r in due) == sorted([early, local])
+
+    def test_user_reminders_and_ownership(self, store):
+        """Per-user listing and ownership checks."""
+        mine = store.add_reminder(1, "mine", "2026-01-01T00:00:00+00:00")
+        store.add_reminder(2, "theirs", "2026-01-01T00:00:00+00:00")
+
+        assert [r["id"] for r in store.get_user_reminders(1)] == [mine]
+        assert store.get_reminder(mine, 2) is None
+        assert store.update_reminder_notes(mine, 2, "x") is False
+        assert store.update_reminder_notes(mine, 1, "note") is True
+        assert store.get_reminder(mine, 1)["notes"] == "note"
+        assert store.remove_reminder(mine, 2) is False
+        assert store.remove_reminder(mine, 1) is True
+
+    def test_update_reminder_moves_due_time(self, store):
+        """update_reminder keeps the remind_at index in sync."""
+        reminder_id = store.add_reminder(1, "msg", "2026-01-01T00:00:00+00:00")
+        reminder = store.get_reminder_by_id(reminder_id)
+        reminder["remind_at"] = "2026-03-01T00:00:00+00:00"
+        store.update_reminder(reminder)
+
+        assert store.get_due_reminders("2026-02-01T00:00:00+00:00") == []
+        assert store.update_reminder_time(reminder_id, "2026-01-15T00:00:00+00:00")
+        assert len(store.get_due_reminders("2026-02-01T00:00:00+00:00")) == 1
+
+    def test_update_reminders_batch(self, store):
+        """update_reminders rewrites several rows and skips unknown IDs."""
+        ids = [store.add_reminder(1, f"m{i}", "2026-01-01T00:00:00+00:00") for i in range(3)]
+        batch = [store.get_reminder_by_id(i) for i in ids]
+        for reminder in batch:
+            reminder["remind_at"] = "2026-05-01T00:00:00+00:00"
+        store.update_reminders(batch + [{**batch[0], "id": "missing"}])
+
+        assert store.get_due_reminders("2026-04-01T00:00:00+00:00") == []
+        assert store.get_reminder_by_id("missing") is None
+
+    def test_guild_default_channel(self, store):
+        """Guild default channel round-trips and clears."""
+        assert store.get_guild_default_channel(10) is None
+        store.set_guild_default_channel(10, 99)
+        assert store.get_guild_default_channel(10) == 99
+        assert store.clear_guild_default_channel(10) is True
+        assert store.clear_guild_default_channel(10) is False
+        assert store.get_config() == {}
+
+
+class TestJsonMigration:
+    """Tests for the one-shot JSON import."""
+
+    def test_imports_existing_json_once(self, temp_data_dir):
+        """reminders.json and config.json are imported on first open only."""
+        data_dir = Path(temp_data_dir)
+        reminder = {
+            "id": "abc",
+            "user_id": 1,
+            "message": "old",
+            "remind_at": "2026-01-01T00:00:00+00:00",
+            "channel_id": None,
+            "recurring": "daily at 09:00am",
+            "notes": None,
+            "created_at": "2025-01-01T00:00:00",
+        }
+        (data_dir / "reminders.json").write_text(json.dumps({"abc": reminder}))
+        (data_dir / "config.json").write_text(
+            json.dumps({"10": {"default_channel_id": 5}})
+        )
+
+        store = SQLiteDataManager(temp_data_dir)
+        assert store.get_reminder_by_id("abc") == reminder
+        assert store.get_guild_default_channel(10) == 5
+
+        store.delete_reminder("abc")
+        store.close()
+
+        # Reopening does not re-import the deleted reminder
+        reopened = SQLiteDataManager(temp_data_dir)
+        assert reopened.get_reminder_by_id("abc") is None
+        reopened.close()
@@ -0,0 +1,74 @@
+"""Tests for the shared time-expression parser."""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from utils.time_parser import (
+    CLOCK,
+    FALLBACK,
+    LOCAL_TZ,
+    RELATIVE,
+    compile_time_expression,
+    parse_time,
+)
+
+
+@pytest.fixture
+def now():
+    return LOCAL_TZ.localize(datetime(2024, 6, 10, 10, 0))
+
+
+class TestCompile:
+    def test_relative(self):
+        assert compile_time_expression("30m") == (RELATIVE, 1800)
+        assert compile_time_expression("1h30m") == (RELATIVE, 5400)
+        assert compile_time_expression("2 hours") == (RELATIVE, 7200)
+
+    def test_single_unit_limits(self):
+        assert compile_time_expression("24h") == (FALLBACK,)
+        assert compile_time_expression("53w") == (FALLBACK,)
+
+    def test_clock(self):
+        assert compile_time_expression("9am") == (CLOCK, 0, 9, 0)
+        assert compile_time_expression("12am") == (CLOCK, 0, 0, 0)
+        assert compile_time_expression("12pm") == (CLOCK, 0, 12, 0)
+        assert compile_time_expression("9:30pm") == (CLOCK, 0, 21, 30)
+        assert compile_time_expression("21:00") == (CLOCK, 0, 21, 0)
+        assert compile_time_expression("tomorrow at 9am") == (CLOCK, 1, 9, 0)
+        assert compile_time_expression("noon") == (CLOCK, 0, 12, 0)
+
+    def test_invalid_clock(self):
+        assert compile_time_expression("13pm") == (FALLBACK,)
+        assert compile_time_expression("9:75am") == (FALLBACK,)
+
+
+class TestParseTime:
+    def test_relative(self, now):
+        assert parse_time("30m", now) == LOCAL_TZ.localize(datetime(2024, 6, 10, 10, 30))
+        assert parse_time("tomorrow", now) == LOCAL_TZ.localize(datetime(2024, 6, 11, 10, 0))
+
+    def test_clock_is_local(self, now):
+        result = parse_time("Tomorrow 9:30PM", now)
+        assert result == LOCAL_TZ.localize(datetime(2024, 6, 11, 21, 30))
+        assert result.utcoffset() == LOCAL_TZ.localize(datetime(2024, 6, 11)).utcoffset()
+
+    def test_relative_across_dst(self):
+        before = LOCAL_TZ.localize(datetime(2024, 3, 9, 12, 0))
+        result = parse_time("1d", before)
+        # 24 real hours later, normalized to the post-transition offset
+        assert result.astimezone(LOCAL_TZ).hour == 13
+        assert result.utcoffset() != before.utcoffset()
+
+    def test_dateutil_fallback(self, now):
+        assert parse_time("2024-07-04 14:30", now) == LOCAL_TZ.localize(
+            datetime(2024, 7, 4, 14, 30)
+        )
+
+    def test_unparseable(self, now):
+        assert parse_time("", now) is None
+        assert parse_time("whenever", now) is None
@@ -0,0 +1,61 @@
+"""Tests for TTLCache."""
+
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Tests for expiry and LRU eviction."""
+
+    def test_expiry(self):
+        """Entries disappear after ttl seconds."""
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 4.9
+        assert cache.get("a") == 1
+        clock.now = 5.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60, clock=FakeClock())
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_falsy_values_are_cached(self):
+        """Cached falsy values are distinguishable via the default."""
+        cache = TTLCache(maxsize=2, ttl=60, clock=FakeClock())
+        cache.set("a", False)
+        assert "a" in cache
+        assert cache.get("missing", "default") == "default"
+
+    def test_pop(self):
+        """pop removes and returns the value."""
+        cache = TTLCache(maxsize=2, ttl=60, clock=FakeClock())
+        cache.set("a", 1)
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
@@ -0,0 +1,94 @@
+"""Tests for the upcoming-occurrences view."""
+
+import asyncio
+import tempfile
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("discord")
+
+import pytz
+
+from services.reminder_service import ReminderService
+from utils.data_manager import DataManager
+from utils.embeds import create_upcoming_embed
+from utils.reminder_record import Reminder
+
+UTC = pytz.UTC
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary data directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def _upcoming(store, user_id, count):
+    async def run():
+        service = ReminderService(None, store)
+        try:
+            return await service.upcoming(user_id, count)
+        finally:
+            await service.data.close()
+
+    return asyncio.run(run())
+
+
+class TestUpcoming:
+    """Tests for ReminderService.upcoming."""
+
+    def test_merges_recurring_and_one_shot(self, temp_data_dir):
+        store = DataManager(temp_data_dir)
+        start = UTC.localize(datetime(2030, 1, 1, 9, 0))
+        store.add_reminder(1, "daily", start.isoformat(), recurring="daily at 09:00am")
+        store.add_reminder(
+            1, "weekly", (start + timedelta(hours=1)).isoformat(), recurring="weekly"
+        )
+        store.add_reminder(1, "once", (start + timedelta(days=2, hours=12)).isoformat())
+        store.add_reminder(2, "someone else", start.isoformat())
+
+        occurrences = _upcoming(store, 1, 6)
+
+        assert [(when - start, r.message) for when, r in occurrences] == [
+            (timedelta(0), "daily"),
+            (timedelta(hours=1), "weekly"),
+            (timedelta(days=1), "daily"),
+            (timedelta(days=2), "daily"),
+            (timedelta(days=2, hours=12), "once"),
+            (timedelta(days=3), "daily"),
+        ]
+
+    def test_many_recurring_reminders_stay_lazy(self, temp_data_dir):
+        store = DataManager(temp_data_dir)
+        start = UTC.localize(datetime(2030, 1, 1))
+        reminders = {}
+        for i in range(300):
+            reminder = store._build_reminder(
+                1,
+                f"r{i}",
+                (start + timedelta(minutes=i)).isoformat(),
+                None,
+                "daily",
+                None,
+            )
+            reminders[reminder["id"]] = reminder
+        store._save_json(store.reminders_file, reminders)
+
+        occurrences = _upcoming(store, 1, 25)
+        times = [when for when, _ in occurrences]
+        assert len(times) == 25
+        assert times == sorted(times)
+        assert times[-1] == start + timedelta(minutes=24)
+
+    def test_embed(self):
+        when = UTC.localize(datetime(2030, 1, 1))
+        reminder = Reminder("r1", 1, "Hi", int(when.timestamp()), recurring="daily")
+        embed = create_upcoming_embed([(when, reminder)])
+        assert f"<t:{int(when.timestamp())}:f>" in embed.description
+        assert create_upcoming_embed([]).description == "No upcoming reminders"
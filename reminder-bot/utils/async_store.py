@@ -0,0 +1,241 @@
+"""Async facade over the (blocking) reminder stores."""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from utils.search_index import SearchIndex
+
+T = TypeVar("T")
+
+
+class AsyncDataManager:
+    """Runs every call to a ``DataManager`` on a dedicated storage thread.
+
+    The JSON, journal and SQLite stores all block on disk, so coroutines
+    await these wrappers instead of calling the store directly. A single
+    worker thread keeps calls in submission order and means the file-based
+    stores never see two read-modify-write cycles interleave.
+
+    It also owns the reminder search index, built on the first search and
+    then kept current by the mutation wrappers below. The index is only
+    touched from the storage thread, in the same order as the writes.
+
+    Guild default channels are cached too: the first lookup loads every
+    guild's settings in one read and writes through this facade (e.g.
+    /setchannel) invalidate the cache, so lookups on the delivery path never
+    read storage after that. Changes made by another process are picked up
+    by ``refresh_guild_config``, which sharded schedulers call in the
+    background.
+
+    Args:
+        store: Any ``DataManager`` implementation (see ``create_data_manager``).
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="reminder-storage"
+        )
+        self._index: Optional[SearchIndex] = None
+        self._guild_defaults: Optional[Dict[int, int]] = None
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Run any blocking callable on the storage thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def close(self):
+        """Close the store, then stop the storage thread."""
+        try:
+            await self.run(self.store.close)
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _reindex(self, reminder_id: str):
+        """Refresh one reminder in the search index (storage thread only)."""
+        if self._index is None:
+            return
+        reminder = self.store.get_reminder_by_id(reminder_id)
+        if reminder:
+            self._index.add(reminder)
+        else:
+            self._index.remove(reminder_id)
+
+    def _unindex(self, reminder_ids: List[str]):
+        if self._index is not None:
+            for reminder_id in reminder_ids:
+                self._index.remove(reminder_id)
+
+    def _search(self, user_id: int, query: str) -> List[Dict]:
+        if self._index is None:
+            self._index = SearchIndex()
+            for reminder in self.store.get_all_reminders():
+                self._index.add(reminder)
+
+        reminder_ids = self._index.search(user_id, query)
+        if not reminder_ids:
+            return []
+        # One lookup for all hits (a lookup per hit reloads the whole JSON file)
+        reminders = self.store.get_reminders_by_ids(reminder_ids)
+        found = []
+        for reminder_id in reminder_ids:
+            reminder = reminders.get(reminder_id)
+            if reminder:
+                found.append(reminder)
+            else:
+                # Deleted by another process (e.g. a delivery worker)
+                self._index.remove(reminder_id)
+        return found
+
+    # Reminders
+    async def search_reminders(self, user_id: int, query: str) -> List[Dict]:
+        """``user_id``'s reminders whose message or notes contain every word
+        of ``query`` (words match as prefixes, case-insensitively)."""
+        return await self.run(self._search, user_id, query)
+
+    async def get_reminders(self) -> Dict[str, Dict]:
+        return await self.run(self.store.get_reminders)
+
+    async def get_all_reminders(self) -> List[Dict]:
+        return await self.run(self.store.get_all_reminders)
+
+    async def get_user_reminders(self, user_id: int) -> List[Dict]:
+        return await self.run(self.store.get_user_reminders, user_id)
+
+    async def add_reminder(
+        self,
+        user_id: int,
+        message: str,
+        remind_at: str,
+        channel_id: Optional[int] = None,
+        recurring: Optional[str] = None,
+        notes: Optional[str] = None,
+    ) -> str:
+        def add() -> str:
+            reminder_id = self.store.add_reminder(
+                user_id,
+                message,
+                remind_at,
+                channel_id=channel_id,
+                recurring=recurring,
+                notes=notes,
+            )
+            if self._index is not None:
+                self._index.add(
+                    {"id": reminder_id, "user_id": user_id, "message": message, "notes": notes}
+                )
+            return reminder_id
+
+        return await self.run(add)
+
+    async def add_reminders(self, new: List[Dict]) -> List[str]:
+        """Add several reminders with one batched write (see ``DataManager.add_reminders``)."""
+
+        def add() -> List[str]:
+            reminder_ids = self.store.add_reminders(new)
+            if self._index is not None:
+                for reminder_id, item in zip(reminder_ids, new):
+                    self._index.add({**item, "id": reminder_id})
+            return reminder_ids
+
+        return await self.run(add)
+
+    async def update_reminder_notes(
+        self, reminder_id: str, user_id: int, notes: str
+    ) -> bool:
+        def update() -> bool:
+            updated = self.store.update_reminder_notes(reminder_id, user_id, notes)
+            if updated:
+                self._reindex(reminder_id)
+            return updated
+
+        return await self.run(update)
+
+    async def get_reminder(self, reminder_id: str, user_id: int) -> Optional[Dict]:
+        return await self.run(self.store.get_reminder, reminder_id, user_id)
+
+    async def get_reminder_by_id(self, reminder_id: str) -> Optional[Dict]:
+        return await self.run(self.store.get_reminder_by_id, reminder_id)
+
+    async def remove_reminder(self, reminder_id: str, user_id: int) -> bool:
+        def remove() -> bool:
+            removed = self.store.remove_reminder(reminder_id, user_id)
+            if removed:
+                self._unindex([reminder_id])
+            return removed
+
+        return await self.run(remove)
+
+    async def get_due_reminders(self, current_time: str) -> List[Dict]:
+        return await self.run(self.store.get_due_reminders, current_time)
+
+    async def update_reminder(self, reminder: Dict):
+        def update():
+            self.store.update_reminder(reminder)
+            if self._index is not None:
+                self._index.add(reminder)
+
+        await self.run(update)
+
+    async def update_reminders(self, updated: List[Dict]):
+        def update():
+            self.store.update_reminders(updated)
+            if self._index is not None:
+                for reminder in updated:
+                    self._index.add(reminder)
+
+        await self.run(update)
+
+    async def update_reminder_time(self, reminder_id: str, new_time: str) -> bool:
+        return await self.run(self.store.update_reminder_time, reminder_id, new_time)
+
+    async def delete_reminder(self, reminder_id: str):
+        def delete():
+            self.store.delete_reminder(reminder_id)
+            self._unindex([reminder_id])
+
+        await self.run(delete)
+
+    async def delete_reminders(self, reminder_ids: List[str]):
+        def delete():
+            self.store.delete_reminders(reminder_ids)
+            self._unindex(reminder_ids)
+
+        await self.run(delete)
+
+    # Configuration (Guild settings)
+    async def get_config(self) -> Dict[str, Any]:
+        return await self.run(self.store.get_config)
+
+    async def refresh_guild_config(self):
+        """Reload the guild default channel cache from storage (one read)."""
+        config = await self.run(self.store.get_config)
+        self._guild_defaults = {
+            int(guild_id): int(settings["default_channel_id"])
+            for guild_id, settings in config.items()
+            if settings.get("default_channel_id")
+        }
+
+    async def get_guild_default_channel(self, guild_id: int) -> Optional[int]:
+        """Cached lookup; only the first lookup after a write reads storage."""
+        if self._guild_defaults is None:
+            await self.refresh_guild_config()
+        return self._guild_defaults.get(int(guild_id))
+
+    async def set_guild_default_channel(self, guild_id: int, channel_id: int) -> bool:
+        try:
+            return await self.run(
+                self.store.set_guild_default_channel, guild_id, channel_id
+            )
+        finally:
+            self._guild_defaults = None
+
+    async def clear_guild_default_channel(self, guild_id: int) -> bool:
+        try:
+            return await self.run(self.store.clear_guild_default_channel, guild_id)
+        finally:
+            self._guild_defaults = None
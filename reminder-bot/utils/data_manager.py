@@ -1,9 +1,51 @@
 """Data manager for Reminder bot."""
 
 import json
+import os
+import tempfile
 import uuid
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+
+@contextmanager
+def atomic_write(path: Path) -> Iterator[TextIO]:
+    """Open a temporary file that replaces ``path`` once fully written.
+
+    The file is fsync'd and renamed over ``path``, so a crash at any point
+    leaves either the old contents or the new ones, never a torn file. If
+    the block raises, ``path`` is left untouched.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    _fsync_dir(path.parent)
+
+
+def _fsync_dir(directory: Path):
+    """Make a rename in ``directory`` durable (not supported on Windows)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 class DataManager:
@@ -28,8 +70,8 @@ class DataManager:
         return default or {}
 
     def _save_json(self, file_path: Path, data: Any):
-        """Save JSON file."""
-        with open(file_path, "w") as f:
+        """Save JSON file atomically."""
+        with atomic_write(file_path) as f:
             json.dump(data, f, indent=2)
 
     # Reminders
@@ -62,12 +104,57 @@ class DataManager:
     ) -> str:
         """Add a reminder."""
         reminders = self.get_reminders()
-        reminder_id = str(uuid.uuid4())
+        reminder = self._build_reminder(
+            user_id, message, remind_at, channel_id, recurring, notes
+        )
+        reminder_id = reminder["id"]
+
+        reminders[reminder_id] = reminder
+        self._save_json(self.reminders_file, reminders)
+
+        return reminder_id
+
+    def add_reminders(self, new: List[Dict]) -> List[str]:
+        """Add several reminders with a single write.
+
+        Args:
+            new: Dicts keyed like the ``add_reminder`` arguments.
+
+        Returns:
+            The new reminder IDs, in input order.
+        """
+        reminders = self.get_reminders()
+        built = [self._build_from(item) for item in new]
+        for reminder in built:
+            reminders[reminder["id"]] = reminder
+        if built:
+            self._save_json(self.reminders_file, reminders)
+        return [reminder["id"] for reminder in built]
 
-        from datetime import datetime
+    @classmethod
+    def _build_from(cls, item: Dict) -> Dict:
+        """Build a new reminder record from a dict of ``add_reminder`` arguments."""
+        return cls._build_reminder(
+            item["user_id"],
+            item["message"],
+            item["remind_at"],
+            item.get("channel_id"),
+            item.get("recurring"),
+            item.get("notes"),
+        )
 
-        reminder = {
-            "id": reminder_id,
+    @staticmethod
+    def _build_reminder(
+        user_id: int,
+        message: str,
+        remind_at: str,
+        channel_id: Optional[int],
+        recurring: Optional[str],
+        notes: Optional[str],
+    ) -> Dict:
+        """Build a new reminder record."""
+        return {
+            "id": str(uuid.uuid4()),
             "user_id": user_id,
             "message": message,
             "remind_at": remind_at,
@@ -77,11 +164,6 @@ class DataManager:
             "created_at": datetime.utcnow().isoformat(),
         }
 
-        reminders[reminder_id] = reminder
-        self._save_json(self.reminders_file, reminders)
-
-        return reminder_id
-
     def update_reminder_notes(self, reminder_id: str, user_id: int, notes: str) -> bool:
         """Update notes for a reminder."""
         reminders = self.get_reminders()
@@ -102,6 +184,15 @@ class DataManager:
                 return reminder
         return None
 
+    def get_reminder_by_id(self, reminder_id: str) -> Optional[Dict]:
+        """Get a reminder by ID without an ownership check (for the scheduler)."""
+        return self.get_reminders().get(reminder_id)
+
+    def get_reminders_by_ids(self, reminder_ids: Iterable[str]) -> Dict[str, Dict]:
+        """Get several reminders by ID with one read; missing IDs are left out."""
+        reminders = self.get_reminders()
+        return {rid: reminders[rid] for rid in reminder_ids if rid in reminders}
+
     def remove_reminder(self, reminder_id: str, user_id: int) -> bool:
         """Remove a reminder."""
         reminders = self.get_reminders()
@@ -131,12 +222,25 @@ class DataManager:
             reminders[reminder["id"]] = reminder
             self._save_json(self.reminders_file, reminders)
 
-    def update_reminder_time(self, reminder_id: str, new_time: str):
+    def update_reminders(self, updated: List[Dict]):
+        """Update several reminders with a single write."""
+        reminders = self.get_reminders()
+        changed = False
+        for reminder in updated:
+            if reminder["id"] in reminders:
+                reminders[reminder["id"]] = reminder
+                changed = True
+        if changed:
+            self._save_json(self.reminders_file, reminders)
+
+    def update_reminder_time(self, reminder_id: str, new_time: str) -> bool:
         """Update reminder time (for recurring reminders)."""
         reminders = self.get_reminders()
         if reminder_id in reminders:
             reminders[reminder_id]["remind_at"] = new_time
             self._save_json(self.reminders_file, reminders)
+            return True
+        return False
 
     def delete_reminder(self, reminder_id: str):
         """Delete a reminder by ID."""
@@ -145,6 +249,16 @@ class DataManager:
             del reminders[reminder_id]
             self._save_json(self.reminders_file, reminders)
 
+    def delete_reminders(self, reminder_ids: List[str]):
+        """Delete several reminders with a single write."""
+        reminders = self.get_reminders()
+        removed = [rid for rid in reminder_ids if reminders.pop(rid, None)]
+        if removed:
+            self._save_json(self.reminders_file, reminders)
+
+    def close(self):
+        """Flush pending state (no-op for the JSON store)."""
+
     # Configuration (Guild settings)
     def get_config(self) -> Dict[str, Any]:
         """Get all guild configurations."""
@@ -184,3 +298,22 @@ class DataManager:
                 self._save_json(self.config_file, config)
                 return True
         return False
+
+
+def create_data_manager(data_dir: str = "data") -> DataManager:
+    """Create the data manager selected by ``REMINDER_STORAGE``.
+
+    ``json`` (default) rewrites reminders.json on every change; ``journal``
+    keeps reminders in memory and appends changes to a journal file;
+    ``sqlite`` stores everything in an indexed reminders.db.
+    """
+    mode = os.getenv("REMINDER_STORAGE", "json").lower()
+    if mode == "journal":
+        from utils.journal_store import JournalDataManager
+
+        return JournalDataManager(data_dir)
+    if mode == "sqlite":
+        from utils.sqlite_store import SQLiteDataManager
+
+        return SQLiteDataManager(data_dir)
+    return DataManager(data_dir)
@@ -0,0 +1,193 @@
+"""Fsync'd journal of in-flight reminder deliveries.
+
+Sending a reminder and recording that it was sent (advancing or deleting
+it in the store) are two steps; a crash between them would deliver it
+again on restart. The scheduler therefore appends a record at each step
+of a delivery and fsyncs it before moving on::
+
+    {"op": "claimed", "id": "...", "due": 1767225600, "route": ["dm", 42], "at": 1767225601.2}
+    {"op": "sent", "id": "...", "due": 1767225600, "message_id": 1234}
+    {"op": "advanced", "id": "...", "due": 1767225600}
+
+A delivery is one occurrence, ``(id, due)``, and is open until its
+``advanced`` record. Only open deliveries matter after a crash, and the
+journal is rewritten with just those every ``COMPACT_EVERY`` records, so
+recovery reads a short file instead of rescanning every reminder.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from utils.data_manager import atomic_write
+
+logger = logging.getLogger(__name__)
+
+# Delivery states
+CLAIMED = "claimed"
+SENT = "sent"
+ADVANCED = "advanced"
+
+# Settled records appended before the journal is rewritten with only
+# open deliveries
+COMPACT_EVERY = 1000
+
+DeliveryKey = Tuple[str, int]
+
+
+class PendingDelivery:
+    """An occurrence that was claimed but not yet advanced in the store."""
+
+    __slots__ = ("id", "due", "route", "claimed_at", "state", "message_id")
+
+    def __init__(
+        self,
+        reminder_id: str,
+        due: int,
+        route: Optional[Tuple[str, int]] = None,
+        claimed_at: float = 0.0,
+        state: str = CLAIMED,
+        message_id: Optional[int] = None,
+    ):
+        self.id = reminder_id
+        self.due = due
+        self.route = route
+        self.claimed_at = claimed_at
+        self.state = state
+        self.message_id = message_id
+
+    @property
+    def key(self) -> DeliveryKey:
+        return self.id, self.due
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Journal records that recreate this delivery."""
+        records = [
+            {
+                "op": CLAIMED,
+                "id": self.id,
+                "due": self.due,
+                "route": list(self.route) if self.route else None,
+                "at": self.claimed_at,
+            }
+        ]
+        if self.state == SENT:
+            records.append(
+                {"op": SENT, "id": self.id, "due": self.due, "message_id": self.message_id}
+            )
+        return records
+
+
+class DeliveryJournal:
+    """Append-only, fsync'd record of deliveries (see module docstring).
+
+    Not thread-safe; the reminder service calls it on the storage thread.
+    """
+
+    def __init__(self, path: Path, compact_every: int = COMPACT_EVERY):
+        self.path = Path(path)
+        self.compact_every = compact_every
+        self._pending: Dict[DeliveryKey, PendingDelivery] = {}
+        self._records = 0
+        if self._replay():
+            # Don't append after a partial line; start a clean journal
+            self.compact()
+
+    def _replay(self) -> bool:
+        """Load open deliveries from the journal.
+
+        Returns:
+            True if a corrupt line was skipped.
+        """
+        if not self.path.exists():
+            return False
+        torn = False
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    self._apply(json.loads(line))
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    # Only the last line can be torn by a crash mid-append
+                    logger.warning(f"Skipping corrupt delivery journal line {line_no}")
+                    torn = True
+                    continue
+                self._records += 1
+        if self._pending:
+            logger.info(f"{len(self._pending)} delivery(ies) open in {self.path.name}")
+        return torn
+
+    def _apply(self, record: Dict[str, Any]):
+        key = (record["id"], int(record["due"]))
+        op = record["op"]
+        if op == CLAIMED:
+            route = record.get("route")
+            self._pending[key] = PendingDelivery(
+                key[0], key[1], tuple(route) if route else None, record.get("at", 0.0)
+            )
+        elif op == SENT:
+            delivery = self._pending.setdefault(key, PendingDelivery(*key))
+            delivery.state = SENT
+            delivery.message_id = record.get("message_id")
+        elif op == ADVANCED:
+            self._pending.pop(key, None)
+
+    def _write(self, records: List[Dict[str, Any]]):
+        """Apply records, then append and fsync them as one write."""
+        if not records:
+            return
+        for record in records:
+            self._apply(record)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records))
+            f.flush()
+            os.fsync(f.fileno())
+        self._records += len(records)
+        # Count only records beyond those a rewrite would keep
+        if self._records - 2 * len(self._pending) >= self.compact_every:
+            self.compact()
+
+    def claim(self, keys: Iterable[DeliveryKey], route: Hashable):
+        """Record that these occurrences are about to be sent to ``route``."""
+        now = time.time()
+        self._write(
+            [
+                {"op": CLAIMED, "id": rid, "due": due, "route": list(route), "at": now}
+                for rid, due in keys
+            ]
+        )
+
+    def mark_sent(self, keys: Iterable[DeliveryKey], message_id: Optional[int] = None):
+        """Record that Discord accepted the message carrying these occurrences."""
+        self._write(
+            [
+                {"op": SENT, "id": rid, "due": due, "message_id": message_id}
+                for rid, due in keys
+            ]
+        )
+
+    def mark_advanced(self, keys: Iterable[DeliveryKey]):
+        """Record that the store has moved past these occurrences (closes them)."""
+        self._write(
+            [
+                {"op": ADVANCED, "id": rid, "due": due}
+                for rid, due in keys
+                if (rid, due) in self._pending
+            ]
+        )
+
+    def pending(self) -> List[PendingDelivery]:
+        """Open deliveries, oldest claim first."""
+        return sorted(self._pending.values(), key=lambda d: d.claimed_at)
+
+    def compact(self):
+        """Atomically rewrite the journal with only the open deliveries."""
+        records = [r for d in self._pending.values() for r in d.records()]
+        with atomic_write(self.path) as f:
+            f.write("".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records))
+        self._records = len(records)
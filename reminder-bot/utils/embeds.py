@@ -39,16 +39,25 @@ def create_reminder_embed(
     return embed
 
 
-def create_reminder_list_embed(reminders: List[dict]) -> discord.Embed:
-    """Create an embed listing reminders."""
+def create_reminder_list_embed(
+    reminders: List[dict], query: Optional[str] = None
+) -> discord.Embed:
+    """Create an embed listing reminders (search results if ``query`` is given)."""
     embed = discord.Embed(
         title="📋 Your Reminders",
         description=f"You have {len(reminders)} active reminder(s)",
         color=discord.Color.blue(),
     )
+    if query is not None:
+        embed.title = "🔍 Reminder Search"
+        embed.description = f"{len(reminders)} reminder(s) matching `{query[:100]}`"
 
     if not reminders:
-        embed.description = "No active reminders"
+        embed.description = (
+            "No active reminders"
+            if query is None
+            else f"No reminders matching `{query[:100]}`"
+        )
         return embed
 
     # Sort by remind_at
@@ -85,6 +94,29 @@ def create_reminder_list_embed(reminders: List[dict]) -> discord.Embed:
     return embed
 
 
+def create_upcoming_embed(occurrences: List[tuple]) -> discord.Embed:
+    """Create an embed listing upcoming occurrences (``(datetime, Reminder)`` pairs)."""
+    embed = discord.Embed(
+        title="🗓️ Upcoming Reminders",
+        description=f"Your next {len(occurrences)} occurrence(s)",
+        color=discord.Color.blue(),
+    )
+
+    if not occurrences:
+        embed.description = "No upcoming reminders"
+        return embed
+
+    lines = []
+    for when, reminder in occurrences:
+        ts = int(when.timestamp())
+        message = (reminder.message or "No message")[:50]
+        rec_str = " 🔄" if reminder.recurring else ""
+        lines.append(f"<t:{ts}:f> (<t:{ts}:R>) — {message}{rec_str}")
+
+    embed.description = "\n".join(lines)[:4096]
+    return embed
+
+
 def create_success_embed(message: str) -> discord.Embed:
     """Create a success embed."""
     return discord.Embed(
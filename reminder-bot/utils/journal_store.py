@@ -0,0 +1,247 @@
+"""Write-behind reminder store backed by a snapshot plus an append-only journal."""
+
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.data_manager import DataManager, atomic_write
+from utils.reminder_record import Reminder, parse_epoch
+
+logger = logging.getLogger(__name__)
+
+# Journal records written before the snapshot is rewritten
+COMPACT_EVERY = 1000
+
+
+class JournalDataManager(DataManager):
+    """DataManager that keeps reminders resident in memory.
+
+    Each mutation appends one JSON line to ``reminders.journal`` instead of
+    rewriting reminders.json. The journal is folded into the snapshot
+    (reminders.json, same format as the plain store) every
+    ``COMPACT_EVERY`` records and on ``close()``. Startup replays the
+    snapshot and then the journal.
+
+    Journal records::
+
+        {"op": "add", "reminder": {...}}
+        {"op": "update", "reminder": {...}}
+        {"op": "delete", "id": "..."}
+
+    Records carry the full reminder, so replaying a journal over a snapshot
+    that already contains it is harmless.
+
+    Resident reminders are compact ``Reminder`` records; the dict format is
+    only produced at the API boundary and in the files.
+    """
+
+    def __init__(self, data_dir: str = "data", compact_every: int = COMPACT_EVERY):
+        super().__init__(data_dir)
+        self.journal_file = self.data_dir / "reminders.journal"
+        self.compact_every = compact_every
+        self._reminders: Dict[str, Reminder] = {}
+        self._journal_records = 0
+        torn = self._replay()
+        self._journal = open(self.journal_file, "a", encoding="utf-8")
+        if torn:
+            # Don't append after a partial line; start a clean journal
+            self.compact()
+
+    def _replay(self) -> bool:
+        """Load the snapshot and apply the journal on top of it.
+
+        Returns:
+            True if a corrupt journal line was skipped.
+        """
+        self._reminders = {}
+        for reminder_id, data in self._load_json(self.reminders_file, {}).items():
+            self._apply({"op": "add", "reminder": data})
+        if not self.journal_file.exists():
+            return False
+
+        torn = False
+        with open(self.journal_file, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Only the last line can be torn by a crash mid-append
+                    logger.warning(f"Skipping corrupt journal line {line_no}")
+                    torn = True
+                    continue
+                self._apply(record)
+                self._journal_records += 1
+
+        logger.info(
+            f"Loaded {len(self._reminders)} reminder(s) "
+            f"({self._journal_records} journal record(s) replayed)"
+        )
+        return torn
+
+    def _apply(self, record: Dict[str, Any]):
+        """Apply one journal record to the in-memory reminders."""
+        op = record.get("op")
+        if op in ("add", "update"):
+            try:
+                reminder = Reminder.from_dict(record["reminder"])
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping unreadable reminder record: {e}")
+                return
+            self._reminders[reminder.id] = reminder
+        elif op == "delete":
+            self._reminders.pop(record["id"], None)
+
+    def _append(self, record: Dict[str, Any]):
+        """Apply a record in memory and append it to the journal."""
+        self._apply(record)
+        self._journal.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._journal.flush()
+        self._journal_records += 1
+        if self._journal_records >= self.compact_every:
+            self.compact()
+
+    def _append_many(self, records: List[Dict[str, Any]]):
+        """Like ``_append`` for several records, with a single flush."""
+        for record in records:
+            self._apply(record)
+        self._journal.write(
+            "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records)
+        )
+        self._journal.flush()
+        self._journal_records += len(records)
+        if self._journal_records >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        """Write the in-memory reminders as a new snapshot and truncate the journal."""
+        with atomic_write(self.reminders_file) as f:
+            json.dump(
+                {rid: r.to_dict() for rid, r in self._reminders.items()},
+                f,
+                separators=(",", ":"),
+            )
+
+        # The snapshot now holds everything; a crash before this truncate
+        # just replays records that are already applied.
+        self._journal.close()
+        self._journal = open(self.journal_file, "w", encoding="utf-8")
+        self._journal_records = 0
+
+    def close(self):
+        """Compact and close the journal."""
+        if self._journal.closed:
+            return
+        if self._journal_records:
+            self.compact()
+        self._journal.close()
+
+    # Reminders
+    def get_reminders(self) -> Dict[str, Dict]:
+        """Get all reminders."""
+        return {rid: r.to_dict() for rid, r in self._reminders.items()}
+
+    def get_all_reminders(self) -> List[Dict]:
+        """Get all reminders as a list."""
+        return [r.to_dict() for r in self._reminders.values()]
+
+    def get_user_reminders(self, user_id: int) -> List[Dict]:
+        """Get all reminders for a user."""
+        return [r.to_dict() for r in self._reminders.values() if r.user_id == user_id]
+
+    def add_reminder(
+        self,
+        user_id: int,
+        message: str,
+        remind_at: str,
+        channel_id: Optional[int] = None,
+        recurring: Optional[str] = None,
+        notes: Optional[str] = None,
+    ) -> str:
+        """Add a reminder."""
+        reminder = self._build_reminder(
+            user_id, message, remind_at, channel_id, recurring, notes
+        )
+        self._append({"op": "add", "reminder": reminder})
+        return reminder["id"]
+
+    def add_reminders(self, new: List[Dict]) -> List[str]:
+        """Add several reminders (one journal record each, one flush)."""
+        built = [self._build_from(item) for item in new]
+        self._append_many([{"op": "add", "reminder": r} for r in built])
+        return [reminder["id"] for reminder in built]
+
+    def update_reminder_notes(self, reminder_id: str, user_id: int, notes: str) -> bool:
+        """Update notes for a reminder."""
+        reminder = self._reminders.get(reminder_id)
+        if reminder and reminder.user_id == user_id:
+            self._append(
+                {"op": "update", "reminder": {**reminder.to_dict(), "notes": notes}}
+            )
+            return True
+        return False
+
+    def get_reminder(self, reminder_id: str, user_id: int) -> Optional[Dict]:
+        """Get a specific reminder by ID."""
+        reminder = self._reminders.get(reminder_id)
+        if reminder and reminder.user_id == user_id:
+            return reminder.to_dict()
+        return None
+
+    def get_reminder_by_id(self, reminder_id: str) -> Optional[Dict]:
+        """Get a reminder by ID without an ownership check (for the scheduler)."""
+        reminder = self._reminders.get(reminder_id)
+        return reminder.to_dict() if reminder else None
+
+    def get_reminders_by_ids(self, reminder_ids: Iterable[str]) -> Dict[str, Dict]:
+        """Get several reminders by ID; missing IDs are left out."""
+        return {
+            rid: self._reminders[rid].to_dict()
+            for rid in reminder_ids
+            if rid in self._reminders
+        }
+
+    def remove_reminder(self, reminder_id: str, user_id: int) -> bool:
+        """Remove a reminder."""
+        reminder = self._reminders.get(reminder_id)
+        if reminder and reminder.user_id == user_id:
+            self._append({"op": "delete", "id": reminder_id})
+            return True
+        return False
+
+    def get_due_reminders(self, current_time: str) -> List[Dict]:
+        """Get all reminders due at or before current_time."""
+        cutoff = parse_epoch(current_time)
+        return [r.to_dict() for r in self._reminders.values() if r.due <= cutoff]
+
+    def update_reminder(self, reminder: Dict):
+        """Update a reminder (for recurring reminders)."""
+        if reminder["id"] in self._reminders:
+            self._append({"op": "update", "reminder": dict(reminder)})
+
+    def update_reminders(self, updated: List[Dict]):
+        """Update several reminders (one journal record each)."""
+        for reminder in updated:
+            self.update_reminder(reminder)
+
+    def update_reminder_time(self, reminder_id: str, new_time: str) -> bool:
+        """Update reminder time (for recurring reminders)."""
+        reminder = self._reminders.get(reminder_id)
+        if reminder:
+            self._append(
+                {"op": "update", "reminder": {**reminder.to_dict(), "remind_at": new_time}}
+            )
+            return True
+        return False
+
+    def delete_reminder(self, reminder_id: str):
+        """Delete a reminder by ID."""
+        if reminder_id in self._reminders:
+            self._append({"op": "delete", "id": reminder_id})
+
+    def delete_reminders(self, reminder_ids: List[str]):
+        """Delete several reminders (one journal record each)."""
+        for reminder_id in reminder_ids:
+            self.delete_reminder(reminder_id)
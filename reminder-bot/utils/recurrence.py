@@ -0,0 +1,217 @@
+"""Compiled recurrence rules for recurring reminders.
+
+A ``recurring`` string such as ``"monthly on last friday at 02:00pm"`` is
+parsed once into a ``RecurrenceRule`` (cached by string). The rule computes
+the next occurrence with calendar arithmetic instead of re-parsing the text
+and walking day by day.
+"""
+
+import calendar
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
+
+WEEKDAYS = {
+    "monday": 0,
+    "tuesday": 1,
+    "wednesday": 2,
+    "thursday": 3,
+    "friday": 4,
+    "saturday": 5,
+    "sunday": 6,
+}
+
+ORDINALS = {"first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5}
+
+# Rule kinds
+INTERVAL = "interval"  # fixed timedelta (daily, weekly, plain monthly)
+WEEKDAYS_OF_WEEK = "weekdays"  # "weekly on monday,friday"
+MONTH_DAY = "month_day"  # "monthly on 15th"
+NTH_WEEKDAY = "nth_weekday"  # "monthly on second tuesday"
+LAST_WEEKDAY = "last_weekday"  # "monthly on last friday"
+
+
+def _add_months(year: int, month: int, months: int) -> Tuple[int, int]:
+    index = year * 12 + (month - 1) + months
+    return index // 12, index % 12 + 1
+
+
+class RecurrenceRule:
+    """A parsed recurrence pattern.
+
+    Attributes:
+        kind: One of the rule kind constants above.
+        interval: Step for ``INTERVAL`` rules.
+        weekdays: Sorted weekday numbers (Monday=0) for ``WEEKDAYS_OF_WEEK``.
+        day: Day of month for ``MONTH_DAY``.
+        nth: Week number (1-5) for ``NTH_WEEKDAY``.
+        weekday: Target weekday for ``NTH_WEEKDAY`` and ``LAST_WEEKDAY``.
+    """
+
+    __slots__ = ("kind", "interval", "weekdays", "day", "nth", "weekday")
+
+    def __init__(
+        self,
+        kind: str,
+        interval: Optional[timedelta] = None,
+        weekdays: Tuple[int, ...] = (),
+        day: int = 0,
+        nth: int = 0,
+        weekday: int = 0,
+    ):
+        self.kind = kind
+        self.interval = interval
+        self.weekdays = weekdays
+        self.day = day
+        self.nth = nth
+        self.weekday = weekday
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self.__slots__[1:]
+            if getattr(self, name)
+        )
+        return f"RecurrenceRule({self.kind!r}{', ' + fields if fields else ''})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RecurrenceRule):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in self.__slots__)
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, n) for n in self.__slots__))
+
+    def next_after(self, current: datetime) -> datetime:
+        """Return the occurrence that follows ``current``."""
+        kind = self.kind
+        if kind == INTERVAL:
+            return current + self.interval
+
+        if kind == WEEKDAYS_OF_WEEK:
+            today = current.weekday()
+            days_ahead = min((day - today - 1) % 7 + 1 for day in self.weekdays)
+            return current + timedelta(days=days_ahead)
+
+        year, month = _add_months(current.year, current.month, 1)
+
+        if kind == MONTH_DAY:
+            last_day = calendar.monthrange(year, month)[1]
+            return current.replace(year=year, month=month, day=min(self.day, last_day))
+
+        if kind == NTH_WEEKDAY:
+            # A fifth weekday is missing in some months; at most a few skips
+            while True:
+                first_weekday, last_day = calendar.monthrange(year, month)
+                day = 1 + (self.weekday - first_weekday) % 7 + 7 * (self.nth - 1)
+                if day <= last_day:
+                    break
+                year, month = _add_months(year, month, 1)
+        else:  # LAST_WEEKDAY
+            first_weekday, last_day = calendar.monthrange(year, month)
+            last_weekday = (first_weekday + last_day - 1) % 7
+            day = last_day - (last_weekday - self.weekday) % 7
+
+        return current.replace(
+            year=year, month=month, day=day, second=0, microsecond=0
+        )
+
+    def fast_forward(self, current: datetime, now: datetime) -> Tuple[datetime, int]:
+        """Skip every occurrence up to ``now``.
+
+        Returns:
+            ``(next_occurrence, missed)``: the first occurrence after ``now``
+            and how many occurrences fell in ``[current, now]``
+            (0 if ``current`` is still in the future).
+        """
+        if current > now:
+            return current, 0
+        missed = 1
+
+        # Jump whole periods in one step where the count is known exactly
+        if self.kind == INTERVAL:
+            steps = (now - current) // self.interval
+            return current + (steps + 1) * self.interval, missed + steps
+        if self.kind == WEEKDAYS_OF_WEEK:
+            weeks = (now - current) // timedelta(weeks=1)
+            if weeks:
+                # Every 7-day window holds each listed weekday exactly once
+                current += timedelta(weeks=weeks)
+                missed += weeks * len(self.weekdays)
+
+        # Monthly rules: at most one step per month
+        while True:
+            current = self.next_after(current)
+            if current > now:
+                return current, missed
+            missed += 1
+
+    def iter_after(self, current: datetime, count: Optional[int] = None) -> Iterator[datetime]:
+        """Yield the next ``count`` occurrences after ``current`` (unbounded if None)."""
+        produced = 0
+        while count is None or produced < count:
+            current = self.next_after(current)
+            yield current
+            produced += 1
+
+
+DAILY = RecurrenceRule(INTERVAL, interval=timedelta(days=1))
+WEEKLY = RecurrenceRule(INTERVAL, interval=timedelta(weeks=1))
+# Plain "monthly" has always advanced by 30 days
+MONTHLY = RecurrenceRule(INTERVAL, interval=timedelta(days=30))
+
+
+def _on_clause(text: str) -> str:
+    """The part between " on " and " at " ("monday,friday" in "weekly on monday,friday at 9am")."""
+    return text.split(" on ", 1)[1].split(" at ", 1)[0].strip()
+
+
+def _parse_monthly(text: str) -> RecurrenceRule:
+    if " on " not in text:
+        return MONTHLY
+    words = _on_clause(text).split()
+    if not words:
+        return MONTHLY
+
+    # "15th", "1st", "22nd", "3rd"
+    if len(words) == 1:
+        digits = words[0].rstrip("stndrh")
+        if digits.isdigit() and 1 <= int(digits) <= 31:
+            return RecurrenceRule(MONTH_DAY, day=int(digits))
+
+    # "first monday", "last friday"
+    if len(words) == 2 and words[1] in WEEKDAYS:
+        weekday = WEEKDAYS[words[1]]
+        if words[0] == "last":
+            return RecurrenceRule(LAST_WEEKDAY, weekday=weekday)
+        if words[0] in ORDINALS:
+            return RecurrenceRule(NTH_WEEKDAY, nth=ORDINALS[words[0]], weekday=weekday)
+
+    return MONTHLY
+
+
+@lru_cache(maxsize=4096)
+def parse_recurrence(recurring: str) -> RecurrenceRule:
+    """Compile a stored ``recurring`` string into a rule (cached).
+
+    Unknown patterns fall back to daily, matching the scheduler's
+    historical behavior.
+    """
+    text = recurring.lower().strip()
+    if text.startswith("daily"):
+        return DAILY
+    if text.startswith("weekly"):
+        if " on " in text:
+            days = sorted(
+                {
+                    WEEKDAYS[name.strip()]
+                    for name in _on_clause(text).split(",")
+                    if name.strip() in WEEKDAYS
+                }
+            )
+            if days:
+                return RecurrenceRule(WEEKDAYS_OF_WEEK, weekdays=tuple(days))
+        return WEEKLY
+    if text.startswith("monthly"):
+        return _parse_monthly(text)
+    return DAILY
@@ -0,0 +1,438 @@
+"""Streaming import/export of reminders as CSV and iCalendar.
+
+Writers take any iterable of stored reminder dicts and write one record at
+a time; readers yield one ``add_reminder``-style dict per row or VEVENT, so
+neither direction holds the whole document in memory.
+
+Imports never schedule anything in the past: a one-time reminder whose
+time has passed is skipped, and a recurring one is moved to its next
+occurrence (as the scheduler would after downtime).
+
+iCalendar export maps recurrence patterns to RRULEs and keeps the original
+pattern in ``X-REMINDER-RECURRING`` (plus the owner and channel in
+``X-REMINDER-USER-ID`` / ``X-REMINDER-CHANNEL-ID``) so a round trip is
+lossless. Events from other calendars are imported from their RRULE where
+it maps onto a supported pattern.
+"""
+
+import csv
+import re
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
+
+import pytz
+
+from utils.recurrence import (
+    INTERVAL,
+    LAST_WEEKDAY,
+    MONTH_DAY,
+    NTH_WEEKDAY,
+    ORDINALS,
+    WEEKDAYS,
+    WEEKDAYS_OF_WEEK,
+    parse_recurrence,
+)
+from utils.time_parser import LOCAL_TZ
+
+UTC = pytz.UTC
+
+FORMATS = ("csv", "ics")
+CSV_FIELDS = (
+    "id",
+    "user_id",
+    "message",
+    "remind_at",
+    "channel_id",
+    "recurring",
+    "notes",
+    "created_at",
+)
+
+# RFC 5545 weekday codes, Monday=0 like utils.recurrence
+ICAL_DAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+DAY_NAMES = {number: name for name, number in WEEKDAYS.items()}
+ORDINAL_NAMES = {number: name for name, number in ORDINALS.items()}
+# Content lines are folded at 75 octets
+MAX_LINE_OCTETS = 75
+
+_BYDAY = re.compile(r"^([+-]?\d)?(MO|TU|WE|TH|FR|SA|SU)$")
+
+
+def detect_format(filename: str) -> Optional[str]:
+    """Format for a file name by extension (``.csv`` / ``.ics``), or None."""
+    suffix = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    if suffix in ("ics", "ical", "ifb", "icalendar"):
+        return "ics"
+    if suffix == "csv":
+        return "csv"
+    return None
+
+
+def export_reminders(reminders: Iterable[Dict], out: TextIO, fmt: str) -> int:
+    """Write ``reminders`` to ``out`` in ``fmt``.
+
+    Returns:
+        The number of reminders written.
+    """
+    if fmt == "csv":
+        return _write_csv(reminders, out)
+    if fmt == "ics":
+        return _write_ics(reminders, out)
+    raise ValueError(f"Unknown format: {fmt}")
+
+
+class PastReminderError(ValueError):
+    """A one-time reminder whose time has already passed."""
+
+
+def import_reminders(
+    source: TextIO,
+    fmt: str,
+    default_user_id: Optional[int] = None,
+    errors: Optional[List[str]] = None,
+    skipped: Optional[List[str]] = None,
+    advanced: Optional[List[str]] = None,
+    now: Optional[datetime] = None,
+) -> Iterator[Dict]:
+    """Yield validated ``add_reminder`` dicts read from ``source``.
+
+    Args:
+        source: Text stream to read.
+        fmt: ``"csv"`` or ``"ics"``.
+        default_user_id: Owner for records that do not name one.
+        errors: If given, invalid records are described here and skipped;
+            otherwise the first one raises ``ValueError``.
+        skipped: If given, one-time reminders already in the past are
+            described here and skipped; otherwise they count as invalid.
+        advanced: If given, recurring reminders moved forward past ``now``
+            are described here.
+        now: Reference time for the checks above (default: the current time).
+    """
+    if fmt == "csv":
+        rows, convert = _read_csv(source), dict
+    elif fmt == "ics":
+        rows, convert = _read_ics(source), _event_record
+    else:
+        raise ValueError(f"Unknown format: {fmt}")
+    now = now or datetime.now(UTC)
+
+    for position, raw in rows:
+        try:
+            record = _normalize(convert(raw), default_user_id)
+            moved = _skip_past(record, now)
+        except PastReminderError as e:
+            if skipped is not None:
+                skipped.append(f"{position}: {e}")
+                continue
+            if errors is None:
+                raise ValueError(f"{position}: {e}") from e
+            errors.append(f"{position}: {e}")
+            continue
+        except (KeyError, TypeError, ValueError) as e:
+            if errors is None:
+                raise ValueError(f"{position}: {e}") from e
+            errors.append(f"{position}: {e}")
+            continue
+        if moved and advanced is not None:
+            advanced.append(f"{position}: moved to {record['remind_at']}")
+        yield record
+
+
+def _skip_past(record: Dict, now: datetime) -> bool:
+    """Move a past recurring record to its next occurrence after ``now``.
+
+    Returns:
+        True if it was moved.
+
+    Raises:
+        PastReminderError: If a one-time record is in the past.
+    """
+    remind_at = datetime.fromisoformat(record["remind_at"])
+    if remind_at > now:
+        return False
+    if not record["recurring"]:
+        raise PastReminderError(f"one-time reminder at {record['remind_at']} is in the past")
+    next_time, _ = parse_recurrence(record["recurring"]).fast_forward(remind_at, now)
+    record["remind_at"] = next_time.astimezone(UTC).isoformat()
+    return True
+
+
+def _normalize(raw: Dict, default_user_id: Optional[int]) -> Dict:
+    """Validate one record and convert it to ``add_reminder`` arguments."""
+    user_id = raw.get("user_id") or default_user_id
+    if not user_id:
+        raise ValueError("missing user_id")
+    message = (raw.get("message") or "").strip()
+    if not message:
+        raise ValueError("missing message")
+
+    remind_at = raw.get("remind_at")
+    if isinstance(remind_at, str):
+        if not remind_at.strip():
+            raise ValueError("missing remind_at")
+        remind_at = datetime.fromisoformat(remind_at.strip().replace("Z", "+00:00"))
+    if not isinstance(remind_at, datetime):
+        raise ValueError("missing remind_at")
+    if remind_at.tzinfo is None:
+        remind_at = UTC.localize(remind_at)
+
+    recurring = (raw.get("recurring") or "").strip() or None
+    if recurring and not recurring.lower().startswith(("daily", "weekly", "monthly")):
+        raise ValueError(f"unsupported recurrence {recurring!r}")
+
+    channel_id = raw.get("channel_id")
+    return {
+        "user_id": int(user_id),
+        "message": message,
+        "remind_at": remind_at.astimezone(UTC).isoformat(),
+        "channel_id": int(channel_id) if channel_id else None,
+        "recurring": recurring,
+        "notes": (raw.get("notes") or "").strip() or None,
+    }
+
+
+# CSV
+
+
+def _write_csv(reminders: Iterable[Dict], out: TextIO) -> int:
+    writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for reminder in reminders:
+        writer.writerow(
+            {key: "" if reminder.get(key) is None else reminder[key] for key in CSV_FIELDS}
+        )
+        count += 1
+    return count
+
+
+def _read_csv(source: TextIO) -> Iterator:
+    reader = csv.DictReader(source)
+    for row in reader:
+        yield f"line {reader.line_num}", row
+
+
+# iCalendar
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _unescape(text: str) -> str:
+    return re.sub(
+        r"\\(.)",
+        lambda m: "\n" if m.group(1) in "nN" else m.group(1),
+        text,
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line into CRLF-terminated chunks of at most 75 octets."""
+    chunks = []
+    current, size = [], 0
+    for char in line:
+        width = len(char.encode("utf-8"))
+        if size + width > MAX_LINE_OCTETS:
+            chunks.append("".join(current))
+            # Continuation lines start with a space, which counts
+            current, size = [" "], 1
+        current.append(char)
+        size += width
+    chunks.append("".join(current))
+    return "\r\n".join(chunks) + "\r\n"
+
+
+def _ical_utc(value: str) -> str:
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = UTC.localize(parsed)
+    return parsed.astimezone(UTC).strftime("%Y%m%dT%H%M%SZ")
+
+
+def to_rrule(recurring: str) -> str:
+    """RRULE equivalent of a stored recurrence pattern."""
+    rule = parse_recurrence(recurring)
+    if rule.kind == INTERVAL:
+        days = rule.interval.days
+        if days % 7 == 0:
+            freq, interval = "WEEKLY", days // 7
+        else:
+            freq, interval = "DAILY", days
+        return f"FREQ={freq}" + (f";INTERVAL={interval}" if interval > 1 else "")
+    if rule.kind == WEEKDAYS_OF_WEEK:
+        return "FREQ=WEEKLY;BYDAY=" + ",".join(ICAL_DAYS[d] for d in rule.weekdays)
+    if rule.kind == MONTH_DAY:
+        return f"FREQ=MONTHLY;BYMONTHDAY={rule.day}"
+    if rule.kind == NTH_WEEKDAY:
+        return f"FREQ=MONTHLY;BYDAY={rule.nth}{ICAL_DAYS[rule.weekday]}"
+    if rule.kind == LAST_WEEKDAY:
+        return f"FREQ=MONTHLY;BYDAY=-1{ICAL_DAYS[rule.weekday]}"
+    raise ValueError(f"No RRULE for {recurring!r}")
+
+
+def _ordinal(day: int) -> str:
+    if 10 <= day % 100 <= 20:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
+    return f"{day}{suffix}"
+
+
+def from_rrule(rrule: str, start: datetime) -> str:
+    """Stored recurrence pattern for an RRULE starting at ``start``.
+
+    Raises:
+        ValueError: If the rule has no equivalent pattern (e.g. COUNT, UNTIL,
+            yearly rules, or several BYDAY values on a monthly rule).
+    """
+    parts = dict(
+        part.split("=", 1) for part in rrule.upper().split(";") if "=" in part
+    )
+    unsupported = set(parts) - {"FREQ", "INTERVAL", "BYDAY", "BYMONTHDAY", "WKST"}
+    if unsupported:
+        raise ValueError(f"unsupported RRULE parts {sorted(unsupported)}")
+    freq = parts.get("FREQ")
+    interval = int(parts.get("INTERVAL", "1"))
+    byday = [d for d in parts.get("BYDAY", "").split(",") if d]
+
+    if freq == "DAILY" and not byday and interval in (1, 7, 30):
+        # Plain "monthly" has always meant every 30 days
+        pattern = {1: "daily", 7: "weekly", 30: "monthly"}[interval]
+    elif freq == "WEEKLY" and interval == 1:
+        days = []
+        for code in byday:
+            match = _BYDAY.match(code)
+            if not match or match.group(1):
+                raise ValueError(f"unsupported BYDAY {code}")
+            days.append(DAY_NAMES[ICAL_DAYS.index(match.group(2))])
+        pattern = "weekly on " + ",".join(days) if days else "weekly"
+    elif freq == "MONTHLY" and interval == 1:
+        if "BYMONTHDAY" in parts and not byday:
+            day = int(parts["BYMONTHDAY"])
+            if not 1 <= day <= 31:
+                raise ValueError(f"unsupported BYMONTHDAY {day}")
+            pattern = f"monthly on {_ordinal(day)}"
+        elif len(byday) == 1 and "BYMONTHDAY" not in parts:
+            match = _BYDAY.match(byday[0])
+            nth = int(match.group(1) or 0) if match else 0
+            if not match or not (nth == -1 or nth in ORDINAL_NAMES):
+                raise ValueError(f"unsupported BYDAY {byday[0]}")
+            which = "last" if nth == -1 else ORDINAL_NAMES[nth]
+            pattern = f"monthly on {which} {DAY_NAMES[ICAL_DAYS.index(match.group(2))]}"
+        elif not byday and "BYMONTHDAY" not in parts:
+            pattern = f"monthly on {_ordinal(start.day)}"
+        else:
+            raise ValueError(f"unsupported RRULE {rrule}")
+    else:
+        raise ValueError(f"unsupported RRULE {rrule}")
+
+    # Same "at" suffix the remind command stores
+    return f"{pattern} at {start.strftime('%I:%M%p').lower()}"
+
+
+def _write_ics(reminders: Iterable[Dict], out: TextIO) -> int:
+    out.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//reminder-bot//EN\r\n")
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+    count = 0
+    for reminder in reminders:
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{reminder['id']}@reminder-bot",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{_ical_utc(reminder['remind_at'])}",
+            f"SUMMARY:{_escape(reminder.get('message') or '')}",
+        ]
+        if reminder.get("notes"):
+            lines.append(f"DESCRIPTION:{_escape(reminder['notes'])}")
+        if reminder.get("recurring"):
+            lines.append(f"RRULE:{to_rrule(reminder['recurring'])}")
+            lines.append(f"X-REMINDER-RECURRING:{_escape(reminder['recurring'])}")
+        lines.append(f"X-REMINDER-USER-ID:{reminder['user_id']}")
+        if reminder.get("channel_id"):
+            lines.append(f"X-REMINDER-CHANNEL-ID:{reminder['channel_id']}")
+        lines.append("END:VEVENT")
+        out.write("".join(_fold(line) for line in lines))
+        count += 1
+    out.write("END:VCALENDAR\r\n")
+    return count
+
+
+def _unfold(source: TextIO) -> Iterator:
+    """Yield ``(line_number, logical_line)`` with folded lines joined."""
+    pending, start = None, 0
+    for number, raw in enumerate(source, 1):
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and pending is not None:
+            pending += line[1:]
+            continue
+        if pending is not None:
+            yield start, pending
+        pending, start = line, number
+    if pending is not None:
+        yield start, pending
+
+
+def _parse_dtstart(value: str, params: Dict[str, str]) -> datetime:
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        naive = datetime.strptime(value[:8], "%Y%m%d")
+        return LOCAL_TZ.localize(naive)
+    if value.endswith("Z"):
+        return UTC.localize(datetime.strptime(value, "%Y%m%dT%H%M%SZ"))
+    naive = datetime.strptime(value, "%Y%m%dT%H%M%S")
+    # Floating times are taken as the bot's local time
+    tz = pytz.timezone(params["TZID"]) if "TZID" in params else LOCAL_TZ
+    return tz.localize(naive)
+
+
+def _read_ics(source: TextIO) -> Iterator:
+    event: Optional[Dict[str, tuple]] = None
+    start = 0
+    for number, line in _unfold(source):
+        if not line:
+            continue
+        head, _, value = line.partition(":")
+        name, *raw_params = head.split(";")
+        name = name.upper()
+        if name == "BEGIN" and value.upper() == "VEVENT":
+            event, start = {}, number
+        elif name == "END" and value.upper() == "VEVENT" and event is not None:
+            yield f"event at line {start}", event
+            event = None
+        elif event is not None:
+            params = dict(p.split("=", 1) for p in raw_params if "=" in p)
+            event.setdefault(name, (value, params))
+
+
+def _event_record(event: Dict[str, tuple]) -> Dict:
+    """Convert a VEVENT's properties to a raw record."""
+    if "DTSTART" not in event:
+        raise ValueError("missing DTSTART")
+    value, params = event["DTSTART"]
+    try:
+        start = _parse_dtstart(value, {k.upper(): v for k, v in params.items()})
+    except pytz.UnknownTimeZoneError as e:
+        raise ValueError(f"unknown TZID {e}") from e
+    recurring = None
+    if "X-REMINDER-RECURRING" in event:
+        recurring = _unescape(event["X-REMINDER-RECURRING"][0])
+    elif "RRULE" in event:
+        recurring = from_rrule(event["RRULE"][0], start.astimezone(LOCAL_TZ))
+
+    def text(name: str) -> Optional[str]:
+        return _unescape(event[name][0]) if name in event else None
+
+    return {
+        "user_id": text("X-REMINDER-USER-ID"),
+        "message": text("SUMMARY"),
+        "remind_at": start,
+        "channel_id": text("X-REMINDER-CHANNEL-ID"),
+        "recurring": recurring,
+        "notes": text("DESCRIPTION"),
+    }
@@ -0,0 +1,214 @@
+"""Compact in-memory reminder record.
+
+Storage and the cogs keep exchanging the JSON dict format::
+
+    {"id", "user_id", "message", "remind_at", "channel_id",
+     "recurring", "notes", "created_at"}
+
+Inside the scheduler and the journal store, reminders are held as
+``Reminder`` objects instead: ``__slots__`` (no per-instance dict), due and
+creation times as integer epoch seconds, the recurrence pattern as its
+shared compiled ``RecurrenceRule``, and user/channel IDs and recurrence
+strings interned so thousands of reminders share one object each.
+Conversion happens only at the storage boundary, and is lossless: a
+timestamp string that isn't in canonical form and any unknown keys are
+kept (only for the records that have them) and written back unchanged.
+"""
+
+import math
+import sys
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import pytz
+
+from utils.recurrence import RecurrenceRule, parse_recurrence
+
+UTC = pytz.UTC
+
+# Keys of the stored dict format that Reminder holds as attributes
+FIELDS = (
+    "id",
+    "user_id",
+    "message",
+    "remind_at",
+    "channel_id",
+    "recurring",
+    "notes",
+    "created_at",
+)
+
+# Shared int objects for user/channel IDs (there are far fewer distinct
+# IDs than reminders)
+_INTERNED_IDS: Dict[int, int] = {}
+
+
+def _intern_id(value: Any) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    value = int(value)
+    return _INTERNED_IDS.setdefault(value, value)
+
+
+def to_timestamp(remind_at: str) -> float:
+    """Convert a stored ``remind_at`` ISO string to UTC epoch seconds.
+
+    Naive timestamps are treated as UTC, matching how reminders are stored.
+    """
+    dt = datetime.fromisoformat(remind_at.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = UTC.localize(dt)
+    return dt.timestamp()
+
+
+def parse_epoch(raw: Optional[str]) -> Optional[int]:
+    """ISO timestamp -> integer epoch seconds (naive values are UTC).
+
+    Fractional seconds round up, so a reminder never fires early.
+    """
+    if not raw:
+        return None
+    parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = UTC.localize(parsed)
+    return math.ceil(parsed.timestamp())
+
+
+def format_epoch(value: Optional[int]) -> Optional[str]:
+    """Integer epoch seconds -> UTC ISO timestamp."""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, UTC).isoformat()
+
+
+class Reminder:
+    """One reminder, stored compactly.
+
+    Attributes:
+        id: Reminder UUID string.
+        user_id: Owner's Discord user ID.
+        message: Reminder text.
+        due: Next due time, integer epoch seconds (UTC).
+        channel_id: Destination channel, or None for DM.
+        recurring: Stored recurrence string (interned), or None.
+        rule: Compiled rule for ``recurring`` (shared between reminders).
+        notes: Optional notes.
+        created: Creation time, integer epoch seconds.
+
+    Records loaded with ``from_dict`` may also carry the original
+    ``remind_at``/``created_at`` strings (when ``format_epoch`` wouldn't
+    reproduce them) and unknown keys, so ``to_dict`` returns what was
+    stored as long as the reminder wasn't changed.
+    """
+
+    __slots__ = (
+        "id",
+        "user_id",
+        "message",
+        "due",
+        "channel_id",
+        "recurring",
+        "rule",
+        "notes",
+        "created",
+        "_remind_at_raw",
+        "_created_raw",
+        "_extra",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        user_id: int,
+        message: str,
+        due: int,
+        channel_id: Optional[int] = None,
+        recurring: Optional[str] = None,
+        notes: Optional[str] = None,
+        created: Optional[int] = None,
+    ):
+        self.id = id
+        self.user_id = _intern_id(user_id)
+        self.message = message
+        self.due = due
+        self.channel_id = _intern_id(channel_id)
+        self.recurring = sys.intern(recurring) if recurring else None
+        self.rule: Optional[RecurrenceRule] = (
+            parse_recurrence(recurring) if recurring else None
+        )
+        self.notes = notes
+        self.created = created
+        self._remind_at_raw: Optional[str] = None
+        self._created_raw: Optional[str] = None
+        self._extra: Optional[Dict[str, Any]] = None
+
+    def __repr__(self) -> str:
+        return f"Reminder({self.id!r}, due={self.due}, recurring={self.recurring!r})"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Reminder":
+        """Build from the JSON dict format.
+
+        Raises:
+            ValueError: If ``remind_at`` is missing or not an ISO timestamp.
+        """
+        remind_at = data.get("remind_at")
+        due = parse_epoch(remind_at)
+        if due is None:
+            raise ValueError(f"Reminder {data.get('id')} has no remind_at")
+        created_at = data.get("created_at")
+        try:
+            created = parse_epoch(created_at)
+        except ValueError:
+            created = None
+        reminder = cls(
+            id=data["id"],
+            user_id=data["user_id"],
+            message=data.get("message", ""),
+            due=due,
+            channel_id=data.get("channel_id"),
+            recurring=data.get("recurring"),
+            notes=data.get("notes"),
+            created=created,
+        )
+        if remind_at != format_epoch(due):
+            reminder._remind_at_raw = remind_at
+        if created_at != format_epoch(created):
+            reminder._created_raw = created_at
+        extra = {key: value for key, value in data.items() if key not in FIELDS}
+        if extra:
+            reminder._extra = extra
+        return reminder
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to the JSON dict format (as loaded, if unchanged)."""
+        remind_at = self._remind_at_raw
+        if remind_at is None or parse_epoch(remind_at) != self.due:
+            remind_at = format_epoch(self.due)
+        created_at = self._created_raw
+        if created_at is None:
+            created_at = format_epoch(self.created)
+        data = {
+            "id": self.id,
+            "user_id": self.user_id,
+            "message": self.message,
+            "remind_at": remind_at,
+            "channel_id": self.channel_id,
+            "recurring": self.recurring,
+            "notes": self.notes,
+            "created_at": created_at,
+        }
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def copy(self) -> "Reminder":
+        clone = Reminder.__new__(Reminder)
+        for name in self.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
+    @property
+    def remind_at(self) -> datetime:
+        """Due time as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.due, UTC)
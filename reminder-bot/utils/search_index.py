@@ -0,0 +1,93 @@
+"""In-memory inverted index over reminder messages and notes."""
+
+import re
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+# Words are runs of letters/digits, matched case-insensitively
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    """Split text into the set of casefolded words it contains."""
+    return frozenset(word.casefold() for word in _WORD.findall(text or ""))
+
+
+class SearchIndex:
+    """Per-user inverted index: word -> IDs of the reminders containing it.
+
+    Updated one reminder at a time, so keeping it current costs a tokenize
+    per mutation, and a query never looks at other users' reminders.
+    """
+
+    def __init__(self):
+        # user_id -> word -> reminder IDs
+        self._postings: Dict[int, Dict[str, Set[str]]] = {}
+        # reminder_id -> (user_id, indexed words), to undo on update/remove
+        self._documents: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, reminder: Dict):
+        """Index (or re-index) a reminder dict."""
+        user_id = int(reminder["user_id"])
+        words = tokenize(reminder.get("message", "")) | tokenize(
+            reminder.get("notes") or ""
+        )
+        previous = self._documents.get(reminder["id"])
+        if previous == (user_id, words):
+            return
+        if previous:
+            self.remove(reminder["id"])
+
+        postings = self._postings.setdefault(user_id, {})
+        for word in words:
+            postings.setdefault(word, set()).add(reminder["id"])
+        self._documents[reminder["id"]] = (user_id, words)
+
+    def remove(self, reminder_id: str):
+        """Drop a reminder from the index (no-op if it is not indexed)."""
+        document = self._documents.pop(reminder_id, None)
+        if not document:
+            return
+        user_id, words = document
+        postings = self._postings[user_id]
+        for word in words:
+            ids = postings[word]
+            ids.discard(reminder_id)
+            if not ids:
+                del postings[word]
+        if not postings:
+            del self._postings[user_id]
+
+    def search(self, user_id: int, query: str) -> List[str]:
+        """IDs of ``user_id``'s reminders containing every word of ``query``.
+
+        Each query word matches indexed words it is a prefix of, so
+        ``"dent"`` finds "dentist"; only the user's own vocabulary is scanned.
+        """
+        postings = self._postings.get(int(user_id))
+        words = tokenize(query)
+        if not postings or not words:
+            return []
+
+        result: Set[str] = set()
+        # Most selective word first, so the intersection shrinks fast
+        for i, matches in enumerate(
+            sorted((self._matching(postings, word) for word in words), key=len)
+        ):
+            result = set(matches) if i == 0 else result & matches
+            if not result:
+                return []
+        return list(result)
+
+    @staticmethod
+    def _matching(postings: Dict[str, Set[str]], word: str) -> Set[str]:
+        exact = postings.get(word, set())
+        prefixed = [
+            ids for indexed, ids in postings.items()
+            if indexed != word and indexed.startswith(word)
+        ]
+        if not prefixed:
+            return exact
+        return exact.union(*prefixed)
@@ -0,0 +1,426 @@
+"""SQLite-backed reminder store."""
+
+import json
+import logging
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.data_manager import DataManager
+from utils.reminder_record import to_timestamp
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reminders (
+    id TEXT PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    message TEXT NOT NULL,
+    remind_at TEXT,
+    remind_ts REAL,
+    channel_id INTEGER,
+    recurring TEXT,
+    notes TEXT,
+    created_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_reminders_user_id ON reminders(user_id);
+CREATE INDEX IF NOT EXISTS idx_reminders_remind_at ON reminders(remind_ts);
+
+CREATE TABLE IF NOT EXISTS guild_config (
+    guild_id TEXT PRIMARY KEY,
+    config TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS workers (
+    worker_id TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS shard_leases (
+    shard INTEGER PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+REMINDER_COLUMNS = (
+    "id",
+    "user_id",
+    "message",
+    "remind_at",
+    "channel_id",
+    "recurring",
+    "notes",
+    "created_at",
+)
+
+# Bound parameters per IN (...) query (SQLite's default limit is 999)
+MAX_QUERY_PARAMS = 500
+
+
+def _remind_ts(remind_at: Optional[str]) -> Optional[float]:
+    """Epoch seconds for the remind_at index (None if missing or unparseable)."""
+    if not remind_at:
+        return None
+    try:
+        return to_timestamp(remind_at)
+    except ValueError:
+        return None
+
+
+class SQLiteDataManager(DataManager):
+    """DataManager backed by ``data/reminders.db``.
+
+    Due-time lookups are range queries on an indexed epoch-seconds column
+    (``remind_ts``, derived from ``remind_at``) and per-user listing uses
+    the ``user_id`` index. The database runs in WAL mode. On first open,
+    existing reminders.json and config.json are imported once.
+    """
+
+    def __init__(self, data_dir: str = "data"):
+        super().__init__(data_dir)
+        self.db_file = self.data_dir / "reminders.db"
+        # Calls may come from worker threads (asyncio.to_thread); serialize them
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self.migrate_from_json()
+
+    def _row_to_reminder(self, row: sqlite3.Row) -> Dict:
+        return {column: row[column] for column in REMINDER_COLUMNS}
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._row_to_reminder(row) for row in rows]
+
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        """Run a write statement and commit; returns the affected row count."""
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            self._conn.commit()
+            return cursor.rowcount
+
+    def _upsert_params(self, reminder: Dict) -> tuple:
+        return (
+            reminder["id"],
+            reminder["user_id"],
+            reminder.get("message", ""),
+            reminder.get("remind_at"),
+            _remind_ts(reminder.get("remind_at")),
+            reminder.get("channel_id"),
+            reminder.get("recurring"),
+            reminder.get("notes"),
+            reminder.get("created_at"),
+        )
+
+    _UPSERT = (
+        "INSERT OR REPLACE INTO reminders "
+        "(id, user_id, message, remind_at, remind_ts, channel_id, recurring, notes, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+
+    def migrate_from_json(self) -> bool:
+        """Import reminders.json and config.json once.
+
+        Returns:
+            True if an import ran.
+        """
+        with self._lock:
+            done = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'json_migrated'"
+            ).fetchone()
+            if done:
+                return False
+
+            reminders = self._load_json(self.reminders_file, {})
+            config = self._load_json(self.config_file, {})
+            with self._conn:
+                self._conn.executemany(
+                    self._UPSERT,
+                    [self._upsert_params(r) for r in reminders.values()],
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO guild_config (guild_id, config) VALUES (?, ?)",
+                    [(key, json.dumps(value)) for key, value in config.items()],
+                )
+                # OR REPLACE: another worker process may have raced us here
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated', '1')"
+                )
+
+        if reminders or config:
+            logger.info(
+                f"Imported {len(reminders)} reminder(s) and {len(config)} guild "
+                f"config(s) from JSON into {self.db_file.name}"
+            )
+        return True
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # Reminders
+    def get_reminders(self) -> Dict[str, Dict]:
+        """Get all reminders."""
+        return {r["id"]: r for r in self.get_all_reminders()}
+
+    def get_all_reminders(self) -> List[Dict]:
+        """Get all reminders as a list."""
+        return self._query("SELECT * FROM reminders")
+
+    def get_user_reminders(self, user_id: int) -> List[Dict]:
+        """Get all reminders for a user."""
+        return self._query(
+            "SELECT * FROM reminders WHERE user_id = ? ORDER BY remind_ts", (user_id,)
+        )
+
+    def add_reminder(
+        self,
+        user_id: int,
+        message: str,
+        remind_at: str,
+        channel_id: Optional[int] = None,
+        recurring: Optional[str] = None,
+        notes: Optional[str] = None,
+    ) -> str:
+        """Add a reminder."""
+        reminder = self._build_reminder(
+            user_id, message, remind_at, channel_id, recurring, notes
+        )
+        self._execute(self._UPSERT, self._upsert_params(reminder))
+        return reminder["id"]
+
+    def add_reminders(self, new: List[Dict]) -> List[str]:
+        """Add several reminders in one transaction."""
+        built = [self._build_from(item) for item in new]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                self._UPSERT, [self._upsert_params(r) for r in built]
+            )
+        return [reminder["id"] for reminder in built]
+
+    def update_reminder_notes(self, reminder_id: str, user_id: int, notes: str) -> bool:
+        """Update notes for a reminder."""
+        return (
+            self._execute(
+                "UPDATE reminders SET notes = ? WHERE id = ? AND user_id = ?",
+                (notes, reminder_id, user_id),
+            )
+            > 0
+        )
+
+    def get_reminder(self, reminder_id: str, user_id: int) -> Optional[Dict]:
+        """Get a specific reminder by ID."""
+        rows = self._query(
+            "SELECT * FROM reminders WHERE id = ? AND user_id = ?",
+            (reminder_id, user_id),
+        )
+        return rows[0] if rows else None
+
+    def get_reminder_by_id(self, reminder_id: str) -> Optional[Dict]:
+        """Get a reminder by ID without an ownership check (for the scheduler)."""
+        rows = self._query("SELECT * FROM reminders WHERE id = ?", (reminder_id,))
+        return rows[0] if rows else None
+
+    def get_reminders_by_ids(self, reminder_ids: Iterable[str]) -> Dict[str, Dict]:
+        """Get several reminders by ID (primary key lookups); missing IDs are left out."""
+        reminder_ids = list(reminder_ids)
+        found = {}
+        for start in range(0, len(reminder_ids), MAX_QUERY_PARAMS):
+            chunk = reminder_ids[start:start + MAX_QUERY_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            for reminder in self._query(
+                f"SELECT * FROM reminders WHERE id IN ({placeholders})", tuple(chunk)
+            ):
+                found[reminder["id"]] = reminder
+        return found
+
+    def remove_reminder(self, reminder_id: str, user_id: int) -> bool:
+        """Remove a reminder."""
+        return (
+            self._execute(
+                "DELETE FROM reminders WHERE id = ? AND user_id = ?",
+                (reminder_id, user_id),
+            )
+            > 0
+        )
+
+    def get_due_reminders(self, current_time: str) -> List[Dict]:
+        """Get all reminders due at or before current_time (index range scan)."""
+        return self._query(
+            "SELECT * FROM reminders WHERE remind_ts <= ? ORDER BY remind_ts",
+            (to_timestamp(current_time),),
+        )
+
+    def update_reminder(self, reminder: Dict):
+        """Update a reminder (for recurring reminders)."""
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM reminders WHERE id = ?", (reminder["id"],)
+            ).fetchone()
+            if exists:
+                self._conn.execute(self._UPSERT, self._upsert_params(reminder))
+                self._conn.commit()
+
+    def update_reminders(self, updated: List[Dict]):
+        """Update several reminders in one transaction."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE reminders SET user_id = ?, message = ?, remind_at = ?, "
+                "remind_ts = ?, channel_id = ?, recurring = ?, notes = ?, "
+                "created_at = ? WHERE id = ?",
+                [self._upsert_params(r)[1:] + (r["id"],) for r in updated],
+            )
+
+    def update_reminder_time(self, reminder_id: str, new_time: str) -> bool:
+        """Update reminder time (for recurring reminders)."""
+        return (
+            self._execute(
+                "UPDATE reminders SET remind_at = ?, remind_ts = ? WHERE id = ?",
+                (new_time, _remind_ts(new_time), reminder_id),
+            )
+            > 0
+        )
+
+    def delete_reminder(self, reminder_id: str):
+        """Delete a reminder by ID."""
+        self._execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
+
+    def delete_reminders(self, reminder_ids: List[str]):
+        """Delete several reminders in one transaction."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM reminders WHERE id = ?", [(rid,) for rid in reminder_ids]
+            )
+
+    # Configuration (Guild settings)
+    def get_config(self) -> Dict[str, Any]:
+        """Get all guild configurations."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT guild_id, config FROM guild_config"
+            ).fetchall()
+        return {row["guild_id"]: json.loads(row["config"]) for row in rows}
+
+    def _get_guild_config(self, guild_id: int) -> Dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT config FROM guild_config WHERE guild_id = ?", (str(guild_id),)
+            ).fetchone()
+        return json.loads(row["config"]) if row else {}
+
+    def _set_guild_config(self, guild_id: int, config: Dict[str, Any]):
+        if config:
+            self._execute(
+                "INSERT OR REPLACE INTO guild_config (guild_id, config) VALUES (?, ?)",
+                (str(guild_id), json.dumps(config)),
+            )
+        else:
+            self._execute(
+                "DELETE FROM guild_config WHERE guild_id = ?", (str(guild_id),)
+            )
+
+    def get_guild_default_channel(self, guild_id: int) -> Optional[int]:
+        """Get default channel ID for a guild."""
+        return self._get_guild_config(guild_id).get("default_channel_id")
+
+    def set_guild_default_channel(self, guild_id: int, channel_id: int) -> bool:
+        """Set default channel ID for a guild."""
+        config = self._get_guild_config(guild_id)
+        config["default_channel_id"] = channel_id
+        self._set_guild_config(guild_id, config)
+        return True
+
+    def clear_guild_default_channel(self, guild_id: int) -> bool:
+        """Clear default channel ID for a guild (revert to DM)."""
+        config = self._get_guild_config(guild_id)
+        if "default_channel_id" not in config:
+            return False
+        del config["default_channel_id"]
+        self._set_guild_config(guild_id, config)
+        return True
+
+    # Shard leases (multi-process scheduling, see services/sharding.py)
+    def renew_shard_leases(
+        self,
+        worker_id: str,
+        shard_count: int,
+        now: float,
+        ttl: float,
+        release: Iterable[int] = (),
+    ) -> Tuple[List[int], int]:
+        """Heartbeat, renew this worker's shards and claim free ones.
+
+        Runs in one write transaction, so two workers never both win a shard.
+        A worker's fair share is ``ceil(shard_count / live workers)``. Free
+        shards (never leased, released, or whose lease expired) are claimed
+        up to that share. Shards held beyond it are renewed like the rest
+        until the worker passes them in ``release``, which it does once it
+        has drained them (see ``ShardLeaseManager.renew``).
+
+        Returns:
+            The shards this worker now holds, sorted, and its fair share.
+        """
+        release = set(release)
+        expires_at = now + ttl
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO workers (worker_id, expires_at) VALUES (?, ?)",
+                    (worker_id, expires_at),
+                )
+                self._conn.execute("DELETE FROM workers WHERE expires_at < ?", (now,))
+                live = self._conn.execute("SELECT COUNT(*) FROM workers").fetchone()[0]
+                share = -(-shard_count // max(1, live))
+
+                leases = {
+                    row["shard"]: (row["owner"], row["expires_at"])
+                    for row in self._conn.execute(
+                        "SELECT shard, owner, expires_at FROM shard_leases"
+                    )
+                }
+                mine = sorted(
+                    shard
+                    for shard, (owner, _) in leases.items()
+                    if owner == worker_id and shard < shard_count and shard not in release
+                )
+                free = [
+                    shard
+                    for shard in range(shard_count)
+                    if (shard not in leases or leases[shard][1] < now)
+                    and shard not in mine
+                    and shard not in release
+                ]
+                keep = mine + free[: max(0, share - len(mine))]
+
+                self._conn.execute(
+                    "DELETE FROM shard_leases WHERE owner = ?", (worker_id,)
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO shard_leases (shard, owner, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    [(shard, worker_id, expires_at) for shard in keep],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return sorted(keep), share
+
+    def release_shard_leases(self, worker_id: str):
+        """Drop this worker's leases and heartbeat (clean shutdown)."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM shard_leases WHERE owner = ?", (worker_id,))
+            self._conn.execute("DELETE FROM workers WHERE worker_id = ?", (worker_id,))
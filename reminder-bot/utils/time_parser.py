@@ -0,0 +1,179 @@
+"""Time-expression parser shared by the remind and edit commands.
+
+Input is tokenized once and matched against the common grammars
+("30m", "1h30m", "9:30pm", "21:00", "noon", "tomorrow 9am"). The
+compiled result is cached per input string, so only the final step
+(applying it to the current time) runs on every call. Anything the
+fast path does not recognise falls back to ``dateutil``.
+"""
+
+import re
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import pytz
+from dateutil import parser
+
+# All times are entered in Mountain Time (see README "How Times Work")
+LOCAL_TZ = pytz.timezone("America/Denver")
+
+TIME_KEYWORDS = {
+    "morning": 8,
+    "noon": 12,
+    "afternoon": 15,
+    "evening": 18,
+    "night": 20,
+    "midnight": 0,
+}
+
+DAY_WORDS = {"today": 0, "tomorrow": 1}
+
+# unit -> (seconds, max count accepted for a single-unit duration)
+UNITS = {
+    "m": (60, None),
+    "min": (60, None),
+    "mins": (60, None),
+    "minute": (60, None),
+    "minutes": (60, None),
+    "h": (3600, 23),
+    "hr": (3600, 23),
+    "hrs": (3600, 23),
+    "hour": (3600, 23),
+    "hours": (3600, 23),
+    "d": (86400, 365),
+    "day": (86400, 365),
+    "days": (86400, 365),
+    "w": (604800, 52),
+    "week": (604800, 52),
+    "weeks": (604800, 52),
+}
+
+_TOKEN = re.compile(r"\d+|[a-z]+|:")
+
+# Compiled specs
+RELATIVE = "relative"  # ("relative", seconds)
+CLOCK = "clock"  # ("clock", day_offset, hour, minute)
+FALLBACK = "fallback"  # ("fallback",)
+
+Spec = Tuple
+
+
+def _parse_clock(tokens: Tuple[str, ...]) -> Optional[Tuple[int, int]]:
+    """Match ``9am``, ``9:30pm``, ``21:00`` or a keyword; returns (hour, minute)."""
+    if len(tokens) == 1 and tokens[0] in TIME_KEYWORDS:
+        return TIME_KEYWORDS[tokens[0]], 0
+
+    meridiem = None
+    if tokens and tokens[-1] in ("am", "pm"):
+        meridiem = tokens[-1]
+        tokens = tokens[:-1]
+
+    if len(tokens) == 1 and tokens[0].isdigit() and meridiem:
+        hour, minute = int(tokens[0]), 0
+    elif (
+        len(tokens) == 3
+        and tokens[1] == ":"
+        and tokens[0].isdigit()
+        and tokens[2].isdigit()
+    ):
+        hour, minute = int(tokens[0]), int(tokens[2])
+    else:
+        return None
+
+    if minute > 59:
+        return None
+    if meridiem:
+        if hour > 12:
+            return None
+        hour = hour % 12 + (12 if meridiem == "pm" else 0)
+    elif hour > 23:
+        return None
+    return hour, minute
+
+
+def _parse_duration(tokens: Tuple[str, ...]) -> Optional[int]:
+    """Match ``30m``, ``2 hours``, ``1h30m``; returns total seconds."""
+    if not tokens or len(tokens) % 2:
+        return None
+    total = 0
+    pairs = [(tokens[i], tokens[i + 1]) for i in range(0, len(tokens), 2)]
+    for count, unit in pairs:
+        if not count.isdigit() or unit not in UNITS:
+            return None
+        seconds, limit = UNITS[unit]
+        if len(pairs) == 1 and limit is not None and int(count) > limit:
+            return None
+        total += int(count) * seconds
+    return total if total > 0 else None
+
+
+@lru_cache(maxsize=1024)
+def compile_time_expression(text: str) -> Spec:
+    """Tokenize and classify a (lower-cased, stripped) time expression."""
+    tokens = tuple(_TOKEN.findall(text))
+    if "".join(tokens) != text.replace(" ", ""):
+        return (FALLBACK,)  # punctuation the fast path doesn't handle
+
+    seconds = _parse_duration(tokens)
+    if seconds is not None:
+        return (RELATIVE, seconds)
+
+    day_offset = 0
+    if tokens and tokens[0] in DAY_WORDS:
+        day_offset = DAY_WORDS[tokens[0]]
+        tokens = tokens[1:]
+        if tokens and tokens[0] == "at":
+            tokens = tokens[1:]
+        if not tokens:
+            return (RELATIVE, day_offset * 86400) if day_offset else (FALLBACK,)
+
+    clock = _parse_clock(tokens)
+    if clock is not None:
+        return (CLOCK, day_offset, clock[0], clock[1])
+    return (FALLBACK,)
+
+
+@lru_cache(maxsize=256)
+def _local_datetime(day: date, hour: int, minute: int) -> datetime:
+    """Localize a wall-clock time (pytz ``localize`` is the slow part)."""
+    return LOCAL_TZ.localize(datetime.combine(day, time(hour, minute)))
+
+
+def parse_time(time_str: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    """Parse a user time expression into an aware datetime in ``LOCAL_TZ``.
+
+    Clock times ("9am") resolve to today even if already past; callers
+    reject times in the past.
+
+    Args:
+        time_str: User input such as ``"30m"`` or ``"tomorrow 9am"``.
+        now: Current time (defaults to now in ``LOCAL_TZ``).
+
+    Returns:
+        The parsed time, or None if the input is not understood.
+    """
+    if not time_str:
+        return None
+    text = time_str.lower().strip()
+    if now is None:
+        now = datetime.now(LOCAL_TZ)
+    elif getattr(now.tzinfo, "zone", None) != LOCAL_TZ.zone:
+        now = now.astimezone(LOCAL_TZ)
+
+    spec = compile_time_expression(text)
+    kind = spec[0]
+    if kind == RELATIVE:
+        return LOCAL_TZ.normalize(now + timedelta(seconds=spec[1]))
+    if kind == CLOCK:
+        _, day_offset, hour, minute = spec
+        day = now.date() + timedelta(days=day_offset)
+        return _local_datetime(day, hour, minute)
+
+    try:
+        result = parser.parse(text, default=now.replace(tzinfo=None))
+    except (ValueError, OverflowError):
+        return None
+    if result.tzinfo is None:
+        return LOCAL_TZ.localize(result)
+    return result.astimezone(LOCAL_TZ)
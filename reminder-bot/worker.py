@@ -0,0 +1,101 @@
+"""Headless reminder delivery worker.
+
+Runs only the reminder scheduler (no gateway connection, no commands)
+against the shared SQLite store, delivering the shards it holds leases on.
+Start any number of these next to bot.py on the same or other hosts:
+
+    REMINDER_STORAGE=sqlite REMINDER_SHARDS=16 python worker.py
+
+Every process (bot.py included) must use the same REMINDER_SHARDS value.
+Give each worker on the same host its own REMINDER_WORKER_NAME (default:
+the host name); it names the worker's delivery journal.
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import socket
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+from services.metrics import Metrics, MetricsServer
+from services.reminder_service import ReminderService
+from services.sharding import ShardLeaseManager
+from utils.async_store import AsyncDataManager
+from utils.data_manager import create_data_manager
+from utils.delivery_journal import DeliveryJournal
+
+import discord
+
+# Load environment variables
+load_dotenv()
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+logging.getLogger("discord").setLevel(logging.WARNING)
+logging.getLogger("discord.http").setLevel(logging.WARNING)
+logging.getLogger("aiohttp").setLevel(logging.ERROR)
+
+
+async def main():
+    """Log in over REST and run a sharded ReminderService until stopped."""
+    token = os.getenv("DISCORD_TOKEN")
+    if not token:
+        logger.error("DISCORD_TOKEN not found in environment variables")
+        sys.exit(1)
+    shard_count = os.getenv("REMINDER_SHARDS")
+    if not shard_count:
+        # Without leases this worker would double-send with bot.py
+        logger.error("REMINDER_SHARDS must be set to run a worker")
+        sys.exit(1)
+
+    store = await asyncio.to_thread(create_data_manager, str(Path("data")))
+    data = AsyncDataManager(store)
+    # Each worker keeps its own delivery journal; a stable name lets a
+    # restarted worker recover what it left in flight
+    worker_name = os.getenv("REMINDER_WORKER_NAME") or socket.gethostname()
+    journal = await asyncio.to_thread(
+        DeliveryJournal, Path("data") / f"deliveries-{worker_name}.journal"
+    )
+    shards = ShardLeaseManager(store, shard_count=int(shard_count))
+
+    metrics = Metrics()
+    metrics_server = None
+    if os.getenv("METRICS_PORT"):
+        metrics_server = MetricsServer(metrics, port=int(os.environ["METRICS_PORT"]))
+        await metrics_server.start()
+
+    # REST only: users and channels are resolved via fetch_* and cached
+    client = discord.Client(intents=discord.Intents.none())
+    await client.login(token)
+
+    service = ReminderService(
+        client, data, metrics=metrics, shards=shards, journal=journal
+    )
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopped.set)
+
+    service.start()
+    logger.info(f"Worker {shards.worker_id} started")
+    try:
+        await stopped.wait()
+    finally:
+        await service.stop()
+        if metrics_server:
+            await metrics_server.stop()
+        await client.close()
+        await data.close()
+        logger.info(f"Worker {shards.worker_id} stopped")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except Exception as e:
+        logger.critical(f"Fatal error: {e}", exc_info=True)
+        sys.exit(1)
@@ -0,0 +1,115 @@
+"""Benchmark TagClassifier's keyword matcher against the old substring scan.
+
+The old ``classify`` ran ``keyword in content_lower`` for every keyword of
+every tag (one scan of the message per keyword). The new one feeds the
+message through a prebuilt Aho-Corasick automaton once. Both are timed on
+the same synthetic messages with 100 and 5,000 keywords (or ``--sizes``).
+
+Usage:
+
+    python benchmarks/bench_tags.py [--sizes 100 5000] [--messages 2000]
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.keyword_matcher import KeywordMatcher  # noqa: E402
+
+DEFAULT_SIZES = [100, 5000]
+# Keywords per synthetic tag
+KEYWORDS_PER_TAG = 25
+
+
+def substring_classify(tag_keywords: Dict[str, List[str]], content: str) -> List[str]:
+    """The previous TagClassifier.classify, kept for comparison."""
+    content_lower = content.lower()
+    matched_tags = []
+    for tag_name, keywords in tag_keywords.items():
+        for keyword in keywords:
+            if keyword in content_lower:
+                matched_tags.append(tag_name)
+                break
+    return matched_tags
+
+
+def generate_keywords(count: int, rng: random.Random) -> Dict[str, List[str]]:
+    words = set()
+    while len(words) < count:
+        length = rng.randint(3, 10)
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
+        if rng.random() < 0.2:
+            word += " " + "".join(rng.choice(string.ascii_lowercase) for _ in range(5))
+        words.add(word)
+    words = sorted(words)
+    return {
+        f"Tag {i // KEYWORDS_PER_TAG}": words[i:i + KEYWORDS_PER_TAG]
+        for i in range(0, len(words), KEYWORDS_PER_TAG)
+    }
+
+
+def generate_messages(
+    count: int, tag_keywords: Dict[str, List[str]], rng: random.Random
+) -> List[str]:
+    """Messages of 20-120 filler words, about a third containing a keyword."""
+    keywords = [kw for kws in tag_keywords.values() for kw in kws]
+    messages = []
+    for _ in range(count):
+        words = [
+            "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9)))
+            for _ in range(rng.randint(20, 120))
+        ]
+        if rng.random() < 0.33:
+            words.insert(rng.randrange(len(words)), rng.choice(keywords).upper())
+        messages.append(" ".join(words))
+    return messages
+
+
+def bench(func, messages: List[str]) -> float:
+    """Seconds per message."""
+    start = time.perf_counter()
+    for message in messages:
+        func(message)
+    return (time.perf_counter() - start) / len(messages)
+
+
+def run(size: int, message_count: int, seed: int = 0) -> Dict[str, float]:
+    rng = random.Random(seed)
+    tag_keywords = generate_keywords(size, rng)
+    messages = generate_messages(message_count, tag_keywords, rng)
+
+    start = time.perf_counter()
+    matcher = KeywordMatcher(
+        (kw, tag) for tag, kws in tag_keywords.items() for kw in kws
+    )
+    build = time.perf_counter() - start
+
+    old = bench(lambda m: substring_classify(tag_keywords, m), messages)
+    new = bench(matcher.labels, messages)
+    return {"keywords": size, "build_s": build, "old_us": old * 1e6, "new_us": new * 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--messages", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'keywords':>9} {'build':>9} {'substring':>12} {'automaton':>12} {'speedup':>8}")
+    for size in args.sizes:
+        result = run(size, args.messages)
+        print(
+            f"{result['keywords']:>9} {result['build_s'] * 1000:>7.1f}ms "
+            f"{result['old_us']:>10.1f}us {result['new_us']:>10.1f}us "
+            f"{result['old_us'] / result['new_us']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
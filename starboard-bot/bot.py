@@ -32,6 +32,8 @@ logger = logging.getLogger(__name__)
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 CLIENT_ID_STR = os.getenv("CLIENT_ID")
 CLIENT_ID: Optional[int] = None
+# "json" (rewrite starboard.json per change) or "log" (append-only entry log)
+STARBOARD_STORAGE = os.getenv("STARBOARD_STORAGE", "json")
 
 if not DISCORD_TOKEN:
     logger.error("DISCORD_TOKEN not found in environment variables")
@@ -72,6 +74,10 @@ class StarboardBot(commands.Bot):
         """Called when the bot is starting up."""
         logger.info("Setting up bot...")
 
+        # One store shared by the service and every cog, so config changes
+        # made by commands are seen by the reaction handlers immediately
+        self.data = DataManager(storage=STARBOARD_STORAGE)
+
         # Load all command cogs
         cogs_dir = Path("commands")
         loaded_cogs = []
@@ -117,33 +123,26 @@ class StarboardBot(commands.Bot):
         for guild in self.guilds:
             logger.info(f"  - {guild.name} (ID: {guild.id})")
             # Check if configured
-            data = DataManager()
-            config = data.get_guild_config(guild.id)
+            config = self.data.get_guild_config(guild.id)
             if config and config.get("forum_channel_id"):
                 logger.info(f"    ✓ Configured: Forum channel {config.get('forum_channel_id')}, Threshold: {config.get('star_threshold', 1)}")
             else:
                 logger.warning(f"    ⚠ Not configured: Use /starboard-set-channel to set up")
 
-        # Initialize services
-        data = DataManager()
-        self.starboard_service = StarboardService(self, data)
+        # Initialize services (on_ready can fire again after reconnects)
+        if not hasattr(self, "starboard_service"):
+            self.starboard_service = StarboardService(self, self.data)
 
         # Pre-warm forum channel cache for instant access
         await self.starboard_service.warm_forum_channel_cache()
+        # Pick up tags.json edits without a restart
+        self.starboard_service.start_tags_watcher()
 
         logger.info("Starboard service initialized and ready")
-        logger.info("✅ Event handlers registered: on_reaction_add, on_raw_reaction_add, on_reaction_remove")
-
-        # Test that event handlers are registered
-        if hasattr(self, 'on_reaction_add'):
-            logger.info("✅ on_reaction_add method exists (for cached messages)")
-        else:
-            logger.error("❌ on_reaction_add method NOT FOUND!")
-
-        if hasattr(self, 'on_raw_reaction_add'):
-            logger.info("✅ on_raw_reaction_add method exists (for all messages, including uncached)")
-        else:
-            logger.error("❌ on_raw_reaction_add method NOT FOUND!")
+        logger.info(
+            "✅ Event handlers registered: on_raw_reaction_add, on_raw_reaction_remove, "
+            "on_raw_reaction_clear, on_raw_reaction_clear_emoji"
+        )
 
     async def on_message(self, message: discord.Message):
         """Test handler to verify events are working."""
@@ -154,105 +153,70 @@ class StarboardBot(commands.Bot):
         if message.id % 100 == 0:  # Log every 100th message
             logger.debug(f"Message event received: {message.id} in {message.channel}")
 
-    async def on_reaction_add(
-        self, reaction: discord.Reaction, user: discord.Member
-    ):
-        """Handle when a reaction is added (for cached messages only)."""
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
+        """Handle raw reaction add events (all messages, cached or not).
+
+        Works from the payload alone; the message is only fetched once it
+        reaches its guild's star threshold.
+        """
         # Ignore bot's own reactions
-        if user.bot:
+        if not self.user or payload.user_id == self.user.id:
             return
 
         try:
-            await self.starboard_service.handle_reaction_add(reaction, user)
+            await self.starboard_service.handle_raw_reaction_add(payload)
         except Exception as e:
             logger.error(
-                f"Error handling reaction add: {e}",
+                f"Error handling raw reaction add: {e}",
                 exc_info=True
             )
 
-    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
-        """Handle raw reaction add events (works for all messages, even if not in cache)."""
-        # Ignore bot's own reactions
+    async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
+        """Handle raw reaction remove events."""
         if not self.user or payload.user_id == self.user.id:
             return
 
         try:
-            # Get the channel and message
-            channel = self.get_channel(payload.channel_id)
-            if not channel:
-                return
-
-            # Fetch the message - only text-based channels have fetch_message
-            if not isinstance(channel, (discord.TextChannel, discord.Thread, discord.DMChannel, discord.GroupChannel)):
-                return
-
-            try:
-                message = await channel.fetch_message(payload.message_id)
-            except (discord.NotFound, discord.Forbidden):
-                return
-
-            # Get the user (optimize: use member from payload if available)
-            user = payload.member
-            if not user:
-                try:
-                    fetched_user = await self.fetch_user(payload.user_id)
-                    # If we can't get a Member, we need to get one from the guild
-                    if message.guild and isinstance(fetched_user, discord.User):
-                        user = message.guild.get_member(fetched_user.id)
-                        if not user:
-                            # Fallback: create a Member-like object or skip
-                            return
-                except discord.NotFound:
-                    return
-
-            if not user or user.bot:
-                return
-
-            # Ensure user is a Member (not just User) for guild-specific operations
-            if not isinstance(user, discord.Member):
-                if message.guild:
-                    member = message.guild.get_member(user.id)
-                    if member:
-                        user = member
-                    else:
-                        return
-                else:
-                    return
-
-            # Find the actual reaction object from the already-fetched message
-            reaction = None
-            for r in message.reactions:
-                if str(r.emoji) == str(payload.emoji):
-                    reaction = r
-                    break
-
-            if not reaction:
-                return
-
-            # Process immediately without blocking
-            await self.starboard_service.handle_reaction_add(reaction, user)
+            await self.starboard_service.handle_raw_reaction_remove(payload)
         except Exception as e:
             logger.error(
-                f"Error handling raw reaction add: {e}",
+                f"Error handling raw reaction remove: {e}",
                 exc_info=True
             )
 
-    async def on_reaction_remove(
-        self, reaction: discord.Reaction, user: discord.Member
+    async def on_raw_reaction_clear(self, payload: discord.RawReactionClearEvent):
+        """Handle all reactions being removed from a message."""
+        try:
+            await self.starboard_service.handle_raw_reaction_clear(payload.message_id)
+        except Exception as e:
+            logger.error(
+                f"Error handling raw reaction clear: {e}",
+                exc_info=True
+            )
+
+    async def on_raw_reaction_clear_emoji(
+        self, payload: discord.RawReactionClearEmojiEvent
     ):
-        """Handle when a reaction is removed."""
-        # Ignore bot's own reactions
-        if user.bot:
+        """Handle one emoji's reactions being removed from a message."""
+        if str(payload.emoji) != "⭐":
             return
 
         try:
-            await self.starboard_service.handle_reaction_remove(reaction, user)
+            await self.starboard_service.handle_raw_reaction_clear(payload.message_id)
         except Exception as e:
             logger.error(
-                f"Error handling reaction remove: {e}",
+                f"Error handling raw reaction clear emoji: {e}",
                 exc_info=True
             )
 
+    async def close(self):
+        """Stop background work and flush storage before disconnecting."""
+        if hasattr(self, "starboard_service"):
+            await self.starboard_service.stop()
+        if hasattr(self, "data"):
+            self.data.close()
+        await super().close()
+
     async def on_command_error(self, ctx, error):
         """Handle command errors."""
         if isinstance(error, commands.CommandNotFound):
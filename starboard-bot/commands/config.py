@@ -102,6 +102,69 @@ class ConfigCommands(commands.Cog):
             f"✓ Star threshold configured: {threshold} for guild {interaction.guild.id}"
         )
 
+    @app_commands.command(name="starboard-set-below-threshold")
+    @app_commands.describe(
+        action="What to do with a post whose message drops below the star threshold"
+    )
+    @app_commands.choices(
+        action=[
+            app_commands.Choice(name="Keep the post (default)", value="keep"),
+            app_commands.Choice(name="Archive the post", value="archive"),
+            app_commands.Choice(name="Remove the post", value="remove"),
+        ]
+    )
+    @app_commands.checks.has_permissions(manage_channels=True)
+    async def set_below_threshold(
+        self, interaction: discord.Interaction, action: app_commands.Choice[str]
+    ):
+        """Set what happens to posts that fall below the star threshold."""
+        if not interaction.guild:
+            await interaction.response.send_message(
+                "This command can only be used in a server.", ephemeral=True
+            )
+            return
+
+        logger.info(
+            f"Setting below-threshold action: guild={interaction.guild.id}, action={action.value}"
+        )
+
+        self.data.set_below_threshold_action(interaction.guild.id, action.value)
+
+        await interaction.response.send_message(
+            f"✅ Posts that drop below the threshold: {action.name}",
+            ephemeral=True,
+        )
+
+    @app_commands.command(name="starboard-reload-tags")
+    @app_commands.checks.has_permissions(manage_channels=True)
+    async def reload_tags(self, interaction: discord.Interaction):
+        """Reload auto-tag keywords from tags.json."""
+        service = getattr(self.bot, "starboard_service", None)
+        if service is None:
+            await interaction.response.send_message(
+                "⚠️ Starboard service isn't ready yet, try again in a moment.",
+                ephemeral=True,
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        try:
+            tag_set = await service.reload_tags()
+        except ValueError as e:
+            logger.error(f"Tag reload failed: {e}")
+            await interaction.followup.send(
+                f"❌ Couldn't load tags, keeping the old ones: {e}", ephemeral=True
+            )
+            return
+
+        await interaction.followup.send(
+            f"✅ Reloaded {len(tag_set.tag_keywords)} tags "
+            f"({tag_set.matcher.keyword_count} keywords) in "
+            f"{tag_set.build_seconds * 1000:.1f}ms",
+            ephemeral=True,
+        )
+        logger.info(f"✓ Tags reloaded by {interaction.user} ({len(tag_set.tag_keywords)} tags)")
+
     @app_commands.command(name="starboard-config")
     async def show_config(self, interaction: discord.Interaction):
         """Show current starboard configuration."""
@@ -122,6 +185,7 @@ class ConfigCommands(commands.Cog):
 
         forum_channel_id = config.get("forum_channel_id")
         threshold = config.get("star_threshold", 1)
+        below_threshold = config.get("below_threshold", "keep")
 
         forum_channel: Optional[discord.ForumChannel] = None
         if forum_channel_id and isinstance(forum_channel_id, int):
@@ -139,11 +203,14 @@ class ConfigCommands(commands.Cog):
         )
         embed.add_field(name="Forum Channel", value=channel_mention, inline=False)
         embed.add_field(name="Star Threshold", value=f"{threshold} ⭐", inline=False)
+        embed.add_field(
+            name="Below Threshold", value=below_threshold.capitalize(), inline=False
+        )
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
 async def setup(bot: commands.Bot):
     """Setup function for loading the cog."""
-    data_manager = DataManager()
+    data_manager = getattr(bot, "data", None) or DataManager()
     await bot.add_cog(ConfigCommands(bot, data_manager))
@@ -0,0 +1,82 @@
+"""Per-key debouncing of async work (e.g. starboard post edits)."""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Hashable, Set
+
+logger = logging.getLogger(__name__)
+
+
+class Debouncer:
+    """Runs work for a key at most once every ``interval`` seconds.
+
+    The first ``schedule`` for an idle key runs right away; calls that
+    arrive while a run is pending are coalesced into it, and calls after a
+    run wait out the rest of the interval. Callbacks should read the
+    latest state when they run rather than capture it when scheduled.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._pending: Dict[Hashable, asyncio.Task] = {}
+        # Runs past their delay, with ``func`` under way
+        self._running: Set[asyncio.Task] = set()
+        self._last_run: Dict[Hashable, float] = {}
+        self._closed = False
+
+    def __len__(self) -> int:
+        """Number of keys with a run pending."""
+        return len(self._pending)
+
+    def schedule(self, key: Hashable, func: Callable[[], Awaitable[None]]):
+        """Run ``func`` for ``key`` as soon as the interval allows.
+
+        Ignored once ``cancel_all`` has been called.
+        """
+        if self._closed or key in self._pending:
+            return
+        last_run = self._last_run.get(key)
+        delay = 0.0
+        if last_run is not None:
+            delay = max(0.0, last_run + self.interval - time.monotonic())
+        self._pending[key] = asyncio.create_task(self._run(key, func, delay))
+
+    async def _run(self, key: Hashable, func: Callable[[], Awaitable[None]], delay: float):
+        try:
+            if delay:
+                await asyncio.sleep(delay)
+        finally:
+            # Calls from here on schedule the next run
+            self._pending.pop(key, None)
+        ran_at = self._last_run[key] = time.monotonic()
+        task = asyncio.current_task()
+        self._running.add(task)
+        try:
+            await func()
+        except Exception as e:
+            logger.error(f"Debounced task for {key} failed: {e}", exc_info=True)
+        finally:
+            self._running.discard(task)
+            asyncio.get_running_loop().call_later(
+                self.interval, self._forget, key, ran_at
+            )
+
+    def _forget(self, key: Hashable, ran_at: float):
+        """Drop a key's last-run time once it no longer delays anything."""
+        if self._last_run.get(key) == ran_at and key not in self._pending:
+            del self._last_run[key]
+
+    async def cancel_all(self):
+        """Cancel pending runs and wait for running ones (e.g. on shutdown).
+
+        Running callbacks are left to finish rather than cancelled, since
+        work they handed to a thread would carry on regardless. Later
+        ``schedule`` calls are ignored.
+        """
+        self._closed = True
+        for task in self._pending.values():
+            task.cancel()
+        tasks = [*self._pending.values(), *self._running]
+        self._pending.clear()
+        await asyncio.gather(*tasks, return_exceptions=True)
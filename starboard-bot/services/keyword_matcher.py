@@ -0,0 +1,118 @@
+"""Aho-Corasick multi-keyword matcher with word-boundary checks."""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """Finds every keyword in a text in one pass, whatever the keyword count.
+
+    Keywords map to labels (e.g. tag names). Matching is case-insensitive
+    and whole-word: a keyword that starts (or ends) with a word character
+    only matches where the text has no word character right before (or
+    after) it. So "ai" matches "ai-news" but not "maintain", while "?" or
+    ".com" still match inside words.
+
+    The automaton is built once; ``labels`` costs O(len(text) + matches)
+    regardless of how many keywords there are.
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, str]]):
+        """
+        Args:
+            keywords: ``(keyword, label)`` pairs. Label order (first
+                appearance) is the order ``labels`` reports them in.
+        """
+        # State 0 is the root; each state has goto edges, a failure link
+        # and the keywords it completes, as (length, label index,
+        # check start boundary, check end boundary)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[int, int, bool, bool]]] = [[]]
+        self._labels: List[str] = []
+        label_index: Dict[str, int] = {}
+
+        for keyword, label in keywords:
+            keyword = keyword.lower()
+            if not keyword:
+                continue
+            if label not in label_index:
+                label_index[label] = len(self._labels)
+                self._labels.append(label)
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append([])
+                state = next_state
+            self._outputs[state].append(
+                (
+                    len(keyword),
+                    label_index[label],
+                    _is_word_char(keyword[0]),
+                    _is_word_char(keyword[-1]),
+                )
+            )
+        self.keyword_count = sum(len(out) for out in self._outputs)
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        """Link each state to its longest proper suffix in the trie (breadth-first).
+
+        A state also reports every keyword its failure state reports.
+        """
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]
+
+    def __len__(self) -> int:
+        """Number of distinct labels."""
+        return len(self._labels)
+
+    def matches(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield ``(start, end, label)`` for each whole-word keyword hit."""
+        text = text.lower()
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        is_word = _is_word_char
+        length = len(text)
+        state = 0
+        for end, char in enumerate(text, 1):
+            next_state = goto[state].get(char)
+            while next_state is None and state:
+                state = fail[state]
+                next_state = goto[state].get(char)
+            state = next_state or 0
+            if not outputs[state]:
+                continue
+            for size, label, check_start, check_end in outputs[state]:
+                start = end - size
+                if check_start and start > 0 and is_word(text[start - 1]):
+                    continue
+                if check_end and end < length and is_word(text[end]):
+                    continue
+                yield start, end, self._labels[label]
+
+    def labels(self, text: str) -> List[str]:
+        """Labels with at least one hit in ``text``, in label order."""
+        found = set()
+        for _, _, label in self.matches(text):
+            found.add(label)
+            if len(found) == len(self._labels):
+                break
+        return [label for label in self._labels if label in found]
@@ -0,0 +1,47 @@
+"""In-memory star counts per message, fed by raw reaction events."""
+
+from collections import OrderedDict
+from typing import Optional
+
+# Messages tracked at once; the least recently starred are forgotten first
+MAX_TRACKED_MESSAGES = 50000
+
+
+class StarTracker:
+    """Counts ⭐ reactions per message without fetching anything.
+
+    The tracker itself doesn't know about stars added before a message was
+    first seen (or before it was evicted); ``StarboardService`` seeds each
+    message with ``set`` from a fetched copy the first time it is starred.
+    """
+
+    def __init__(self, max_messages: int = MAX_TRACKED_MESSAGES):
+        self.max_messages = max_messages
+        self._counts: "OrderedDict[int, int]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def get(self, message_id: int) -> Optional[int]:
+        """Tracked count for a message, or None if it isn't tracked."""
+        return self._counts.get(message_id)
+
+    def add(self, message_id: int) -> int:
+        """Count one star added; returns the new count."""
+        return self.set(message_id, self._counts.get(message_id, 0) + 1)
+
+    def remove(self, message_id: int) -> int:
+        """Count one star removed; returns the new count."""
+        return self.set(message_id, max(self._counts.get(message_id, 0) - 1, 0))
+
+    def set(self, message_id: int, count: int) -> int:
+        """Set a message's count (e.g. from a fetched message)."""
+        self._counts[message_id] = count
+        self._counts.move_to_end(message_id)
+        if len(self._counts) > self.max_messages:
+            self._counts.popitem(last=False)
+        return count
+
+    def clear(self, message_id: int):
+        """Forget a message (its reactions were cleared or it was posted)."""
+        self._counts.pop(message_id, None)
@@ -2,15 +2,26 @@
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Set
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set
 
 import discord
-from services.tag_classifier import TagClassifier
+from services.debouncer import Debouncer
+from services.star_tracker import StarTracker
+from services.tag_classifier import TagClassifier, TagSet
 from utils.data_manager import DataManager
-from utils.embeds import create_starboard_embed
+from utils.embeds import create_starboard_embed, set_star_count
 
 logger = logging.getLogger(__name__)
 
+STAR = "⭐"
+# Minimum seconds between edits of one starboard post
+EDIT_INTERVAL = 10.0
+# Posted embeds kept so count edits don't have to fetch the post first
+MAX_CACHED_EMBEDS = 1000
+# Seconds between checks of the tags file for changes
+TAGS_POLL_INTERVAL = 5.0
+
 
 class StarboardService:
     """Service that monitors star reactions and posts to forum channel."""
@@ -19,12 +30,25 @@ class StarboardService:
         self.bot = bot
         self.data = data_manager
         self.tag_classifier = TagClassifier()
+        # Serializes tag rebuilds (file watcher vs. reload command)
+        self._tags_lock = asyncio.Lock()
+        self._tags_watcher: Optional[asyncio.Task] = None
 
         # Cache forum channel and config for instant access
         self._forum_channel_cache: Dict[int, Optional[discord.ForumChannel]] = {}
-        self._guild_config_cache: Dict[int, Optional[Dict]] = {}
         self._tag_lookup_cache: Dict[int, Dict[str, discord.ForumTag]] = {}  # Cache tag lookups per forum
 
+        # Star counts from raw reaction events, so most reactions need no fetch
+        self.star_tracker = StarTracker()
+        # Messages whose current count is being fetched on first sight
+        self._seeding: Set[int] = set()
+        # Posted messages whose tracked count was seeded from storage and
+        # is checked against the message once, at the next edit
+        self._unverified: Set[int] = set()
+        # Star-count edits of existing posts, coalesced per message
+        self._edits = Debouncer(EDIT_INTERVAL)
+        self._post_embeds: "OrderedDict[int, discord.Embed]" = OrderedDict()
+
         # Processing locks to prevent duplicate work
         self._processing_messages: Set[int] = set()
         self._processing_lock = asyncio.Lock()
@@ -55,107 +79,320 @@ class StarboardService:
         except Exception as e:
             logger.warning(f"Failed to pre-warm forum channel cache: {e}")
 
-    async def handle_reaction_add(
-        self, reaction: discord.Reaction, user: discord.Member
-    ):
-        """Handle when a star reaction is added to a message."""
-        # Only process star emoji
-        if str(reaction.emoji) != "⭐":
-            return
+    async def reload_tags(self) -> TagSet:
+        """Rebuild the tag classifier from the tags file in a worker thread.
+
+        Messages keep being classified with the old tags until the new set
+        is swapped in.
+
+        Raises:
+            ValueError: If the tags file is invalid (the old tags stay in use).
+        """
+        async with self._tags_lock:
+            return await asyncio.to_thread(self.tag_classifier.reload_tags)
+
+    def start_tags_watcher(self):
+        """Start polling the tags file, reloading it whenever it changes."""
+        if self._tags_watcher is None or self._tags_watcher.done():
+            self._tags_watcher = asyncio.create_task(self._watch_tags())
 
-        message = reaction.message
+    def stop_tags_watcher(self):
+        if self._tags_watcher is not None:
+            self._tags_watcher.cancel()
+            self._tags_watcher = None
 
-        # Fetch message if it's a partial message
-        if hasattr(message, 'partial') and message.partial:  # pyright: ignore[reportAttributeAccessIssue]
+    async def stop(self):
+        """Stop background work; call before closing the data manager.
+
+        Pending star-count edits are dropped and running ones finish, so
+        nothing writes to storage afterwards. A dropped edit is caught up
+        at the post's next reaction.
+        """
+        self.stop_tags_watcher()
+        await self._edits.cancel_all()
+
+    async def _watch_tags(self):
+        """Poll the tags file's mtime and size; reload on change."""
+        logger.info(
+            f"Watching {self.tag_classifier.tags_file} for changes every {TAGS_POLL_INTERVAL:g}s"
+        )
+        while True:
+            await asyncio.sleep(TAGS_POLL_INTERVAL)
             try:
-                message = await message.fetch()
+                if not await asyncio.to_thread(self.tag_classifier.is_stale):
+                    continue
+                await self.reload_tags()
+            except ValueError as e:
+                logger.error(f"❌ Tags file changed but couldn't be loaded, keeping old tags: {e}")
             except Exception as e:
-                logger.error(f"Failed to fetch partial message {message.id}: {e}")
-                return
+                logger.error(f"Tags file watcher error: {e}", exc_info=True)
 
-        guild = message.guild
+    def _get_guild_config(self, guild_id: int) -> Optional[Dict]:
+        """Starboard config for a guild if it has a forum channel (in-memory lookup)."""
+        config = self.data.get_guild_config(guild_id)
+        if not config or not config.get("forum_channel_id"):
+            return None
+        return config
 
-        if not guild:
-            logger.warning("Message has no guild, skipping")
-            return
+    def _is_bot(self, payload: discord.RawReactionActionEvent) -> bool:
+        """Whether a reaction came from a bot, judged from cached state only.
 
-        # Get configuration for this guild (cached)
-        guild_id = guild.id
-        config = self._guild_config_cache.get(guild_id)
-        if config is None:
-            config = self.data.get_guild_config(guild_id)
-            self._guild_config_cache[guild_id] = config
+        Remove events carry no member, so the user is looked up in the
+        cache; an uncached user counts as human.
+        """
+        user = payload.member or self.bot.get_user(payload.user_id)
+        return bool(user and user.bot)
+
+    async def handle_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
+        """Count a star from the raw event; fetch the message only when needed.
+
+        Everything up to the threshold check uses the payload and in-memory
+        state, so reactions that can't matter (other emoji, unconfigured
+        guilds, messages already posted) cost no REST calls. The first star
+        seen on a message fetches it once, so stars given before a restart
+        (or before the message was evicted from the tracker) still count
+        towards the threshold.
+        """
+        if payload.guild_id is None or str(payload.emoji) != STAR:
+            return
+        if self._is_bot(payload):
+            return
 
+        config = self._get_guild_config(payload.guild_id)
         if not config:
-            logger.warning(f"No configuration found for guild {guild_id}")
+            return
+        if self.data.is_message_starboarded(payload.message_id):
+            self._count_posted_star(payload.message_id, 1)
             return
 
-        forum_channel_id = config.get("forum_channel_id")
-        threshold = config.get("star_threshold", 1)
-
-        if not forum_channel_id:
-            logger.warning(f"Forum channel not configured for guild {guild_id}")
+        message = None
+        if self.star_tracker.get(payload.message_id) is None:
+            message = await self._seed_count(payload)
+            if message is None:
+                return
+            star_count = self.star_tracker.get(payload.message_id)
+        else:
+            star_count = self.star_tracker.add(payload.message_id)
+        if star_count < config.get("star_threshold", 1):
             return
 
-        # CRITICAL: Check if already processing FIRST (before any file I/O)
+        # CRITICAL: Check if already processing FIRST (before any REST call)
         async with self._processing_lock:
-            if message.id in self._processing_messages:
+            if payload.message_id in self._processing_messages:
                 return
-            self._processing_messages.add(message.id)
+            self._processing_messages.add(payload.message_id)
 
         try:
-            # Fast cached check if already posted (prevents duplicates)
-            if self.data.is_message_starboarded(message.id):
-                self._processing_messages.discard(message.id)
-                return
+            await self._handle_threshold(payload, config, message)
+        except Exception:
+            self._processing_messages.discard(payload.message_id)
+            raise
 
-            # Count star reactions (optimized: count directly from reactions)
-            star_count = sum(1 for r in message.reactions if str(r.emoji) == "⭐")
+    async def _seed_count(
+        self, payload: discord.RawReactionActionEvent
+    ) -> Optional[discord.Message]:
+        """Start tracking a message from its fetched ⭐ count (which includes this star).
 
-            # Check if threshold is met
-            if star_count >= threshold:
-                # Add ✅ reaction IMMEDIATELY for instant user feedback (before any blocking ops)
-                try:
-                    await message.add_reaction("✅")
-                except Exception:
-                    pass  # Non-critical, skip logging
+        Returns:
+            The fetched message, or None if it is gone or another event for
+            it is already fetching (that fetch sees this star too).
+        """
+        if payload.message_id in self._seeding:
+            return None
+        self._seeding.add(payload.message_id)
+        try:
+            message = await self._fetch_message(payload.channel_id, payload.message_id)
+        finally:
+            self._seeding.discard(payload.message_id)
+        if message is not None:
+            self.star_tracker.set(message.id, self._star_count(message))
+        return message
+
+    async def handle_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
+        """Count a star removed (no REST calls)."""
+        if payload.guild_id is None or str(payload.emoji) != STAR:
+            return
+        if self._is_bot(payload):
+            return
+        if self.data.is_message_starboarded(payload.message_id):
+            self._count_posted_star(payload.message_id, -1)
+        elif self.star_tracker.get(payload.message_id) is not None:
+            self.star_tracker.remove(payload.message_id)
+
+    async def handle_raw_reaction_clear(self, message_id: int):
+        """Reset a message's stars after its reactions were cleared."""
+        if self.data.is_message_starboarded(message_id):
+            self.star_tracker.set(message_id, 0)
+            self._unverified.discard(message_id)
+            self._schedule_update(message_id)
+        else:
+            self.star_tracker.clear(message_id)
+
+    def _count_posted_star(self, message_id: int, delta: int):
+        """Apply a star change to a posted message and schedule a post edit."""
+        if self.star_tracker.get(message_id) is None:
+            # Not seen since startup: start from the stored count
+            entry = self.data.get_starboard_entry(message_id) or {}
+            self.star_tracker.set(message_id, entry.get("star_count") or 0)
+            self._unverified.add(message_id)
+        if delta > 0:
+            self.star_tracker.add(message_id)
+        else:
+            self.star_tracker.remove(message_id)
+        self._schedule_update(message_id)
+
+    def _schedule_update(self, message_id: int):
+        self._edits.schedule(message_id, lambda: self._update_post(message_id))
+
+    async def _update_post(self, message_id: int):
+        """Bring a starboard post in line with its message's current star count.
+
+        Runs at most once per ``EDIT_INTERVAL`` per post, however many
+        reactions arrived. Posts in archived threads can't be edited and
+        are left as they are.
+        """
+        entry = self.data.get_starboard_entry(message_id)
+        if not entry:
+            return
 
-                # Post to starboard in background (non-blocking for instant response)
-                task = asyncio.create_task(
-                    self._post_to_starboard(message, forum_channel_id, star_count)
-                )
-                # Add done callback to remove from processing set
-                task.add_done_callback(lambda t: self._processing_messages.discard(message.id))
-            else:
-                # Not at threshold, remove from processing set immediately
-                self._processing_messages.discard(message.id)
-        except Exception as e:
-            # On any error, remove from processing set
-            logger.error(f"Error in handle_reaction_add: {e}", exc_info=True)
-            self._processing_messages.discard(message.id)
-            raise
+        if message_id in self._unverified:
+            self._unverified.discard(message_id)
+            message = await self._fetch_message(entry["channel_id"], message_id)
+            if message is not None:
+                self.star_tracker.set(message_id, self._star_count(message))
+        star_count = self.star_tracker.get(message_id)
+        if star_count is None:
+            return
 
-    async def handle_reaction_remove(
-        self, reaction: discord.Reaction, user: discord.Member
-    ):
-        """Handle when a star reaction is removed (optional: update star count)."""
-        # Only process star emoji
-        if str(reaction.emoji) != "⭐":
+        config = self.data.get_guild_config(entry["guild_id"]) or {}
+        below = star_count < config.get("star_threshold", 1)
+        action = config.get("below_threshold", "keep")
+        if below and action == "remove":
+            await self._remove_post(entry)
+            return
+        changed = star_count != entry.get("star_count")
+        if not changed and not (below and action == "archive"):
+            return
+
+        thread = await self._get_thread(entry["thread_id"])
+        if thread is None or thread.archived:
             return
 
-        message = reaction.message
-        guild = message.guild
+        if changed:
+            # A forum post's starter message shares the thread's ID
+            starter = thread.get_partial_message(
+                entry.get("starter_message_id") or entry["thread_id"]
+            )
+            embed = self._post_embeds.get(message_id)
+            if embed is None:
+                posted = await starter.fetch()
+                if not posted.embeds:
+                    return
+                embed = posted.embeds[0]
+            await starter.edit(embed=set_star_count(embed, star_count))
+            self._cache_embed(message_id, embed)
+            await asyncio.to_thread(
+                self.data.update_starboard_entry, message_id, star_count=star_count
+            )
+            logger.info(f"Updated starboard post for message {message_id}: {star_count} ⭐")
+
+        if below and action == "archive":
+            await thread.edit(archived=True)
+            logger.info(f"Archived starboard post for message {message_id} ({star_count} ⭐)")
 
-        if not guild:
+    async def _remove_post(self, entry: Dict[str, Any]):
+        """Delete a post that fell below the threshold; the message can be posted again."""
+        message_id = entry["message_id"]
+        thread = await self._get_thread(entry["thread_id"])
+        try:
+            if thread is not None:
+                await thread.delete()
+        except discord.Forbidden:
+            logger.error(
+                f"Bot lacks Manage Threads to remove starboard thread {entry['thread_id']}"
+            )
             return
+        await asyncio.to_thread(self.data.remove_starboard_entry, message_id)
+        self._post_embeds.pop(message_id, None)
+        logger.info(f"Removed starboard post for message {message_id} (below threshold)")
+
+    async def _get_thread(self, thread_id: int) -> Optional[discord.Thread]:
+        """Get a starboard thread from the cache, or fetch it (archived threads)."""
+        thread = self.bot.get_channel(thread_id)
+        if thread is None:
+            try:
+                thread = await self.bot.fetch_channel(thread_id)
+            except (discord.NotFound, discord.Forbidden):
+                return None
+        return thread if isinstance(thread, discord.Thread) else None
+
+    def _cache_embed(self, message_id: int, embed: discord.Embed):
+        self._post_embeds[message_id] = embed
+        self._post_embeds.move_to_end(message_id)
+        if len(self._post_embeds) > MAX_CACHED_EMBEDS:
+            self._post_embeds.popitem(last=False)
+
+    @staticmethod
+    def _star_count(message: discord.Message) -> int:
+        """A message's ⭐ count, not counting our own star."""
+        for reaction in message.reactions:
+            if str(reaction.emoji) == STAR:
+                return reaction.count - (1 if reaction.me else 0)
+        return 0
+
+    async def _handle_threshold(
+        self,
+        payload: discord.RawReactionActionEvent,
+        config: Dict,
+        message: Optional[discord.Message] = None,
+    ):
+        """Fetch a message that reached the threshold and post it if the count holds.
 
-        # Check if message is already on starboard
-        starboard_entry = self.data.get_starboard_entry(message.id)
-        if not starboard_entry:
+        The tracked count can drift (stars from uncached bots, reactions
+        missed during a reconnect), so it is replaced by the fetched
+        message's actual ⭐ count before deciding. ``message`` skips the
+        fetch when the caller has just fetched it.
+        """
+        if message is None:
+            message = await self._fetch_message(payload.channel_id, payload.message_id)
+        if message is None:
+            self.star_tracker.clear(payload.message_id)
+            self._processing_messages.discard(payload.message_id)
             return
 
-        # Count current star reactions (for potential future use)
-        star_count = sum(1 for r in message.reactions if str(r.emoji) == "⭐")
+        star_count = self.star_tracker.set(message.id, self._star_count(message))
+
+        if star_count < config.get("star_threshold", 1):
+            self._processing_messages.discard(message.id)
+            return
+
+        # Add ✅ reaction IMMEDIATELY for instant user feedback (before any blocking ops)
+        try:
+            await message.add_reaction("✅")
+        except Exception:
+            pass  # Non-critical, skip logging
+
+        # Post to starboard in background (non-blocking for instant response)
+        task = asyncio.create_task(
+            self._post_to_starboard(message, config["forum_channel_id"], star_count)
+        )
+        # Add done callback to remove from processing set
+        task.add_done_callback(lambda t: self._processing_messages.discard(message.id))
+
+    async def _fetch_message(
+        self, channel_id: int, message_id: int
+    ) -> Optional[discord.Message]:
+        """Fetch a message by ID, or None if it is gone or unreadable."""
+        channel = self.bot.get_channel(channel_id)
+        try:
+            if channel is None:
+                # Threads that dropped out of the cache
+                channel = await self.bot.fetch_channel(channel_id)
+            if not isinstance(channel, discord.abc.Messageable):
+                return None
+            return await channel.fetch_message(message_id)
+        except (discord.NotFound, discord.Forbidden):
+            return None
 
     async def _post_to_starboard(
         self, message: discord.Message, forum_channel_id: int, star_count: int
@@ -254,6 +491,9 @@ class StarboardService:
                 applied_tags=forum_tags,
             )
 
+            starter_message = getattr(thread_result, "message", None)
+            starter_message_id = getattr(starter_message, "id", None)
+
             # ThreadWithMessage structure: try multiple ways to get thread ID
             thread_id: Optional[int] = None
             try:
@@ -289,6 +529,8 @@ class StarboardService:
                 message.channel.id,
                 message.guild.id,
                 tags,
+                starter_message_id,
+                star_count,
             )
 
             # Log successful post (important event)
@@ -297,6 +539,11 @@ class StarboardService:
                 f"(stars: {star_count}, tags: {tags[:3] if tags else 'none'})"
             )
 
+            # Stars that arrived while posting go out with the first edit
+            self._cache_embed(message.id, embed)
+            if self.star_tracker.get(message.id) not in (None, star_count):
+                self._schedule_update(message.id)
+
             # Remove from processing set on success
             self._processing_messages.discard(message.id)
 
@@ -336,35 +583,4 @@ class StarboardService:
         Returns:
             List of suggested tag names
         """
-        tags = []
-
-        # Channel name patterns -> tags
-        channel_patterns = {
-            'data-science': 'Data Science',
-            'data-science-news': 'Data Science',
-            'ai': 'AI',
-            'artificial-intelligence': 'AI',
-            'machine-learning': 'AI',
-            'ml': 'AI',
-            'programming': 'Programming',
-            'code': 'Programming',
-            'dev': 'Programming',
-            'development': 'Programming',
-            'question': 'Question',
-            'help': 'Question',
-            'support': 'Question',
-            'resource': 'Resource',
-            'links': 'Resource',
-            'tutorial': 'Resource',
-            'announcement': 'Announcement',
-            'news': 'Announcement',
-            'discussion': 'Discussion',
-            'chat': 'Discussion',
-        }
-
-        # Check for patterns in channel name
-        for pattern, tag_name in channel_patterns.items():
-            if pattern in channel_name:
-                tags.append(tag_name)
-
-        return tags
+        return self.tag_classifier.classify_channel(channel_name)
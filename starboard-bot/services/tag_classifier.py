@@ -2,100 +2,193 @@
 
 import json
 import logging
-import re
+import time
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from services.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+# Channel name patterns -> tags
+CHANNEL_PATTERNS = {
+    'data-science': 'Data Science',
+    'data-science-news': 'Data Science',
+    'ai': 'AI',
+    'artificial-intelligence': 'AI',
+    'machine-learning': 'AI',
+    'ml': 'AI',
+    'programming': 'Programming',
+    'code': 'Programming',
+    'dev': 'Programming',
+    'development': 'Programming',
+    'question': 'Question',
+    'questions': 'Question',
+    'help': 'Question',
+    'support': 'Question',
+    'resource': 'Resource',
+    'resources': 'Resource',
+    'links': 'Resource',
+    'tutorial': 'Resource',
+    'tutorials': 'Resource',
+    'announcement': 'Announcement',
+    'announcements': 'Announcement',
+    'news': 'Announcement',
+    'discussion': 'Discussion',
+    'chat': 'Discussion',
+}
+
+
+class TagSet:
+    """One immutable build of the tags file: keywords plus compiled matcher."""
+
+    __slots__ = ("tag_keywords", "matcher", "signature", "build_seconds")
+
+    def __init__(
+        self,
+        tag_keywords: Dict[str, List[str]],
+        signature: Optional[Tuple[int, int]] = None,
+        build_seconds: float = 0.0,
+    ):
+        self.tag_keywords = tag_keywords
+        self.matcher = KeywordMatcher(
+            (keyword, tag_name)
+            for tag_name, keywords in tag_keywords.items()
+            for keyword in keywords
+        )
+        self.signature = signature
+        self.build_seconds = build_seconds
+
 
 class TagClassifier:
-    """Classifies messages using keyword-based matching with word boundaries."""
+    """Classifies messages by whole-word keyword matching.
+
+    Keywords from the tags file (and channel name patterns) are compiled
+    into ``KeywordMatcher`` automata once per load, so classifying a
+    message is a single pass over its text however many keywords exist.
+
+    ``reload_tags`` builds a complete new ``TagSet`` and swaps it in with a
+    single assignment, so it can run in a worker thread while the event
+    loop keeps classifying with the previous set.
+    """
 
     def __init__(self, tags_file: str = "config/tags.json"):
         self.tags_file = Path(tags_file)
-        self.tag_keywords = {}
-        self.tag_patterns = {}
-        self._load_tags()
+        self._channel_matcher = KeywordMatcher(CHANNEL_PATTERNS.items())
+        try:
+            self._tags = self._build()
+        except ValueError as e:
+            logger.error(f"Error loading tags file: {e}", exc_info=True)
+            self._tags = TagSet({}, self._signature())
         logger.info(f"TagClassifier initialized with {len(self.tag_keywords)} tags")
 
-    def _load_tags(self):
-        """Load tag keywords from config file and compile patterns."""
-        if not self.tags_file.exists():
+    @property
+    def tag_keywords(self) -> Dict[str, List[str]]:
+        """Lowercase keywords per tag, in tags file order."""
+        return self._tags.tag_keywords
+
+    @property
+    def keyword_count(self) -> int:
+        return self._tags.matcher.keyword_count
+
+    @property
+    def build_seconds(self) -> float:
+        """How long the current tag set took to load and compile."""
+        return self._tags.build_seconds
+
+    def _signature(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of the tags file, or None if it is missing."""
+        try:
+            stat = self.tags_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _build(self) -> TagSet:
+        """Load the tags file and compile a new tag set (doesn't touch the current one).
+
+        Raises:
+            ValueError: If the file can't be read or parsed.
+        """
+        started = time.perf_counter()
+        signature = self._signature()
+        if signature is None:
             logger.warning(f"Tags file not found: {self.tags_file}, using empty tags")
-            self.tag_keywords = {}
-            self.tag_patterns = {}
-            return
+            return TagSet({}, None, time.perf_counter() - started)
 
         try:
             with open(self.tags_file, "r", encoding="utf-8") as f:
                 tags_data = json.load(f)
-                # Extract keywords for each tag
-                self.tag_keywords = {}
-                self.tag_patterns = {}
-
-                for tag_name, tag_info in tags_data.items():
-                    keywords = tag_info.get("keywords", [])
-                    # Convert to lowercase for case-insensitive matching
-                    self.tag_keywords[tag_name] = [kw.lower() for kw in keywords]
-
-                    # Compile regex patterns with word boundaries for better matching
-                    patterns = []
-                    for keyword in keywords:
-                        keyword_lower = keyword.lower()
-                        # Escape special regex characters
-                        escaped = re.escape(keyword_lower)
-                        # Use word boundaries for single words, or exact phrase matching
-                        if " " in keyword_lower:
-                            # Multi-word phrase - match as phrase
-                            pattern = rf"\b{escaped}\b"
-                        else:
-                            # Single word - use word boundaries
-                            pattern = rf"\b{escaped}\b"
-                        patterns.append(re.compile(pattern, re.IGNORECASE))
-
-                    self.tag_patterns[tag_name] = patterns
-        except (json.JSONDecodeError, KeyError, IOError) as e:
-            logger.error(f"Error loading tags file: {e}", exc_info=True)
-            self.tag_keywords = {}
-            self.tag_patterns = {}
+            # Extract keywords for each tag (lowercase for case-insensitive matching)
+            tag_keywords = {
+                tag_name: [kw.lower() for kw in tag_info.get("keywords", [])]
+                for tag_name, tag_info in tags_data.items()
+            }
+            tag_set = TagSet(tag_keywords, signature)
+        except (json.JSONDecodeError, KeyError, AttributeError, TypeError, IOError) as e:
+            raise ValueError(f"{self.tags_file}: {e}") from e
+        tag_set.build_seconds = time.perf_counter() - started
+        return tag_set
+
+    def is_stale(self) -> bool:
+        """True if the tags file changed since it was last loaded (or tried)."""
+        return self._signature() != self._tags.signature
 
     def classify(self, content: str) -> List[str]:
         """
         Classify message content and return list of applicable tags.
-        Optimized for speed: uses simple string matching instead of regex.
 
         Args:
             content: Message content to classify
 
         Returns:
-            List of tag names that match the content
+            List of tag names that match the content, in tags file order
         """
         if not content or not isinstance(content, str):
             return []
+        return self._tags.matcher.labels(content)
 
-        content_lower = content.lower()
-        matched_tags = []
+    def classify_channel(self, channel_name: str) -> List[str]:
+        """
+        Classify a channel name to suggest tags.
 
-        # Fast string matching (no regex overhead)
-        for tag_name, keywords in self.tag_keywords.items():
-            for keyword in keywords:
-                if keyword in content_lower:
-                    matched_tags.append(tag_name)
-                    break  # Found match, move to next tag
+        Args:
+            channel_name: Channel name
 
-        return matched_tags
+        Returns:
+            List of suggested tag names
+        """
+        if not channel_name:
+            return []
+        return self._channel_matcher.labels(channel_name)
 
     def get_available_tags(self) -> List[str]:
         """Get list of all available tag names."""
         return sorted(self.tag_keywords.keys())
 
-    def reload_tags(self):
-        """Reload tags from config file (useful for hot-reloading)."""
+    def reload_tags(self) -> TagSet:
+        """Reload tags from the config file and swap them in atomically.
+
+        Blocking; call it from a worker thread.
+
+        Returns:
+            The new tag set.
+
+        Raises:
+            ValueError: If the file is invalid. The current tags stay in
+                use, and ``is_stale`` stays False until the file changes again.
+        """
         logger.info("Reloading tags from config file")
         old_count = len(self.tag_keywords)
-        self._load_tags()
-        new_count = len(self.tag_keywords)
+        try:
+            tag_set = self._build()
+        except ValueError:
+            # Keep serving the old tags; don't retry this version of the file
+            self._tags = TagSet(self._tags.tag_keywords, self._signature(), self.build_seconds)
+            raise
+        self._tags = tag_set
         logger.info(
-            f"Tags reloaded: {old_count} -> {new_count} tags available"
+            f"Tags reloaded: {old_count} -> {len(tag_set.tag_keywords)} tags available "
+            f"({tag_set.matcher.keyword_count} keywords, built in {tag_set.build_seconds * 1000:.1f}ms)"
         )
+        return tag_set
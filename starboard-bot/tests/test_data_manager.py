@@ -0,0 +1,214 @@
+"""Tests for starboard entry storage."""
+
+import tempfile
+import threading
+import pytest
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import data_manager
+from utils.data_manager import DataManager
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary data directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def _add(data, message_id, star_count=3):
+    data.add_starboard_entry(
+        message_id, thread_id=message_id + 1000, channel_id=10, guild_id=1, tags=[],
+        star_count=star_count,
+    )
+
+
+def _crash(data):
+    """Stop without ``close()``, as a killed process would."""
+    data._log.close()
+    data._log = None
+
+
+def _write_concurrently(data, threads=6, per_thread=50):
+    """Add, update and remove entries from several threads at once."""
+    errors = []
+
+    def work(offset):
+        try:
+            for i in range(per_thread):
+                message_id = offset * per_thread + i
+                _add(data, message_id)
+                data.update_starboard_entry(message_id, star_count=4)
+                if i % 5 == 0:
+                    data.remove_starboard_entry(message_id)
+        except Exception as e:
+            errors.append(e)
+
+    workers = [threading.Thread(target=work, args=(n,)) for n in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert errors == []
+    return {
+        str(message_id)
+        for message_id in range(threads * per_thread)
+        if message_id % per_thread % 5
+    }
+
+
+class TestJsonStorage:
+    """storage="json" rewrites starboard.json on every change."""
+
+    def test_concurrent_writers(self, temp_data_dir):
+        data = DataManager(temp_data_dir)
+        expected = _write_concurrently(data)
+
+        reloaded = DataManager(temp_data_dir).get_starboard_entries()
+        assert set(reloaded) == expected
+        assert all(entry["star_count"] == 4 for entry in reloaded.values())
+        assert not (Path(temp_data_dir) / "starboard.json.tmp").exists()
+
+
+class TestEntryLog:
+    """storage="log" appends changes and compacts them into starboard.json."""
+
+    def test_replay_after_restart(self, temp_data_dir):
+        data = DataManager(temp_data_dir, storage="log")
+        for message_id in range(3):
+            _add(data, message_id)
+        data.update_starboard_entry(1, star_count=7)
+        data.remove_starboard_entry(2)
+        _crash(data)
+
+        assert not (Path(temp_data_dir) / "starboard.json").exists()
+        entries = DataManager(temp_data_dir, storage="log").get_starboard_entries()
+        assert set(entries) == {"0", "1"}
+        assert entries["1"]["star_count"] == 7
+
+    def test_torn_last_line(self, temp_data_dir):
+        data = DataManager(temp_data_dir, storage="log")
+        _add(data, 1)
+        _crash(data)
+        with open(data.starboard_log_file, "a", encoding="utf-8") as f:
+            f.write('{"op":"put","message_id":2,"ent')
+
+        data = DataManager(temp_data_dir, storage="log")
+        assert set(data.get_starboard_entries()) == {"1"}
+        # The next record doesn't run into the torn one
+        _add(data, 3)
+        data.close()
+        assert set(DataManager(temp_data_dir, storage="log").get_starboard_entries()) == {"1", "3"}
+
+    def test_interrupted_compaction(self, temp_data_dir):
+        data = DataManager(temp_data_dir, storage="log")
+        _add(data, 1)
+        _add(data, 2)
+        _crash(data)
+        # Crashed after rotating the log, before writing the snapshot
+        data.starboard_log_file.replace(data.compacting_log_file)
+        data = DataManager(temp_data_dir, storage="log")
+        _add(data, 3)
+        _crash(data)
+        data.starboard_log_file.replace(data.compacting_log_file)
+        data.starboard_log_file.write_text('{"op":"remove","message_id":1}\n')
+
+        data = DataManager(temp_data_dir, storage="log")
+        assert set(data.get_starboard_entries()) == {"2", "3"}
+        assert not data.compacting_log_file.exists()
+        assert set(DataManager(temp_data_dir).get_starboard_entries()) == {"2", "3"}
+
+    def test_close_folds_log_into_snapshot(self, temp_data_dir):
+        data = DataManager(temp_data_dir, storage="log")
+        _add(data, 1)
+        data.close()
+
+        assert [p.name for p in Path(temp_data_dir).iterdir()] == ["starboard.json"]
+        # Switching to json mode sees everything posted in log mode
+        assert DataManager(temp_data_dir).is_message_starboarded(1)
+
+    def test_json_mode_folds_leftover_log(self, temp_data_dir):
+        data = DataManager(temp_data_dir, storage="log")
+        _add(data, 1)
+        data.compact_starboard_log(wait=True)
+        _add(data, 2)
+        _add(data, 3)
+        _crash(data)
+        # Crashed mid-compaction, with a record in the new log
+        data.starboard_log_file.replace(data.compacting_log_file)
+        data.starboard_log_file.write_text('{"op":"remove","message_id":1}\n')
+
+        data = DataManager(temp_data_dir)
+        assert set(data.get_starboard_entries()) == {"2", "3"}
+        assert not data.starboard_log_file.exists()
+        assert not data.compacting_log_file.exists()
+        _add(data, 4)
+        assert set(DataManager(temp_data_dir).get_starboard_entries()) == {"2", "3", "4"}
+
+    def test_failed_compaction_is_merged_not_overwritten(self, temp_data_dir, monkeypatch):
+        data = DataManager(temp_data_dir, storage="log")
+
+        def fail(file_path, entries):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(data, "_save_json", fail)
+        _add(data, 1)
+        data.compact_starboard_log(wait=True)
+        assert data.compacting_log_file.exists()
+        _add(data, 2)
+        data.compact_starboard_log(wait=True)
+        data.close()
+
+        # Both failed compactions' records survive a restart
+        monkeypatch.undo()
+        data = DataManager(temp_data_dir, storage="log")
+        assert set(data.get_starboard_entries()) == {"1", "2"}
+
+    def test_retried_compaction_clears_failed_log(self, temp_data_dir, monkeypatch):
+        data = DataManager(temp_data_dir, storage="log")
+        save_json = data._save_json
+
+        def fail(file_path, entries):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(data, "_save_json", fail)
+        _add(data, 1)
+        data.compact_starboard_log(wait=True)
+        monkeypatch.setattr(data, "_save_json", save_json)
+        _add(data, 2)
+        data.compact_starboard_log(wait=True)
+        data.close()
+
+        assert not data.compacting_log_file.exists()
+        assert not data.starboard_log_file.exists()
+        assert set(DataManager(temp_data_dir).get_starboard_entries()) == {"1", "2"}
+
+    def test_rotation_failure_keeps_record(self, temp_data_dir, monkeypatch):
+        monkeypatch.setattr(data_manager, "COMPACT_EVERY", 1)
+        data = DataManager(temp_data_dir, storage="log")
+        data.get_starboard_entries()
+
+        def fail(self, target):
+            raise OSError("read-only")
+
+        monkeypatch.setattr(Path, "replace", fail)
+        # The entry is written before the rotation fails; that's not an error
+        _add(data, 1)
+        _add(data, 2)
+        monkeypatch.undo()
+        data.close()
+        assert set(DataManager(temp_data_dir, storage="log").get_starboard_entries()) == {"1", "2"}
+
+    def test_concurrent_writers(self, temp_data_dir, monkeypatch):
+        monkeypatch.setattr(data_manager, "COMPACT_EVERY", 7)
+        data = DataManager(temp_data_dir, storage="log")
+        expected = _write_concurrently(data)
+        data.close()
+
+        reloaded = DataManager(temp_data_dir, storage="log").get_starboard_entries()
+        assert set(reloaded) == expected
+        assert all(entry["star_count"] == 4 for entry in reloaded.values())
@@ -0,0 +1,130 @@
+"""Tests for per-key debouncing."""
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.debouncer import Debouncer
+
+INTERVAL = 0.05
+
+
+class TestDebouncer:
+    """Runs are coalesced per key and spaced by the interval."""
+
+    def test_first_run_is_immediate_and_coalesces(self):
+        runs = []
+
+        async def run():
+            debouncer = Debouncer(INTERVAL)
+
+            async def work():
+                runs.append(time.monotonic())
+
+            for _ in range(5):
+                debouncer.schedule("post", work)
+            assert len(debouncer) == 1
+            await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+        assert len(runs) == 1
+
+    def test_later_run_waits_out_interval(self):
+        runs = []
+
+        async def run():
+            debouncer = Debouncer(INTERVAL)
+
+            async def work():
+                runs.append(time.monotonic())
+
+            debouncer.schedule("post", work)
+            await asyncio.sleep(0.01)
+            debouncer.schedule("post", work)
+            debouncer.schedule("post", work)
+            await asyncio.sleep(INTERVAL * 2)
+
+        asyncio.run(run())
+        assert len(runs) == 2
+        assert runs[1] - runs[0] >= INTERVAL * 0.9
+
+    def test_keys_are_independent(self):
+        runs = []
+
+        async def run():
+            debouncer = Debouncer(INTERVAL)
+            for key in ("a", "b"):
+                async def work(key=key):
+                    runs.append(key)
+
+                debouncer.schedule(key, work)
+            await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+        assert sorted(runs) == ["a", "b"]
+
+    def test_failure_is_logged_and_later_runs_continue(self, caplog):
+        runs = []
+
+        async def run():
+            debouncer = Debouncer(INTERVAL)
+
+            async def fail():
+                raise RuntimeError("edit failed")
+
+            async def work():
+                runs.append("ok")
+
+            debouncer.schedule("post", fail)
+            await asyncio.sleep(0.01)
+            debouncer.schedule("post", work)
+            await asyncio.sleep(INTERVAL * 2)
+
+        with caplog.at_level(logging.ERROR, logger="services.debouncer"):
+            asyncio.run(run())
+        assert runs == ["ok"]
+        assert "edit failed" in caplog.text
+
+    def test_cancel_all_drops_pending_runs(self):
+        runs = []
+
+        async def run():
+            debouncer = Debouncer(INTERVAL)
+
+            async def work():
+                runs.append("ok")
+
+            debouncer.schedule("post", work)
+            await asyncio.sleep(0.01)
+            debouncer.schedule("post", work)
+            await debouncer.cancel_all()
+            assert len(debouncer) == 0
+            debouncer.schedule("other", work)
+            await asyncio.sleep(INTERVAL * 2)
+
+        asyncio.run(run())
+        assert runs == ["ok"]
+
+    def test_cancel_all_waits_for_running_runs(self):
+        runs = []
+
+        async def run():
+            debouncer = Debouncer(INTERVAL)
+            started = asyncio.Event()
+
+            async def work():
+                started.set()
+                await asyncio.sleep(0.02)
+                runs.append("ok")
+
+            debouncer.schedule("post", work)
+            await started.wait()
+            await debouncer.cancel_all()
+            assert runs == ["ok"]
+
+        asyncio.run(run())
@@ -0,0 +1,258 @@
+"""Tests for raw-reaction star counting."""
+
+import asyncio
+import tempfile
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import discord
+
+from services.starboard_service import STAR, StarboardService
+from utils.data_manager import DataManager
+
+GUILD_ID = 1
+CHANNEL_ID = 10
+FORUM_ID = 20
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary data directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+class FakeChannel(discord.abc.Messageable):
+    """Channel whose messages carry a settable ⭐ count."""
+
+    def __init__(self):
+        self.stars = {}
+        self.fetches = 0
+
+    async def fetch_message(self, message_id):
+        self.fetches += 1
+        reactions = [SimpleNamespace(emoji=STAR, count=self.stars.get(message_id, 0), me=False)]
+
+        async def add_reaction(emoji):
+            pass
+
+        return SimpleNamespace(id=message_id, reactions=reactions, add_reaction=add_reaction)
+
+
+class FakeBot:
+    def __init__(self, users=()):
+        self.channel = FakeChannel()
+        self._users = {user.id: user for user in users}
+
+    def get_channel(self, channel_id):
+        return self.channel if channel_id == CHANNEL_ID else None
+
+    def get_user(self, user_id):
+        return self._users.get(user_id)
+
+
+def _payload(message_id, user_id=100, member=None):
+    return SimpleNamespace(
+        guild_id=GUILD_ID,
+        channel_id=CHANNEL_ID,
+        message_id=message_id,
+        user_id=user_id,
+        member=member,
+        emoji=STAR,
+    )
+
+
+def _service(temp_data_dir, threshold, bot=None, storage="json"):
+    data = DataManager(temp_data_dir, storage=storage)
+    data.set_guild_config(GUILD_ID, forum_channel_id=FORUM_ID, star_threshold=threshold)
+    service = StarboardService(bot or FakeBot(), data)
+    posted = []
+
+    async def post(message, forum_channel_id, star_count):
+        posted.append((message.id, star_count))
+
+    service._post_to_starboard = post
+    return service, posted
+
+
+class TestReactionAdd:
+    """Stars are counted from payloads, seeded from one fetch per message."""
+
+    def test_seeds_count_from_first_fetch(self, temp_data_dir):
+        service, posted = _service(temp_data_dir, threshold=3)
+        channel = service.bot.channel
+        # Two stars were given before the bot started; this is the third
+        channel.stars[5] = 3
+
+        async def run():
+            await service.handle_raw_reaction_add(_payload(5))
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+        assert posted == [(5, 3)]
+        # The first-sight fetch is reused for the threshold check
+        assert channel.fetches == 1
+
+    def test_counts_without_fetching_after_first_sight(self, temp_data_dir):
+        service, posted = _service(temp_data_dir, threshold=5)
+        channel = service.bot.channel
+        channel.stars[5] = 1
+
+        async def run():
+            await service.handle_raw_reaction_add(_payload(5))
+            for _ in range(2):
+                channel.stars[5] += 1
+                await service.handle_raw_reaction_add(_payload(5))
+
+        asyncio.run(run())
+        assert service.star_tracker.get(5) == 3
+        assert channel.fetches == 1
+        assert posted == []
+
+    def test_ignores_bots(self, temp_data_dir):
+        robot = SimpleNamespace(id=200, bot=True)
+        service, _ = _service(temp_data_dir, threshold=5, bot=FakeBot([robot]))
+        service.star_tracker.set(5, 2)
+
+        async def run():
+            await service.handle_raw_reaction_add(_payload(5, member=robot))
+            await service.handle_raw_reaction_remove(_payload(5, user_id=robot.id))
+
+        asyncio.run(run())
+        assert service.star_tracker.get(5) == 2
+
+    def test_remove_counts_humans(self, temp_data_dir):
+        service, _ = _service(temp_data_dir, threshold=5)
+        service.star_tracker.set(5, 2)
+        asyncio.run(service.handle_raw_reaction_remove(_payload(5)))
+        assert service.star_tracker.get(5) == 1
+
+
+class FakeStarter:
+    """A starboard post's starter message."""
+
+    def __init__(self, embed):
+        self.embed = embed
+        self.edits = 0
+
+    async def fetch(self):
+        return SimpleNamespace(embeds=[self.embed])
+
+    async def edit(self, embed):
+        self.embed = embed
+        self.edits += 1
+
+
+class FakeThread:
+    def __init__(self, starter):
+        self.starter = starter
+        self.archived = False
+        self.deleted = False
+
+    def get_partial_message(self, message_id):
+        return self.starter
+
+    async def edit(self, archived):
+        self.archived = archived
+
+    async def delete(self):
+        self.deleted = True
+
+
+def _posted_service(temp_data_dir, star_count, below_threshold="keep", storage="json"):
+    """A service with message 5 posted at ``star_count`` stars (threshold 3)."""
+    service, _ = _service(temp_data_dir, threshold=3, storage=storage)
+    service.data.set_guild_config(GUILD_ID, below_threshold=below_threshold)
+    service.data.add_starboard_entry(
+        5, thread_id=30, channel_id=CHANNEL_ID, guild_id=GUILD_ID, tags=[],
+        star_count=star_count,
+    )
+    embed = discord.Embed().add_field(name="⭐ Stars", value=str(star_count))
+    thread = FakeThread(FakeStarter(embed))
+
+    async def get_thread(thread_id):
+        return thread if thread_id == 30 else None
+
+    service._get_thread = get_thread
+    return service, thread
+
+
+def _stars(embed):
+    return next(field.value for field in embed.fields if field.name == "⭐ Stars")
+
+
+class TestLivePostCount:
+    """Posted messages' star changes are reflected on the post."""
+
+    def test_edits_post_and_stores_count(self, temp_data_dir):
+        service, thread = _posted_service(temp_data_dir, star_count=3)
+        service.star_tracker.set(5, 4)
+        asyncio.run(service._update_post(5))
+        assert _stars(thread.starter.embed) == "4"
+        assert service.data.get_starboard_entry(5)["star_count"] == 4
+
+    def test_unchanged_count_skips_edit(self, temp_data_dir):
+        service, thread = _posted_service(temp_data_dir, star_count=3)
+        service.star_tracker.set(5, 3)
+        asyncio.run(service._update_post(5))
+        assert thread.starter.edits == 0
+
+    def test_unseen_post_starts_from_stored_count(self, temp_data_dir):
+        service, thread = _posted_service(temp_data_dir, star_count=3)
+        service.bot.channel.stars[5] = 4
+
+        async def run():
+            await service.handle_raw_reaction_add(_payload(5))
+            await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+        # Checked against the message once, at the edit
+        assert service.bot.channel.fetches == 1
+        assert _stars(thread.starter.embed) == "4"
+
+    def test_below_threshold_remove(self, temp_data_dir):
+        service, thread = _posted_service(temp_data_dir, star_count=3, below_threshold="remove")
+        service.star_tracker.set(5, 2)
+        asyncio.run(service._update_post(5))
+        assert thread.deleted
+        assert service.data.get_starboard_entry(5) is None
+
+    def test_below_threshold_archive(self, temp_data_dir):
+        service, thread = _posted_service(temp_data_dir, star_count=3, below_threshold="archive")
+        service.star_tracker.set(5, 2)
+        asyncio.run(service._update_post(5))
+        assert thread.archived
+        assert _stars(thread.starter.embed) == "2"
+
+    def test_below_threshold_keep(self, temp_data_dir):
+        service, thread = _posted_service(temp_data_dir, star_count=3)
+        service.star_tracker.set(5, 2)
+        asyncio.run(service._update_post(5))
+        assert not thread.archived and not thread.deleted
+        assert _stars(thread.starter.embed) == "2"
+
+    def test_stop_drops_pending_edits_before_close(self, temp_data_dir):
+        service, thread = _posted_service(temp_data_dir, star_count=3, storage="log")
+        service.star_tracker.set(5, 3)
+        service._edits.interval = 0.02
+
+        async def run():
+            # The first edit runs at once; the second waits out the interval
+            service._count_posted_star(5, +1)
+            await asyncio.sleep(0.01)
+            service._count_posted_star(5, +1)
+            await service.stop()
+            service.data.close()
+            # Reactions arriving during shutdown schedule nothing
+            service._count_posted_star(5, +1)
+            await asyncio.sleep(0.05)
+
+        asyncio.run(run())
+        assert thread.starter.edits == 1
+        reopened = DataManager(temp_data_dir, storage="log")
+        assert reopened.get_starboard_entry(5)["star_count"] == 4
@@ -2,27 +2,59 @@
 
 import json
 import logging
+import shutil
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# What happens to a starboard post whose message drops below the threshold
+BELOW_THRESHOLD_ACTIONS = ("keep", "archive", "remove")
+# How starboard entries are persisted: "json" rewrites starboard.json on
+# every change, "log" appends changes to starboard.jsonl
+STORAGE_MODES = ("json", "log")
+# Log records after which the log is folded into starboard.json
+COMPACT_EVERY = 1000
+
 
 class DataManager:
     """Manages data storage for the Starboard bot."""
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", storage: str = "json"):
+        """
+        Args:
+            data_dir: Directory holding the data files.
+            storage: "json" to rewrite starboard.json on every entry change,
+                or "log" to append each change to starboard.jsonl and fold
+                the log into starboard.json in the background every
+                COMPACT_EVERY records.
+        """
+        if storage not in STORAGE_MODES:
+            raise ValueError(f"Unknown storage mode: {storage}")
+        self.storage = storage
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
 
         # File paths
         self.starboard_file = self.data_dir / "starboard.json"
         self.config_file = self.data_dir / "config.json"
+        # Log mode: changes since the last snapshot, and the log being compacted
+        self.starboard_log_file = self.data_dir / "starboard.jsonl"
+        self.compacting_log_file = self.data_dir / "starboard.jsonl.compacting"
 
         # In-memory cache for performance (avoid repeated file reads)
         self._starboard_cache: Optional[Dict[str, Dict]] = None
         self._config_cache: Optional[Dict[str, Any]] = None
         self._cache_dirty = {"starboard": False, "config": False}
+        # Serializes cache changes and writes: the service makes them from
+        # worker threads (asyncio.to_thread), which may run concurrently
+        self._lock = threading.RLock()
+
+        # Log mode state
+        self._log = None
+        self._log_records = 0
+        self._compactor: Optional[threading.Thread] = None
 
     def _load_json(self, file_path: Path, default: Any = None) -> Any:
         """Load JSON file (synchronous but fast for small files)."""
@@ -60,11 +92,203 @@ class DataManager:
         if self._starboard_cache is not None and not self._cache_dirty["starboard"]:
             return self._starboard_cache
 
-        # Load from file and cache
-        entries = self._load_json(self.starboard_file, {})
-        self._starboard_cache = entries
-        self._cache_dirty["starboard"] = False
-        return entries
+        with self._lock:
+            if self._starboard_cache is not None and not self._cache_dirty["starboard"]:
+                return self._starboard_cache
+
+            # Load from file and cache
+            entries = self._load_json(self.starboard_file, {})
+            if self.storage == "log":
+                self._open_log(entries)
+            elif self.starboard_log_file.exists() or self.compacting_log_file.exists():
+                # Left by a log-mode run that didn't shut down cleanly
+                replayed = self._fold_logs(entries)
+                logger.info(f"Folded {replayed} leftover starboard log record(s) into {self.starboard_file.name}")
+            self._starboard_cache = entries
+            self._cache_dirty["starboard"] = False
+            return entries
+
+    # Starboard entry log (storage="log")
+    @staticmethod
+    def _apply_record(entries: Dict[str, Dict], record: Dict[str, Any]):
+        """Apply one log record. Records are idempotent, so replaying a
+        log over a snapshot that already contains it is harmless."""
+        op = record["op"]
+        key = str(record["message_id"])
+        if op == "put":
+            entries[key] = record["entry"]
+        elif op == "update":
+            if key in entries:
+                entries[key].update(record["fields"])
+        elif op == "remove":
+            entries.pop(key, None)
+        else:
+            raise ValueError(f"Unknown starboard log op: {op}")
+
+    def _replay_log(self, path: Path, entries: Dict[str, Dict]) -> int:
+        """Apply a log file's records to ``entries``; returns how many applied."""
+        if not path.exists():
+            return 0
+        applied = 0
+        with open(path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    self._apply_record(entries, json.loads(line))
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    # A torn last line from a crash mid-write, most likely
+                    logger.warning(f"Skipping bad record {path.name}:{line_no}: {e}")
+                    continue
+                applied += 1
+        return applied
+
+    def _open_log(self, entries: Dict[str, Dict]):
+        """Load the log tail on top of the snapshot and open the log for appending."""
+        if self.compacting_log_file.exists():
+            # The last compaction didn't finish: finish it now
+            replayed = self._fold_logs(entries)
+            logger.info(f"Finished interrupted starboard log compaction ({replayed} records)")
+            self._log_records = 0
+        else:
+            self._log_records = self._replay_log(self.starboard_log_file, entries)
+            if self._log_records:
+                logger.info(
+                    f"Loaded {len(entries)} starboard entries "
+                    f"({self._log_records} from {self.starboard_log_file.name})"
+                )
+        self._log = open(self.starboard_log_file, "a", encoding="utf-8")
+        if self._log.tell() and not self._ends_with_newline(self.starboard_log_file):
+            # Don't let the next record run into a torn one
+            self._log.write("\n")
+            self._log.flush()
+
+    def _fold_logs(self, entries: Dict[str, Dict]) -> int:
+        """Apply both log files to ``entries``, save them as the snapshot and
+        delete the logs; returns how many records were applied."""
+        replayed = self._replay_log(self.compacting_log_file, entries)
+        replayed += self._replay_log(self.starboard_log_file, entries)
+        self._save_json(self.starboard_file, entries)
+        self.starboard_log_file.unlink(missing_ok=True)
+        self.compacting_log_file.unlink(missing_ok=True)
+        return replayed
+
+    @staticmethod
+    def _ends_with_newline(path: Path) -> bool:
+        with open(path, "rb") as f:
+            f.seek(-1, 2)
+            return f.read(1) == b"\n"
+
+    def _append_record(self, record: Dict[str, Any]):
+        """Append one record to the log, compacting when it gets long.
+
+        Call with the lock held.
+        """
+        self._log.write(json.dumps(record, separators=(',', ':'), ensure_ascii=False) + "\n")
+        self._log.flush()
+        self._log_records += 1
+        if self._log_records >= COMPACT_EVERY:
+            try:
+                self.compact_starboard_log()
+            except OSError as e:
+                # The record is safely in the log; compaction is retried
+                # after another COMPACT_EVERY records
+                logger.error(f"Starboard log rotation failed: {e}", exc_info=True)
+
+    def _save_starboard(self, record: Dict[str, Any]):
+        """Persist one entry change (``record``) in the configured storage mode."""
+        if self.storage == "log":
+            self._append_record(record)
+        else:
+            self._save_json(self.starboard_file, self._starboard_cache)
+
+    def compact_starboard_log(self, wait: bool = False):
+        """Fold the entry log into starboard.json in a background thread.
+
+        The log is rotated aside and a copy of the entries is written as the
+        new snapshot, so new records keep going to a fresh log meanwhile.
+        Does nothing if a compaction is already running. If an earlier
+        compaction failed, the log is added to the log it left behind
+        instead of replacing it.
+
+        Args:
+            wait: Block until the compaction has finished (e.g. on shutdown).
+        """
+        with self._lock:
+            if self.storage != "log" or self._log is None:
+                return
+            if self._compactor is None or not self._compactor.is_alive():
+                self._log.close()
+                try:
+                    if self.compacting_log_file.exists():
+                        self._merge_into_compacting()
+                    else:
+                        self.starboard_log_file.replace(self.compacting_log_file)
+                finally:
+                    self._log = open(self.starboard_log_file, "a", encoding="utf-8")
+                    self._log_records = 0
+
+                # Entries are updated in place, so snapshot copies of them
+                snapshot = {key: dict(entry) for key, entry in self._starboard_cache.items()}
+                self._compactor = threading.Thread(
+                    target=self._write_snapshot, args=(snapshot,),
+                    name="starboard-compactor", daemon=True,
+                )
+                self._compactor.start()
+            compactor = self._compactor
+        if wait:
+            compactor.join()
+
+    def _merge_into_compacting(self):
+        """Append the log to the rotated log of a failed compaction.
+
+        Records are idempotent, so a crash between the copy and the unlink
+        (leaving records in both files) loses nothing.
+        """
+        if not self.starboard_log_file.exists():
+            return
+        needs_newline = (
+            self.compacting_log_file.stat().st_size
+            and not self._ends_with_newline(self.compacting_log_file)
+        )
+        with open(self.starboard_log_file, "rb") as src, open(self.compacting_log_file, "ab") as dst:
+            if needs_newline:
+                dst.write(b"\n")
+            shutil.copyfileobj(src, dst)
+        self.starboard_log_file.unlink()
+
+    def _write_snapshot(self, snapshot: Dict[str, Dict]):
+        try:
+            self._save_json(self.starboard_file, snapshot)
+            self.compacting_log_file.unlink()
+            logger.info(f"Compacted starboard log ({len(snapshot)} entries)")
+        except OSError as e:
+            # The rotated log stays: it's merged into by the next
+            # compaction, or replayed (and compacted) at startup
+            logger.error(f"Starboard log compaction failed: {e}", exc_info=True)
+
+    def close(self):
+        """Fold the entry log into starboard.json and close it.
+
+        Leaves only starboard.json behind (unless the compaction fails), so
+        the next run may use either storage mode.
+        """
+        with self._lock:
+            # No compaction can start while we hold the lock
+            if self._compactor is not None:
+                self._compactor.join()
+            if self._log is None:
+                return
+            if self._log_records or self.compacting_log_file.exists():
+                try:
+                    self.compact_starboard_log(wait=True)
+                except OSError as e:
+                    # The log stays and is replayed at the next startup
+                    logger.error(f"Starboard log rotation failed: {e}", exc_info=True)
+            self._log.close()
+            self._log = None
+            if self.starboard_log_file.exists() and not self.starboard_log_file.stat().st_size:
+                self.starboard_log_file.unlink()
 
     def is_message_starboarded(self, message_id: int) -> bool:
         """Check if message has already been posted to starboard."""
@@ -83,25 +307,58 @@ class DataManager:
         channel_id: int,
         guild_id: int,
         tags: List[str],
+        starter_message_id: Optional[int] = None,
+        star_count: Optional[int] = None,
     ):
         """Add or update a starboard entry with final thread_id (optimized)."""
-        entries = self.get_starboard_entries()
+        with self._lock:
+            entries = self.get_starboard_entries()
 
-        # Update existing entry or create new one
-        entries[str(message_id)] = {
-            "message_id": message_id,
-            "thread_id": thread_id,
-            "channel_id": channel_id,
-            "guild_id": guild_id,
-            "tags": tags,
-            "reserved": False,
-        }
-
-        # Update cache and save (fast)
-        self._starboard_cache = entries
-        self._cache_dirty["starboard"] = True
-        self._save_json(self.starboard_file, entries)
-        self._cache_dirty["starboard"] = False
+            # Update existing entry or create new one
+            entry = entries[str(message_id)] = {
+                "message_id": message_id,
+                "thread_id": thread_id,
+                "channel_id": channel_id,
+                "guild_id": guild_id,
+                "tags": tags,
+                "reserved": False,
+                "starter_message_id": starter_message_id,
+                "star_count": star_count,
+            }
+
+            # Update cache and save (fast)
+            self._starboard_cache = entries
+            self._cache_dirty["starboard"] = True
+            self._save_starboard({"op": "put", "message_id": message_id, "entry": entry})
+            self._cache_dirty["starboard"] = False
+
+    def update_starboard_entry(self, message_id: int, **fields: Any) -> bool:
+        """Update fields of an existing starboard entry.
+
+        Returns:
+            False if the message has no entry.
+        """
+        with self._lock:
+            entries = self.get_starboard_entries()
+            entry = entries.get(str(message_id))
+            if entry is None:
+                return False
+            entry.update(fields)
+            self._save_starboard({"op": "update", "message_id": message_id, "fields": fields})
+            return True
+
+    def remove_starboard_entry(self, message_id: int) -> bool:
+        """Remove a starboard entry (the message may be posted again).
+
+        Returns:
+            False if the message has no entry.
+        """
+        with self._lock:
+            entries = self.get_starboard_entries()
+            if entries.pop(str(message_id), None) is None:
+                return False
+            self._save_starboard({"op": "remove", "message_id": message_id})
+            return True
 
     # Guild configuration
     def get_config(self) -> Dict[str, Any]:
@@ -126,30 +383,38 @@ class DataManager:
         guild_id: int,
         forum_channel_id: Optional[int] = None,
         star_threshold: Optional[int] = None,
+        below_threshold: Optional[str] = None,
     ):
         """Set configuration for a guild."""
         logger.info(
             f"Setting config for guild {guild_id}: "
-            f"forum={forum_channel_id}, threshold={star_threshold}"
+            f"forum={forum_channel_id}, threshold={star_threshold}, "
+            f"below_threshold={below_threshold}"
         )
-        config = self.get_config()
-        guild_key = str(guild_id)
+        if below_threshold is not None and below_threshold not in BELOW_THRESHOLD_ACTIONS:
+            raise ValueError(f"Unknown below-threshold action: {below_threshold}")
+        with self._lock:
+            config = self.get_config()
+            guild_key = str(guild_id)
 
-        if guild_key not in config:
-            config[guild_key] = {}
+            if guild_key not in config:
+                config[guild_key] = {}
 
-        if forum_channel_id is not None:
-            config[guild_key]["forum_channel_id"] = forum_channel_id
+            if forum_channel_id is not None:
+                config[guild_key]["forum_channel_id"] = forum_channel_id
 
-        if star_threshold is not None:
-            config[guild_key]["star_threshold"] = star_threshold
+            if star_threshold is not None:
+                config[guild_key]["star_threshold"] = star_threshold
 
-        # Update cache immediately
-        self._config_cache = config
-        self._cache_dirty["config"] = True
+            if below_threshold is not None:
+                config[guild_key]["below_threshold"] = below_threshold
+
+            # Update cache immediately
+            self._config_cache = config
+            self._cache_dirty["config"] = True
 
-        self._save_json(self.config_file, config)
-        self._cache_dirty["config"] = False  # Cache is now in sync
+            self._save_json(self.config_file, config)
+            self._cache_dirty["config"] = False  # Cache is now in sync
         logger.info(f"Config saved for guild {guild_id}")
 
     def get_forum_channel(self, guild_id: int) -> Optional[int]:
@@ -177,3 +442,15 @@ class DataManager:
         """Set star threshold for a guild."""
         logger.info(f"Setting star threshold for guild {guild_id} to {threshold}")
         self.set_guild_config(guild_id, star_threshold=threshold)
+
+    def get_below_threshold_action(self, guild_id: int) -> str:
+        """Get what to do with posts that drop below the threshold (default: keep)."""
+        guild_config = self.get_guild_config(guild_id)
+        if guild_config:
+            return guild_config.get("below_threshold", "keep")
+        return "keep"
+
+    def set_below_threshold_action(self, guild_id: int, action: str):
+        """Set what to do with posts that drop below the threshold."""
+        logger.info(f"Setting below-threshold action for guild {guild_id} to {action}")
+        self.set_guild_config(guild_id, below_threshold=action)
@@ -83,3 +83,22 @@ def create_starboard_embed(
     embed.set_footer(text=f"Message ID: {message.id}")
 
     return embed
+
+
+def set_star_count(embed: discord.Embed, star_count: int) -> discord.Embed:
+    """
+    Update the star count on an existing starboard embed in place.
+
+    Args:
+        embed: Embed built by create_starboard_embed
+        star_count: New number of star reactions
+
+    Returns:
+        The same embed
+    """
+    for index, field in enumerate(embed.fields):
+        if field.name == "⭐ Stars":
+            embed.set_field_at(index, name="⭐ Stars", value=str(star_count), inline=True)
+            return embed
+    embed.insert_field_at(0, name="⭐ Stars", value=str(star_count), inline=True)
+    return embed